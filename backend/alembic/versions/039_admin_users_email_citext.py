@@ -0,0 +1,45 @@
+"""Store admin user emails as citext with a structural CHECK.
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-10-17
+
+Replaces the POSIX regex CHECK on ``admin_users.email`` with two
+``position()`` calls and switches the column to ``citext`` so email
+comparisons (login, uniqueness per tenant) are case-insensitive without
+``lower()`` wrapping.  Full format validation stays in the API layer
+(``EmailStr``).
+
+Note: the upgrade fails if a tenant already holds two non-deleted users
+whose emails differ only by case; resolve those rows first.
+"""
+
+from alembic import op
+
+revision = "039"
+down_revision = "038"
+branch_labels = None
+depends_on = None
+
+_EMAIL_REGEX_CHECK = "email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'"
+_EMAIL_STRUCTURAL_CHECK = (
+    "position('@' in email) > 1 "
+    "AND position('.' in split_part(email, '@', 2)) > 1"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.drop_constraint("ck_admin_users_email_format", "admin_users", type_="check")
+    op.execute("ALTER TABLE admin_users ALTER COLUMN email TYPE citext")
+    op.create_check_constraint(
+        "ck_admin_users_email_format", "admin_users", _EMAIL_STRUCTURAL_CHECK
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_admin_users_email_format", "admin_users", type_="check")
+    op.execute("ALTER TABLE admin_users ALTER COLUMN email TYPE varchar(255)")
+    op.create_check_constraint(
+        "ck_admin_users_email_format", "admin_users", _EMAIL_REGEX_CHECK
+    )
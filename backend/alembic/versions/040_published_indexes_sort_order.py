@@ -0,0 +1,51 @@
+"""Index published company rows by (tenant_id, sort_order).
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-10-17
+
+The public list queries for services, practice areas, employees and
+advantages filter on ``deleted_at IS NULL AND is_published = true`` and
+order by ``sort_order``.  Both conditions are already the partial index
+predicate, so ``is_published`` as a key column carried no information;
+``sort_order`` replaces it and the rows come back from the index already
+ordered, without a separate sort step.
+
+The indexes are rebuilt with ``CONCURRENTLY`` so the tables stay
+writable during the migration.
+"""
+
+from alembic import op
+
+revision = "040"
+down_revision = "039"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("services", "practice_areas", "employees", "advantages")
+_PREDICATE = "deleted_at IS NULL AND is_published = true"
+
+
+def _rebuild(second_column: str) -> None:
+    with op.get_context().autocommit_block():
+        for table in _TABLES:
+            op.drop_index(
+                f"ix_{table}_published",
+                table_name=table,
+                postgresql_concurrently=True,
+            )
+            op.create_index(
+                f"ix_{table}_published",
+                table,
+                ["tenant_id", second_column],
+                postgresql_where=_PREDICATE,
+                postgresql_concurrently=True,
+            )
+
+
+def upgrade() -> None:
+    _rebuild("sort_order")
+
+
+def downgrade() -> None:
+    _rebuild("is_published")
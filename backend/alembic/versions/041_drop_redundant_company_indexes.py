@@ -0,0 +1,46 @@
+"""Drop indexes whose columns lead a wider index on the same table.
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-17
+
+Each dropped index is a left prefix of another index and adds only
+write/vacuum cost:
+
+* ``ix_contacts_tenant`` (tenant_id) - covered by ``ix_contacts_type``
+  (tenant_id, contact_type)
+* ``ix_service_prices_service_id`` (service_id) - covered by
+  ``ix_service_prices_locale`` (service_id, locale)
+* ``ix_service_tags_service_id`` (service_id) - covered by
+  ``ix_service_tags_locale`` (service_id, locale)
+
+The ``*_tenant`` indexes on services, practice_areas, employees,
+advantages and addresses stay: the only other tenant-leading indexes
+there are partial (published rows only) and do not serve admin lists.
+"""
+
+from alembic import op
+
+revision = "041"
+down_revision = "040"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+_REDUNDANT = (
+    ("ix_contacts_tenant", "contacts", ["tenant_id"]),
+    ("ix_service_prices_service_id", "service_prices", ["service_id"]),
+    ("ix_service_tags_service_id", "service_tags", ["service_id"]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns in _REDUNDANT:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REDUNDANT:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Partial index for a tenant's primary address.
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-10-17
+
+``ix_addresses_primary`` indexes ``tenant_id`` only for live primary
+addresses (``is_primary = true AND deleted_at IS NULL``), so looking up
+the primary address of a tenant touches at most a row or two regardless
+of how many addresses the tenant has.  The public contacts query now
+orders primary addresses first.
+
+Built with ``CONCURRENTLY`` so ``addresses`` stays writable.
+"""
+
+from alembic import op
+
+revision = "042"
+down_revision = "041"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_addresses_primary",
+            "addresses",
+            ["tenant_id"],
+            postgresql_where="is_primary = true AND deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_addresses_primary",
+            table_name="addresses",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,55 @@
+"""Replace ix_contacts_type with a (tenant_id, sort_order) partial index.
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-10-17
+
+Both contact queries (admin list and public contacts) filter on
+``tenant_id`` and ``deleted_at IS NULL`` and order by ``sort_order``;
+nothing filters on ``contact_type``.  ``ix_contacts_tenant_sort`` matches
+that shape, so rows come back already ordered without a sort step, and
+soft-deleted rows are left out of the index.
+
+A covering ``INCLUDE`` index was considered, but the ORM selects every
+column of the row, so an index-only scan is not possible anyway.
+
+Built with ``CONCURRENTLY`` so ``contacts`` stays writable.
+"""
+
+from alembic import op
+
+revision = "043"
+down_revision = "042"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_tenant_sort",
+            "contacts",
+            ["tenant_id", "sort_order"],
+            postgresql_where="deleted_at IS NULL",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_contacts_type",
+            table_name="contacts",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_type",
+            "contacts",
+            ["tenant_id", "contact_type"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_contacts_tenant_sort",
+            table_name="contacts",
+            postgresql_concurrently=True,
+        )
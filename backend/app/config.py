@@ -34,7 +34,21 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_pool_timeout: int = 30
     database_echo: bool = False
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode:
+    # server connections are shared between clients, so asyncpg's
+    # prepared-statement caches must be off; PgBouncer also keeps the
+    # server connections healthy, so the per-checkout pre-ping is skipped.
+    database_pgbouncer: bool = False
+    # Compiled-statement cache entries per engine (SQLAlchemy default: 500).
+    # Statements only differ in bind values per tenant/locale, so one entry
+    # serves every request; sized for all ORM + Core statements in the app.
+    database_query_cache_size: int = 1200
+    # Prepared statements kept per asyncpg connection (SQLAlchemy default:
+    # 100). Evicted statements are re-parsed and re-planned by Postgres on
+    # the next call; ignored when database_pgbouncer is set.
+    database_prepared_statement_cache_size: int = 500
 
     # Redis
     redis_url: RedisDsn = Field(default="redis://localhost:6379/0")
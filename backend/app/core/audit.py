@@ -4,16 +4,127 @@ Provides a centralized service for creating audit log entries across
 all modules (users, tenants, feature flags, roles, auth).
 """
 
+import asyncio
+from contextlib import suppress
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session_factory
 from app.core.logging import get_logger
 from app.modules.audit.models import AuditLog
 
 logger = get_logger(__name__)
 
 
+class AuditLogQueue:
+    """In-memory buffer that writes audit entries in batches.
+
+    High-frequency, fire-and-forget entries (logins, logouts) are queued
+    instead of being inserted in the request's transaction. A background
+    task drains the queue and writes up to ``batch_size`` rows with one
+    bulk INSERT, at least every ``flush_interval`` seconds.
+
+    Entries still in memory are lost if the process is killed; ``stop()``
+    flushes them on a clean shutdown.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
+        self._task: asyncio.Task[None] | None = None
+        self._batch: list[dict[str, Any]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the background writer (called from the app lifespan)."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="audit-log-writer")
+
+    async def stop(self) -> None:
+        """Stop the writer and flush everything still buffered."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        # The writer flushes on cancellation; this covers a task cancelled
+        # before it ever ran.
+        await self._flush_pending()
+
+    def put(self, row: dict[str, Any]) -> bool:
+        """Queue a row for the next batch.
+
+        Returns False when the writer is not running or the queue is full;
+        the caller should then insert the entry itself.
+        """
+        if self._task is None:
+            return False
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning("audit_log_queue_full")
+            return False
+        return True
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._batch.append(await self._queue.get())
+                deadline = loop.time() + self._flush_interval
+                while len(self._batch) < self._batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        self._batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except TimeoutError:
+                        break
+
+                # The batch is only cleared once written, so a cancellation
+                # during the INSERT leaves it for the final flush.
+                await self._write(self._batch)
+                self._batch = []
+        except asyncio.CancelledError:
+            await self._flush_pending()
+            raise
+
+    async def _flush_pending(self) -> None:
+        """Write the current batch plus everything still queued."""
+        rows, self._batch = self._batch, []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        if rows:
+            await self._write(rows)
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        try:
+            async with async_session_factory() as session:
+                await session.execute(insert(AuditLog), rows)
+                await session.commit()
+        except Exception:
+            logger.exception("audit_log_flush_failed", count=len(rows))
+
+
+audit_log_queue = AuditLogQueue()
+
+
 class AuditService:
     """Service for creating audit log entries.
 
@@ -38,7 +149,7 @@ class AuditService:
         resource_type: str,
         resource_id: UUID,
         action: str,
-        changes: dict | None = None,
+        changes: dict[str, Any] | None = None,
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> AuditLog:
@@ -78,3 +189,44 @@ class AuditService:
         )
 
         return entry
+
+    async def log_deferred(
+        self,
+        tenant_id: UUID,
+        user_id: UUID | None,
+        resource_type: str,
+        resource_id: UUID,
+        action: str,
+        changes: dict[str, Any] | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        """Queue an audit log entry for a batched write.
+
+        Keeps the INSERT off the caller's transaction. Falls back to
+        ``log()`` (same session) when the queue is not running or full,
+        so no entry is dropped.
+        """
+        queued = audit_log_queue.put(
+            {
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "action": action,
+                "changes": changes,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+            }
+        )
+        if not queued:
+            await self.log(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                action=action,
+                changes=changes,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
@@ -7,6 +7,7 @@ and token blacklisting.  This module owns domain-specific caches.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from urllib.parse import urlparse
 
@@ -27,12 +28,16 @@ class CacheManager:
     def __init__(self, redis_client: Redis) -> None:
         self.tenant_status = TenantStatusCache(redis_client)
         self.domain_tenant = DomainTenantCache(redis_client)
+        self.file_asset_count = FileAssetCountCache(redis_client)
+        self.public_list = PublicListCache(redis_client)
         self.client = CacheClient(redis_client)
 
     async def invalidate_tenant(self, tenant_id: str) -> None:
         """Convenience: invalidate all caches related to a single tenant."""
         await self.tenant_status.invalidate(tenant_id)
         await self.domain_tenant.invalidate_tenant(tenant_id)
+        await self.file_asset_count.invalidate_tenant(tenant_id)
+        await self.public_list.invalidate_tenant(tenant_id)
 
 
 class TenantStatusCache:
@@ -111,6 +116,99 @@ class DomainTenantCache:
                 await self.redis.delete(key)
 
 
+class FileAssetCountCache:
+    """Cache for ``file_assets`` listing totals.
+
+    The admin file browser only needs the total for pagination, so an
+    exact count that is at most ``TTL`` seconds stale is good enough and
+    saves a ``count(*)`` over the tenant's assets on every page render.
+    Keys are scoped by tenant and filter tuple; writes drop every key of
+    the tenant.
+    """
+
+    PREFIX = "file_asset_count:"
+    TTL = 30
+
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+
+    def _key(self, tenant_id: str, folder: str | None, mime_type_prefix: str | None) -> str:
+        return f"{self.PREFIX}{tenant_id}:{folder or ''}:{mime_type_prefix or ''}"
+
+    async def get(
+        self, tenant_id: str, folder: str | None, mime_type_prefix: str | None
+    ) -> int | None:
+        """Return cached total for the filter tuple, or ``None`` on miss."""
+        value = await self.redis.get(self._key(tenant_id, folder, mime_type_prefix))
+        if value is None:
+            return None
+        return int(value)
+
+    async def set(
+        self,
+        tenant_id: str,
+        folder: str | None,
+        mime_type_prefix: str | None,
+        total: int,
+    ) -> None:
+        """Cache *total* for the filter tuple."""
+        key = self._key(tenant_id, folder, mime_type_prefix)
+        await self.redis.setex(key, self.TTL, str(total))
+
+    async def invalidate_tenant(self, tenant_id: str) -> None:
+        """Remove all cached totals for *tenant_id*."""
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.PREFIX}{tenant_id}:*")]
+        if keys:
+            await self.redis.delete(*keys)
+
+
+class PublicListCache:
+    """Cache for serialized public list responses.
+
+    Stores the final JSON of read-mostly public endpoints (services,
+    employees, practice areas, advantages, contacts) per tenant, section
+    and locale, so a hit skips the queries, ORM hydration and Pydantic
+    serialization. The owning service drops the section of the tenant
+    on every write.
+    """
+
+    PREFIX = "public_list:"
+    TTL = 300
+
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+
+    def _key(self, tenant_id: str, section: str, locale: str | None) -> str:
+        return f"{self.PREFIX}{tenant_id}:{section}:{locale or ''}"
+
+    async def get(self, tenant_id: str, section: str, locale: str | None = None) -> str | None:
+        """Return the cached JSON for the section, or ``None`` on miss."""
+        return await self.redis.get(self._key(tenant_id, section, locale))
+
+    async def set(
+        self, tenant_id: str, section: str, locale: str | None, payload: str
+    ) -> None:
+        """Cache the serialized *payload* for the section."""
+        await self.redis.setex(self._key(tenant_id, section, locale), self.TTL, payload)
+
+    async def invalidate(self, tenant_id: str, section: str) -> None:
+        """Remove the section of *tenant_id* for every locale."""
+        keys = [
+            key
+            async for key in self.redis.scan_iter(
+                match=f"{self.PREFIX}{tenant_id}:{section}:*"
+            )
+        ]
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def invalidate_tenant(self, tenant_id: str) -> None:
+        """Remove every cached public list of *tenant_id*."""
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.PREFIX}{tenant_id}:*")]
+        if keys:
+            await self.redis.delete(*keys)
+
+
 class CORSOriginsCache:
     """In-memory cache of allowed CORS origins backed by the database.
 
@@ -118,9 +216,15 @@ class CORSOriginsCache:
     origins derived from ``tenant_domains`` and ``tenant_settings.site_url``.
     The cache auto-refreshes every ``TTL`` seconds or can be explicitly
     invalidated when domains / settings change.
+
+    Each worker process holds its own copy, so writes call
+    ``invalidate_all()``, which also publishes on ``CHANNEL``; every worker
+    runs ``listen()`` and drops its copy when a message arrives.
     """
 
     TTL = 300
+    CHANNEL = "cache_invalidate:cors_origins"
+    RECONNECT_DELAY = 5.0
 
     def __init__(self) -> None:
         self._origins: set[str] = set()
@@ -160,6 +264,44 @@ class CORSOriginsCache:
         """Force a reload on the next ``get_allowed_origins`` call."""
         self._loaded_at = 0.0
 
+    async def invalidate_all(self) -> None:
+        """Invalidate this worker's copy and notify the other workers."""
+        self.invalidate()
+
+        from app.core.redis import get_redis_client
+
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            await client.publish(self.CHANNEL, "1")
+        except Exception:
+            logger.warning("cors_origins_invalidation_publish_failed", exc_info=True)
+
+    async def listen(self, redis_client: Redis) -> None:
+        """Invalidate on every message published to ``CHANNEL``.
+
+        Runs until cancelled (started as a task from the app lifespan);
+        re-subscribes after ``RECONNECT_DELAY`` if the connection drops.
+        Invalidates on (re)subscribe as well, since messages may have been
+        missed while disconnected.
+        """
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                self.invalidate()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("cors_origins_listener_disconnected", exc_info=True)
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
     def is_origin_allowed(self, origin: str) -> bool:
         """Fast synchronous check against the already-loaded set."""
         return origin.rstrip("/") in self._origins
@@ -1,9 +1,11 @@
 """Database configuration and session management."""
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable
+from contextlib import AsyncExitStack, asynccontextmanager
 from functools import wraps
 from typing import Any, Callable, ParamSpec, TypeVar
+from uuid import uuid4
 
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
@@ -15,6 +17,23 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.core.base_model import Base
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# asyncpg prepares every statement on its connection; behind PgBouncer
+# (transaction mode) the next transaction may land on another server
+# connection, so caching is disabled and names are made unique. Otherwise
+# the per-connection cache is sized so hot statements stay prepared.
+_connect_args: dict[str, Any] = {
+    "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+}
+if settings.database_pgbouncer:
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
 
 # Create async engine
 engine = create_async_engine(
@@ -22,9 +41,11 @@ engine = create_async_engine(
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
     echo=settings.database_echo,
-    pool_pre_ping=True,
+    query_cache_size=settings.database_query_cache_size,
+    pool_pre_ping=not settings.database_pgbouncer,
     pool_recycle=3600,
-    pool_timeout=30,
+    pool_timeout=settings.database_pool_timeout,
+    connect_args=_connect_args,
 )
 
 # Create async session factory
@@ -71,11 +92,45 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Key in ``AsyncSession.info`` holding callbacks registered via ``after_commit``
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(
+    db: AsyncSession, func: Callable[..., Awaitable[Any]], *args: Any
+) -> None:
+    """Run ``await func(*args)`` once the enclosing ``@transactional`` commits.
+
+    Meant for cache invalidation: a key dropped before COMMIT can be
+    re-cached from the old rows by a concurrent reader. Duplicate
+    registrations run once; all are discarded if the transaction rolls back.
+
+    Usage:
+        after_commit(self.db, self._invalidate_cache, tenant_id)
+    """
+    pending: list[tuple[Callable[..., Awaitable[Any]], tuple[Any, ...]]]
+    pending = db.info.setdefault(_AFTER_COMMIT_KEY, [])
+    if (func, args) not in pending:
+        pending.append((func, args))
+
+
+async def _run_after_commit(db: AsyncSession) -> None:
+    if _AFTER_COMMIT_KEY not in db.info:
+        return
+    for func, args in db.info.pop(_AFTER_COMMIT_KEY):
+        try:
+            await func(*args)
+        except Exception:
+            # The commit already succeeded; a failed callback must not turn
+            # the request into an error.
+            logger.exception("after_commit_callback_failed", callback=repr(func))
+
 
 def transactional(func: Callable[P, R]) -> Callable[P, R]:
     """Decorator for automatic transaction management.
 
-    Commits on success, rolls back on exception.
+    Commits on success, rolls back on exception. Callbacks registered with
+    ``after_commit`` run after the commit.
     Works with both standalone functions (with db arg) and service methods (with self.db).
 
     Usage:
@@ -125,11 +180,15 @@ def transactional(func: Callable[P, R]) -> Callable[P, R]:
         try:
             result = await func(*args, **kwargs)
             await db.commit()
-            return result
         except Exception:
             await db.rollback()
+            if _AFTER_COMMIT_KEY in db.info:
+                del db.info[_AFTER_COMMIT_KEY]
             raise
 
+        await _run_after_commit(db)
+        return result
+
     return wrapper  # type: ignore
 
 
@@ -143,6 +202,26 @@ async def check_db_connection() -> bool:
         return False
 
 
+async def warm_up_pool() -> int:
+    """Open ``database_pool_size`` connections and return them to the pool.
+
+    Called at startup so the first burst of requests checks out ready
+    connections instead of paying connect/auth cost. Every connection is
+    held until all have connected, so none is reused by a later checkout
+    and each one is a distinct pool connection. Returns the number of
+    connections opened.
+    """
+    async with AsyncExitStack() as stack:
+        results = await asyncio.gather(
+            *(
+                stack.enter_async_context(engine.connect())
+                for _ in range(settings.database_pool_size)
+            ),
+            return_exceptions=True,
+        )
+        return sum(1 for result in results if not isinstance(result, BaseException))
+
+
 async def init_db() -> None:
     """Initialize database (create tables).
 
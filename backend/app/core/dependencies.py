@@ -40,6 +40,29 @@ class PaginationParams:
 Pagination = Annotated[PaginationParams, Depends()]
 
 
+class OptionalPaginationParams:
+    """Pagination parameters for lists that are returned whole by default.
+
+    Used by small, ``sort_order``-ranked admin lists that the UI reorders
+    as a whole; paging only applies when the client sends ``page`` or
+    ``page_size``.
+    """
+
+    def __init__(
+        self,
+        page: int | None = Query(default=None, ge=1, description="Page number"),
+        page_size: int | None = Query(
+            default=None, ge=1, le=100, alias="page_size", description="Items per page"
+        ),
+    ) -> None:
+        self.is_set = page is not None or page_size is not None
+        self.page = page or 1
+        self.page_size = page_size or 20
+
+
+OptionalPagination = Annotated[OptionalPaginationParams, Depends()]
+
+
 class SortParams:
     """Common sorting parameters."""
 
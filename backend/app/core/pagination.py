@@ -75,6 +75,7 @@ async def paginate_query(
     options: list[Any] | None = None,
     order_by: list[Any] | None = None,
     unique: bool = False,
+    window_count: bool = False,
 ) -> tuple[list[Any], int]:
     """Execute a paginated query.
     
@@ -88,6 +89,10 @@ async def paginate_query(
         options: SQLAlchemy loading options (selectinload, joinedload, etc.)
         order_by: List of order_by clauses
         unique: If True, use scalars().unique() for deduplication (use with joins)
+        window_count: If True, fetch the total with COUNT(*) OVER () on the
+            page query instead of a separate count query. Not valid with
+            ``unique`` (joined rows would be counted). A separate count is
+            only issued when the requested page is past the end.
         
     Returns:
         Tuple of (items_list, total_count)
@@ -113,13 +118,20 @@ async def paginate_query(
     page_size = min(page_size, 100)
     page = max(page, 1)
     
+    if window_count and unique:
+        raise ValueError("window_count cannot be combined with unique")
+
     # Count total
-    count_stmt = select(func.count()).select_from(base_query.subquery())
-    total = (await db.execute(count_stmt)).scalar() or 0
+    if not window_count:
+        count_stmt = select(func.count()).select_from(base_query.subquery())
+        total = (await db.execute(count_stmt)).scalar() or 0
     
     # Build final query
     stmt = base_query
     
+    if window_count:
+        stmt = stmt.add_columns(func.count().over().label("_total"))
+    
     if options:
         stmt = stmt.options(*options)
     
@@ -131,7 +143,18 @@ async def paginate_query(
     # Execute
     result = await db.execute(stmt)
     
-    if unique:
+    if window_count:
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0]._total
+        elif page > 1:
+            # Past the last page: no row carries the total
+            count_stmt = select(func.count()).select_from(base_query.subquery())
+            total = (await db.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
+    elif unique:
         items = list(result.scalars().unique().all())
     else:
         items = list(result.scalars().all())
@@ -148,6 +171,7 @@ async def paginate(
     options: list[Any] | None = None,
     order_by: list[Any] | None = None,
     unique: bool = False,
+    window_count: bool = False,
 ) -> PaginatedResult:
     """Execute paginated query and return PaginatedResult.
     
@@ -161,6 +185,7 @@ async def paginate(
         options: SQLAlchemy loading options
         order_by: List of order_by clauses
         unique: If True, use scalars().unique() for deduplication
+        window_count: If True, count with a window function (see paginate_query)
         
     Returns:
         PaginatedResult with items, total, page info
@@ -173,6 +198,7 @@ async def paginate(
         options=options,
         order_by=order_by,
         unique=unique,
+        window_count=window_count,
     )
     
     return PaginatedResult(
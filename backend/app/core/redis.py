@@ -15,6 +15,8 @@ from app.core.cache import (  # noqa: E402, F401
     CacheClient,
     CORSOriginsCache,
     DomainTenantCache,
+    FileAssetCountCache,
+    PublicListCache,
     TenantStatusCache,
     get_cors_origins_cache,
 )
@@ -172,6 +174,24 @@ class TokenBlacklist:
         key = f"{self.PREFIX}{jti}"
         await self.redis.delete(key)
 
+    async def check_with_tenant_status(
+        self, jti: str, tenant_id: str
+    ) -> tuple[bool, bool | None]:
+        """Check revocation and read the cached tenant status in one round trip.
+
+        Both keys are known from the access token alone, so the ``EXISTS``
+        and the ``TenantStatusCache`` lookup are sent as a single pipeline.
+
+        Returns:
+            (is_blacklisted, tenant_active) where tenant_active is None on
+            a tenant status cache miss.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(f"{self.PREFIX}{jti}")
+            pipe.get(f"{TenantStatusCache.PREFIX}{tenant_id}")
+            exists, status = await pipe.execute()
+        return exists > 0, None if status is None else status == "1"
+
 
 async def get_token_blacklist() -> TokenBlacklist | None:
     """Get token blacklist instance.
@@ -201,3 +221,23 @@ async def get_domain_tenant_cache() -> DomainTenantCache | None:
     if _redis_client is None:
         return None
     return DomainTenantCache(_redis_client)
+
+
+async def get_file_asset_count_cache() -> FileAssetCountCache | None:
+    """Get file asset count cache instance.
+
+    Returns None if Redis is not initialized.
+    """
+    if _redis_client is None:
+        return None
+    return FileAssetCountCache(_redis_client)
+
+
+async def get_public_list_cache() -> PublicListCache | None:
+    """Get public list response cache instance.
+
+    Returns None if Redis is not initialized.
+    """
+    if _redis_client is None:
+        return None
+    return PublicListCache(_redis_client)
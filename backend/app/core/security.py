@@ -1,5 +1,7 @@
 """Security utilities - JWT, password hashing, RBAC."""
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid4
@@ -11,7 +13,7 @@ import jwt
 from jwt.exceptions import InvalidTokenError as JWTError, ExpiredSignatureError as JWTExpiredError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.config import settings
 from app.core.database import get_db
@@ -70,6 +72,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread.
+
+    bcrypt releases the GIL while hashing, so running it off the event
+    loop lets other requests proceed during the ~100-250 ms of work.
+    """
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread (see ``hash_password_async``)."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
 # ============================================================================
 # JWT Utilities
 # ============================================================================
@@ -134,6 +150,42 @@ def decode_token(token: str) -> dict[str, Any]:
         raise InvalidTokenError()
 
 
+# Recently verified refresh tokens: raw token -> (monotonic expiry, payload).
+# Equal token strings carry an equal, already HMAC-verified payload, so the
+# signature check can be skipped while the entry is fresh. Tokens closer to
+# their own ``exp`` than the TTL are never cached.
+_REFRESH_TOKEN_CACHE_TTL = 15.0
+_REFRESH_TOKEN_CACHE_SIZE = 10_000
+_refresh_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def decode_refresh_token(token: str) -> dict[str, Any]:
+    """Decode a refresh token, reusing a verification done in the last 15 s.
+
+    Same contract as ``decode_token``; the ``type`` claim is still checked
+    by the caller.
+    """
+    now = time.monotonic()
+    cached = _refresh_token_cache.get(token)
+    if cached is not None:
+        if cached[0] > now:
+            return cached[1]
+        del _refresh_token_cache[token]
+
+    payload = decode_token(token)
+    exp = payload.get("exp")
+    if (
+        payload.get("type") == "refresh"
+        and exp is not None
+        and exp - time.time() > _REFRESH_TOKEN_CACHE_TTL
+    ):
+        if len(_refresh_token_cache) >= _REFRESH_TOKEN_CACHE_SIZE:
+            # Dicts keep insertion order: drop the oldest entry.
+            del _refresh_token_cache[next(iter(_refresh_token_cache))]
+        _refresh_token_cache[token] = (now + _REFRESH_TOKEN_CACHE_TTL, payload)
+    return payload
+
+
 def create_password_reset_token(user_id: str, tenant_id: str, email: str) -> str:
     """Create a short-lived JWT token for password reset (1 hour)."""
     data = {
@@ -197,11 +249,19 @@ class TokenPayload:
         self.tenant_id: UUID = UUID(payload["tenant_id"])
         self.email: str = payload["email"]
         self.role: str | None = payload.get("role")
+        role_id = payload.get("role_id")
+        self.role_id: UUID | None = UUID(role_id) if role_id else None
+        # Only tokens issued before permissions were resolved server-side
+        # from role_id carry this claim.
         self.permissions: list[str] = payload.get("permissions", [])
         self.is_superuser: bool = payload.get("is_superuser", False)
         self.token_type: str = payload.get("type", "access")
         self.exp: datetime = datetime.fromtimestamp(payload["exp"], tz=UTC)
         self.jti: str | None = payload.get("jti")  # Token ID for blacklist
+        # Tenant status read from Redis together with the blacklist check
+        # (see get_current_token); None means not cached.
+        self.cached_tenant_active: bool | None = None
+        self.tenant_status_prefetched: bool = False
     
     @property
     def expires_in_seconds(self) -> int:
@@ -231,23 +291,41 @@ async def get_current_token(
     if payload.get("type") != "access":
         raise InvalidTokenError("Invalid token type")
     
-    # Check if token is blacklisted (revoked on logout)
+    token = TokenPayload(payload)
+
+    # Check if token is blacklisted (revoked on logout). The tenant status
+    # cache entry is fetched in the same pipeline so get_current_user does
+    # not need a second Redis round trip.
     jti = payload.get("jti")
     if jti:
         from app.core.redis import get_token_blacklist
         blacklist = await get_token_blacklist()
-        if blacklist and await blacklist.is_blacklisted(jti):
-            logger.warning("blacklisted_token_used", jti=jti[:8])
-            raise InvalidTokenError("Token has been revoked")
-
-    return TokenPayload(payload)
-
-
-async def _check_tenant_active(tenant_id: UUID, db: AsyncSession) -> None:
+        if blacklist:
+            revoked, tenant_active = await blacklist.check_with_tenant_status(
+                jti, str(token.tenant_id)
+            )
+            if revoked:
+                logger.warning("blacklisted_token_used", jti=jti[:8])
+                raise InvalidTokenError("Token has been revoked")
+            token.cached_tenant_active = tenant_active
+            token.tenant_status_prefetched = True
+
+    return token
+
+
+async def _check_tenant_active(
+    tenant_id: UUID,
+    db: AsyncSession,
+    *,
+    cached_status: bool | None = None,
+    cache_checked: bool = False,
+) -> None:
     """Check if tenant is active using Redis cache with DB fallback.
     
     Raises TenantInactiveError if tenant is suspended.
     Uses Redis cache (30s TTL) to avoid DB hit on every request.
+    When *cache_checked* is set, *cached_status* is the value already read
+    from the cache and the Redis lookup is skipped.
     """
     from app.core.redis import get_tenant_status_cache
     from app.modules.tenants.models import Tenant
@@ -256,12 +334,12 @@ async def _check_tenant_active(tenant_id: UUID, db: AsyncSession) -> None:
     
     # Try Redis cache first
     cache = await get_tenant_status_cache()
-    if cache:
+    if cache and not cache_checked:
         cached_status = await cache.is_tenant_active(tenant_id_str)
-        if cached_status is not None:
-            if not cached_status:
-                raise TenantInactiveError()
-            return
+    if cached_status is not None:
+        if not cached_status:
+            raise TenantInactiveError()
+        return
     
     # Cache miss -- query DB
     stmt = select(Tenant.is_active).where(
@@ -287,15 +365,24 @@ async def get_current_user(
 
     Loads user from database and validates they're active.
     Also checks that tenant is active (with superuser bypass).
+
+    The role's permissions are eager-loaded up front so permission checks
+    and ``/me`` never lazy-load; ``Role.users`` is left unloaded since no
+    request path needs it.
     """
-    from app.modules.auth.models import AdminUser
+    from app.modules.auth.models import AdminUser, Role
 
     stmt = (
         select(AdminUser)
         .where(AdminUser.id == token.user_id)
         .where(AdminUser.deleted_at.is_(None))
         .where(AdminUser.is_active.is_(True))
-        .options(selectinload(AdminUser.role))
+        .options(
+            selectinload(AdminUser.role).options(
+                selectinload(Role.permissions),
+                lazyload(Role.users),
+            )
+        )
     )
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
@@ -308,7 +395,12 @@ async def get_current_user(
         user.role and user.role.name == "platform_owner"
     )
     if not is_platform_privileged:
-        await _check_tenant_active(token.tenant_id, db)
+        await _check_tenant_active(
+            token.tenant_id,
+            db,
+            cached_status=token.cached_tenant_active,
+            cache_checked=token.tenant_status_prefetched,
+        )
 
     return user
 
@@ -322,10 +414,14 @@ async def get_current_active_user(
     return user
 
 
-def get_current_tenant_id(
+async def get_current_tenant_id(
     token: TokenPayload = Depends(get_current_token),
 ) -> UUID:
-    """Dependency to get current tenant ID from token."""
+    """Dependency to get current tenant ID from token.
+
+    Declared ``async`` (like every other auth dependency) so FastAPI
+    resolves it on the event loop instead of a threadpool hop.
+    """
     return token.tenant_id
 
 
@@ -359,7 +455,7 @@ class PermissionChecker:
 
         # Get user permissions from role
         if user.role:
-            user_permissions = [rp.permission.code for rp in user.role.role_permissions]
+            user_permissions = user.role.permission_codes
 
             # Check for wildcard permission (e.g., 'articles:*')
             resource = self.required_permission.split(":")[0]
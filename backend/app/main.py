@@ -1,21 +1,30 @@
 """FastAPI application entry point."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.core.database import check_db_connection, close_db
+from app.core.audit import audit_log_queue
+from app.core.database import check_db_connection, close_db, warm_up_pool
 from app.core.exceptions import AppException
 from app.core.logging import get_logger, setup_logging
-from app.core.redis import check_redis_connection, close_redis, get_cors_origins_cache, init_redis
+from app.core.redis import (
+    check_redis_connection,
+    close_redis,
+    get_cors_origins_cache,
+    get_redis_client,
+    init_redis,
+)
 from app.middleware.cache import CacheHeadersMiddleware
 from app.middleware.cors import DynamicCORSMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_logging import RequestLoggingMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.modules.media.service import close_s3_client, init_s3_client
 
 # Setup logging on module load
 setup_logging()
@@ -50,6 +59,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Check database connection
     if await check_db_connection():
         logger.info("database_connected")
+        opened = await warm_up_pool()
+        logger.info("database_pool_warmed", connections=opened)
     else:
         logger.error("database_connection_failed")
 
@@ -59,6 +70,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("redis_init_failed", error=str(e))
 
+    # Create the shared S3 client (connection pool reused by all uploads)
+    try:
+        init_s3_client()
+    except Exception as e:
+        logger.warning("s3_init_failed", error=str(e))
+
+    # Background writer for batched audit entries (logins, logouts)
+    audit_log_queue.start()
+
     # Warm up dynamic CORS origins cache
     cors_cache = get_cors_origins_cache()
     cors_cache.set_static_origins(settings.cors_origins)
@@ -67,11 +87,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("cors_origins_warmup_failed", error=str(e))
 
+    # Drop this worker's CORS origins when another worker changes them
+    cors_listener: asyncio.Task[None] | None = None
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        cors_listener = asyncio.create_task(
+            cors_cache.listen(redis_client), name="cors-origins-invalidation"
+        )
+
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
+    if cors_listener is not None:
+        cors_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await cors_listener
     await close_redis()
+    close_s3_client()
+    await audit_log_queue.stop()
     await close_db()
     logger.info("application_stopped")
 
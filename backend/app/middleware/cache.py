@@ -19,6 +19,7 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
     - GET /api/v1/public/* → Cache-Control: public, max-age=300 (5 min)
     - GET /api/v1/admin/* → Cache-Control: private, no-cache
     - Other methods → No caching
+    - Cache-Control / ETag already set by the endpoint are kept as-is
     
     ETag support:
     - Generates ETag from response body hash
@@ -54,6 +55,10 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
             response.headers["Cache-Control"] = "no-store"
             return response
         
+        # Endpoints that manage their own caching (semantic ETags) win
+        if "cache-control" in response.headers:
+            return response
+
         # Determine cache policy based on path
         cache_policy = self._get_cache_policy(path)
         response.headers["Cache-Control"] = cache_policy["cache_control"]
@@ -141,7 +146,35 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
     
     def _generate_etag(self, body: bytes) -> str:
         """Generate ETag from response body."""
-        hash_value = hashlib.md5(body).hexdigest()
-        return f'"{hash_value}"'
+        return generate_etag(body)
+
+
+def generate_etag(body: bytes) -> str:
+    """Generate a strong ETag from the MD5 of *body*."""
+    hash_value = hashlib.md5(body).hexdigest()
+    return f'"{hash_value}"'
+
+
+def public_cache_headers(etag: str) -> dict[str, str]:
+    """Cache headers the middleware would add to a regular public response."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={CacheHeadersMiddleware.PUBLIC_CACHE_MAX_AGE}",
+        "Vary": "Accept-Language, Accept-Encoding",
+    }
+
+
+def public_json_response(payload: str, if_none_match: str | None) -> Response:
+    """Serve a pre-serialized public JSON payload with its ETag.
+
+    Endpoints that already hold the response body as a string (e.g. from
+    the public list cache) answer a matching If-None-Match with 304 right
+    away. Because Cache-Control is set here, the middleware does not
+    buffer and re-hash the body again.
+    """
+    headers = public_cache_headers(generate_etag(payload.encode()))
+    if if_none_match and if_none_match == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
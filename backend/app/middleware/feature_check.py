@@ -19,10 +19,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.dependencies import get_public_tenant_id
 from app.core.exceptions import FeatureDisabledError, FeatureNotAvailableError, LimitExceededError
-from app.core.security import TokenPayload, get_current_token
+from app.core.security import TokenPayload, get_current_active_user, get_current_token
+from app.modules.auth.models import AdminUser
 from app.modules.tenants.service import FeatureFlagService
 
 
+def _is_platform_owner(user: AdminUser) -> bool:
+    """Check the platform_owner permissions of the user's loaded role."""
+    if user.role is None:
+        return False
+    permissions = user.role.permission_codes
+    return "platform:*" in permissions or "platform:update" in permissions
+
+
 def require_feature(feature_name: str):
     """Create a dependency that checks if a feature is enabled (admin routes).
     
@@ -46,15 +55,16 @@ def require_feature(feature_name: str):
     
     async def dependency(
         token: TokenPayload = Depends(get_current_token),
+        user: AdminUser = Depends(get_current_active_user),
         db: AsyncSession = Depends(get_db),
     ) -> bool:
         """Check if feature is enabled for current tenant."""
         # Superusers always have access to all features
-        if token.is_superuser:
+        if user.is_superuser:
             return True
         
         # Check if user has platform_owner role (from permissions)
-        if "platform:*" in token.permissions or "platform:update" in token.permissions:
+        if _is_platform_owner(user):
             return True
         
         # Check feature flag in database
@@ -125,11 +135,12 @@ def require_limit(resource: str):
 
     async def dependency(
         token: TokenPayload = Depends(get_current_token),
+        user: AdminUser = Depends(get_current_active_user),
         db: AsyncSession = Depends(get_db),
     ) -> None:
-        if token.is_superuser:
+        if user.is_superuser:
             return
-        if "platform:*" in token.permissions or "platform:update" in token.permissions:
+        if _is_platform_owner(user):
             return
 
         from app.modules.billing.service import LimitService, LimitStatus
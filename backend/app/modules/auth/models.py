@@ -15,7 +15,7 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.base_model import (
@@ -60,9 +60,16 @@ class Role(Base, UUIDMixin, TimestampMixin):
     role_permissions: Mapped[list["RolePermission"]] = relationship(
         "RolePermission",
         back_populates="role",
-        lazy="selectin",
         cascade="all, delete-orphan",
     )
+    # Flat read-only view of the granted permissions (through role_permissions);
+    # this is what responses and permission checks read.
+    permissions: Mapped[list["Permission"]] = relationship(
+        "Permission",
+        secondary="role_permissions",
+        viewonly=True,
+        lazy="selectin",
+    )
     users: Mapped[list["AdminUser"]] = relationship(
         "AdminUser",
         back_populates="role",
@@ -78,6 +85,12 @@ class Role(Base, UUIDMixin, TimestampMixin):
     def __repr__(self) -> str:
         return f"<Role {self.name}>"
 
+    # Built on access so it follows the loaded permissions collection, which
+    # can change on refresh/populate_existing.
+    @property
+    def permission_codes(self) -> frozenset[str]:
+        return frozenset(p.code for p in self.permissions)
+
 
 class Permission(Base, UUIDMixin, TimestampMixin):
     """Available permissions in the system.
@@ -155,8 +168,8 @@ class AdminUser(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin, VersionMixin):
         index=True,
     )
 
-    # Authentication
-    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Authentication (citext: case-insensitive comparisons and uniqueness)
+    email: Mapped[str] = mapped_column(CITEXT, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Profile
@@ -186,6 +199,10 @@ class AdminUser(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin, VersionMixin):
     role: Mapped["Role | None"] = relationship("Role", back_populates="users")
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="users")
 
+    # Fetch server-generated values (updated_at on UPDATE) via RETURNING in
+    # the flush itself, so callers never need a refresh() round trip.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index(
             "uq_admin_users_tenant_email",
@@ -202,8 +219,10 @@ class AdminUser(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin, VersionMixin):
             "is_active",
             postgresql_where="deleted_at IS NULL AND is_active = true",
         ),
-        CheckConstraint("email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'", 
-                       name="ck_admin_users_email_format"),
+        CheckConstraint(
+            "position('@' in email) > 1 AND position('.' in split_part(email, '@', 2)) > 1",
+            name="ck_admin_users_email_format",
+        ),
     )
 
     @property
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, Request, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, Request, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -281,6 +281,16 @@ async def logout(
     await service.log_logout(token.tenant_id, token.user_id)
 
 
+def _get_permission_codes(user: AdminUser) -> list[str]:
+    """Return the permission codes of the user's role.
+
+    The current user is loaded with ``role.permissions``, so no query runs.
+    """
+    if not user.role:
+        return []
+    return [p.code for p in user.role.permissions]
+
+
 @router.get(
     "/me",
     response_model=MeResponse,
@@ -291,9 +301,7 @@ async def get_me(
     user: AdminUser = Depends(get_current_active_user),
 ) -> MeResponse:
     """Get current user information."""
-    permissions: list[str] = []
-    if user.role:
-        permissions = [rp.permission.code for rp in user.role.role_permissions]
+    permissions = _get_permission_codes(user)
 
     return MeResponse(
         id=user.id,
@@ -506,7 +514,7 @@ async def get_my_sidebar(
     # RBAC: user permissions set
     user_perms: set[str] = set()
     if user.role:
-        user_perms = {rp.permission.code for rp in user.role.role_permissions}
+        user_perms = {p.code for p in user.role.permissions}
 
     def has_permission(required: str) -> bool:
         if is_privileged:
@@ -653,6 +661,7 @@ async def change_my_password(
     description="Upload or replace current user's avatar.",
 )
 async def upload_my_avatar(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     user: AdminUser = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
@@ -669,14 +678,13 @@ async def upload_my_avatar(
         folder="users",
         entity_id=user.id,
         old_image_url=user.avatar_url,
+        background_tasks=background_tasks,
     )
     
     service = UserService(db)
-    updated_user = await service.update_avatar_url(user.id, user.tenant_id, new_url)
+    updated_user = await service.set_avatar_url(user, new_url)
     
-    permissions: list[str] = []
-    if updated_user.role:
-        permissions = [rp.permission.code for rp in updated_user.role.role_permissions]
+    permissions = _get_permission_codes(updated_user)
 
     return MeResponse(
         id=updated_user.id,
@@ -700,11 +708,15 @@ async def upload_my_avatar(
     description="Delete current user's avatar.",
 )
 async def delete_my_avatar(
+    background_tasks: BackgroundTasks,
     user: AdminUser = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    """Delete current user's avatar."""
-    if user.avatar_url:
-        await image_upload_service.delete_image(user.avatar_url)
-        service = UserService(db)
-        await service.update_avatar_url(user.id, user.tenant_id, None)
+    """Delete current user's avatar.
+
+    The stored object is removed after the response is sent.
+    """
+    # No avatar: nothing to write, so no transaction is committed
+    old_url = await UserService(db).clear_loaded_avatar_url(user)
+    if old_url:
+        background_tasks.add_task(image_upload_service.delete_image, old_url)
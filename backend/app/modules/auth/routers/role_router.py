@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -24,12 +25,24 @@ from app.modules.auth.services import RoleService
 
 router = APIRouter()
 
+# Shared permission dependencies (see user_router).
+_READ = Depends(PermissionChecker("users:read"))
+_MANAGE = Depends(PermissionChecker("users:manage"))
+
+# The permission list only changes with seeds/migrations, so clients may
+# reuse it for a while and revalidate with If-None-Match afterwards.
+CACHE_PERMISSIONS = "private, max-age=300"
+
+# Batch validators for list endpoints (one core-schema pass per list).
+_ROLE_LIST_ADAPTER = TypeAdapter(list[RoleResponse])
+_PERMISSION_LIST_ADAPTER = TypeAdapter(list[PermissionResponse])
+
 
 @router.get(
     "/roles",
     response_model=RoleListResponse,
     summary="List roles",
-    dependencies=[Depends(PermissionChecker("users:read"))],
+    dependencies=[_READ],
 )
 async def list_roles(
     tenant_id: UUID = Depends(get_current_tenant_id),
@@ -40,7 +53,7 @@ async def list_roles(
     roles = await service.list_roles(tenant_id)
 
     return RoleListResponse(
-        items=[RoleResponse.model_validate(r) for r in roles],
+        items=_ROLE_LIST_ADAPTER.validate_python(roles, from_attributes=True),
         total=len(roles),
     )
 
@@ -49,17 +62,38 @@ async def list_roles(
     "/permissions",
     response_model=PermissionListResponse,
     summary="List permissions",
-    dependencies=[Depends(PermissionChecker("users:read"))],
+    dependencies=[_READ],
 )
 async def list_permissions(
+    response: Response,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> PermissionListResponse:
-    """List all available permissions."""
+) -> PermissionListResponse | Response:
+    """List all available permissions.
+
+    Returns a semantic ETag built from the row count and latest
+    ``updated_at``; a matching If-None-Match gets 304 without loading
+    or serializing the list.
+    """
     service = RoleService(db)
+
+    count, last_updated = await service.get_permissions_version()
+    ts = int(last_updated.timestamp() * 1_000_000) if last_updated else 0
+    etag = f'W/"permissions:{count}:{ts}"'
+
+    if if_none_match and if_none_match == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": CACHE_PERMISSIONS},
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_PERMISSIONS
+
     permissions = await service.list_permissions()
 
     return PermissionListResponse(
-        items=[PermissionResponse.model_validate(p) for p in permissions],
+        items=_PERMISSION_LIST_ADAPTER.validate_python(permissions, from_attributes=True),
         total=len(permissions),
     )
 
@@ -69,7 +103,7 @@ async def list_permissions(
     response_model=RoleResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create role",
-    dependencies=[Depends(PermissionChecker("users:manage"))],
+    dependencies=[_MANAGE],
 )
 async def create_role(
     data: RoleCreate,
@@ -92,7 +126,7 @@ async def create_role(
     "/roles/{role_id}",
     response_model=RoleResponse,
     summary="Update role",
-    dependencies=[Depends(PermissionChecker("users:manage"))],
+    dependencies=[_MANAGE],
 )
 async def update_role(
     role_id: UUID,
@@ -120,7 +154,7 @@ async def update_role(
     "/roles/{role_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete role",
-    dependencies=[Depends(PermissionChecker("users:manage"))],
+    dependencies=[_MANAGE],
 )
 async def delete_role(
     role_id: UUID,
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -17,6 +17,7 @@ from app.core.security import (
 )
 from app.modules.auth.models import AdminUser
 from app.modules.auth.schemas import (
+    RoleResponse,
     UserCreate,
     UserListResponse,
     UserResponse,
@@ -26,6 +27,13 @@ from app.modules.auth.services import UserService
 
 router = APIRouter()
 
+# Permission dependencies are built once and shared by every route so
+# FastAPI sees the same callable (and dependency-cache key) each time.
+_READ = Depends(PermissionChecker("users:read"))
+_CREATE = Depends(PermissionChecker("users:create"))
+_UPDATE = Depends(PermissionChecker("users:update"))
+_DELETE = Depends(PermissionChecker("users:delete"))
+
 
 def _resolve_effective_tenant(
     user: AdminUser,
@@ -49,12 +57,42 @@ def _resolve_effective_tenant(
     return target_tenant_id
 
 
+def _user_from_orm(user: AdminUser, roles: dict[UUID, RoleResponse]) -> UserResponse:
+    """Build a ``UserResponse`` from a trusted ORM row without re-validation.
+
+    Row values are already constrained by the database, so only the role
+    is validated, once per distinct role via the *roles* memo.
+    """
+    role = None
+    if user.role is not None:
+        role = roles.get(user.role.id)
+        if role is None:
+            role = roles[user.role.id] = RoleResponse.model_validate(user.role)
+
+    return UserResponse.model_construct(
+        id=user.id,
+        tenant_id=user.tenant_id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        is_active=user.is_active,
+        is_superuser=user.is_superuser,
+        force_password_change=user.force_password_change,
+        avatar_url=user.avatar_url,
+        last_login_at=user.last_login_at,
+        role=role,
+        version=user.version,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
 @router.get(
     "/users",
     response_model=UserListResponse,
     summary="List users",
     description="Get paginated list of users in the tenant. Platform owner can specify tenant_id to list users of any organization.",
-    dependencies=[Depends(PermissionChecker("users:read"))],
+    dependencies=[_READ],
 )
 async def list_users(
     pagination: Pagination,
@@ -77,8 +115,11 @@ async def list_users(
         search=search,
     )
 
-    return UserListResponse(
-        items=[UserResponse.model_validate(u) for u in users],
+    # Each row is converted straight into the response model; the wrapper
+    # is built with model_construct too since its fields are already typed.
+    roles: dict[UUID, RoleResponse] = {}
+    return UserListResponse.model_construct(
+        items=[_user_from_orm(u, roles) for u in users],
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
@@ -91,7 +132,7 @@ async def list_users(
     status_code=status.HTTP_201_CREATED,
     summary="Create user",
     description="Create a new user. Platform owner can specify tenant_id to create users in any organization.",
-    dependencies=[require_limit("max_users"), Depends(PermissionChecker("users:create"))],
+    dependencies=[require_limit("max_users"), _CREATE],
 )
 async def create_user(
     data: UserCreate,
@@ -113,7 +154,7 @@ async def create_user(
     response_model=UserResponse,
     summary="Get user",
     description="Get user by ID. Platform owner / superuser can view users from any organization (auto-resolved if tenant_id not specified).",
-    dependencies=[Depends(PermissionChecker("users:read"))],
+    dependencies=[_READ],
 )
 async def get_user(
     user_id: UUID,
@@ -151,7 +192,7 @@ async def get_user(
     response_model=UserResponse,
     summary="Update user",
     description="Update user. Platform owner can specify tenant_id to update users in any organization.",
-    dependencies=[Depends(PermissionChecker("users:update"))],
+    dependencies=[_UPDATE],
 )
 async def update_user(
     user_id: UUID,
@@ -189,7 +230,7 @@ async def update_user(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete user",
     description="Soft delete a user. Platform owner can specify tenant_id to delete users in any organization.",
-    dependencies=[Depends(PermissionChecker("users:delete"))],
+    dependencies=[_DELETE],
 )
 async def delete_user(
     user_id: UUID,
@@ -223,10 +264,11 @@ async def delete_user(
     "/users/{user_id}/avatar",
     response_model=UserResponse,
     summary="Upload user avatar",
-    dependencies=[Depends(PermissionChecker("users:update"))],
+    dependencies=[_UPDATE],
 )
 async def upload_user_avatar(
     user_id: UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     target_tenant_id: UUID | None = Query(None, alias="tenant_id", description="Target tenant (platform owner only)"),
     user: AdminUser = Depends(get_current_active_user),
@@ -250,9 +292,10 @@ async def upload_user_avatar(
         folder="users",
         entity_id=user_id,
         old_image_url=target_user.avatar_url,
+        background_tasks=background_tasks,
     )
     
-    target_user = await service.update_avatar_url(user_id, effective_tenant_id, new_url)
+    target_user = await service.set_avatar_url(target_user, new_url)
     
     return UserResponse.model_validate(target_user)
 
@@ -261,21 +304,24 @@ async def upload_user_avatar(
     "/users/{user_id}/avatar",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete user avatar",
-    dependencies=[Depends(PermissionChecker("users:update"))],
+    dependencies=[_UPDATE],
 )
 async def delete_user_avatar(
     user_id: UUID,
+    background_tasks: BackgroundTasks,
     target_tenant_id: UUID | None = Query(None, alias="tenant_id", description="Target tenant (platform owner only)"),
     user: AdminUser = Depends(get_current_active_user),
     current_tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    """Delete avatar from user."""
+    """Delete avatar from user.
+
+    The stored object is removed after the response is sent.
+    """
     effective_tenant_id = _resolve_effective_tenant(user, target_tenant_id, current_tenant_id)
 
     service = UserService(db)
-    target_user = await service.get_by_id(user_id, effective_tenant_id)
-    
-    if target_user.avatar_url:
-        await image_upload_service.delete_image(target_user.avatar_url)
-        await service.update_avatar_url(user_id, effective_tenant_id, None)
+    old_url = await service.clear_avatar_url(user_id, effective_tenant_id)
+
+    if old_url:
+        background_tasks.add_task(image_upload_service.delete_image, old_url)
@@ -1,10 +1,10 @@
 """Pydantic schemas for authentication module."""
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 # ============================================================================
@@ -107,7 +107,10 @@ class UserResponse(UserBase):
     is_active: bool
     is_superuser: bool
     force_password_change: bool = False
-    avatar_url: str | None = None
+    avatar_url: str | None = Field(
+        default=None,
+        description="Avatar path (/media/...) as stored at upload time; never re-signed on read",
+    )
     last_login_at: datetime | None = None
     role: "RoleResponse | None" = None
     version: int
@@ -158,24 +161,10 @@ class RoleResponse(RoleBase):
 
     id: UUID
     is_system: bool
-    permissions: list["PermissionResponse"] = Field(
-        default_factory=list,
-        validation_alias="role_permissions"
-    )
+    permissions: list["PermissionResponse"] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("permissions", mode="before")
-    @classmethod
-    def extract_permissions(cls, v: Any) -> list[Any]:
-        """Extract Permission objects from RolePermission list."""
-        if v is None:
-            return []
-        # If it's a list of RolePermission objects, extract the permission
-        if v and hasattr(v[0], "permission"):
-            return [rp.permission for rp in v if rp.permission]
-        return list(v) if v else []
-
 
 class RoleListResponse(BaseModel):
     """Schema for role list response."""
@@ -225,7 +214,10 @@ class MeResponse(BaseModel):
     first_name: str
     last_name: str
     full_name: str
-    avatar_url: str | None = None
+    avatar_url: str | None = Field(
+        default=None,
+        description="Avatar path (/media/...) as stored at upload time; never re-signed on read",
+    )
     is_superuser: bool
     force_password_change: bool = False
     role: RoleResponse | None = None
@@ -448,9 +440,13 @@ class ResetPasswordRequest(BaseModel):
     new_password: str = Field(..., min_length=8, max_length=100, description="New password")
 
 
-# Fix forward references
+# Fix forward references. The list wrappers reference "UserResponse" /
+# "RoleResponse" before those are defined, so they must be rebuilt here too;
+# otherwise Pydantic defers building their validators to the first request.
 LoginResponse.model_rebuild()
 TenantSelectionRequired.model_rebuild()
 UserResponse.model_rebuild()
+UserListResponse.model_rebuild()
 RoleResponse.model_rebuild()
+RoleListResponse.model_rebuild()
 
@@ -1,11 +1,12 @@
 """Auth module - authentication service."""
 
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.config import settings
 from app.core.database import transactional
@@ -17,13 +18,36 @@ from app.core.exceptions import (
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    decode_token,
+    decode_refresh_token,
     hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
-from app.modules.auth.models import AdminUser, Role, RolePermission
+from app.modules.auth.models import AdminUser, Role
 from app.modules.auth.schemas import LoginRequest, TokenPair
 
+# Compared against when no user matches the login email, so a miss costs the
+# same single bcrypt compare as a wrong password (no email enumeration by
+# timing). Hashed once at import with the regular cost factor.
+_DUMMY_PASSWORD_HASH = hash_password(uuid4().hex)
+
+
+def _login_load_options() -> list[ExecutableOption]:
+    """Load options for the login / refresh user query.
+
+    User, role and permissions come back in one LEFT JOIN query (the
+    permissions go into the LoginResponse). ``Role.users`` is
+    mapped selectin and would otherwise load every holder of the role; any
+    other relationship raises instead of lazy-loading.
+    """
+    return [
+        joinedload(AdminUser.role).options(
+            joinedload(Role.permissions),
+            lazyload(Role.users),
+        ),
+        raiseload("*"),
+    ]
+
 
 class AuthService:
     """Service for authentication operations."""
@@ -83,16 +107,17 @@ class AuthService:
             .where(AdminUser.tenant_id == tenant_id)
             .where(AdminUser.email == data.email)
             .where(AdminUser.deleted_at.is_(None))
-            .options(
-                selectinload(AdminUser.role)
-                .selectinload(Role.role_permissions)
-                .selectinload(RolePermission.permission)
-            )
+            .options(*_login_load_options())
         )
         result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = result.unique().scalar_one_or_none()
 
-        if not user or not verify_password(data.password, user.password_hash):
+        # Always run one bcrypt compare so an unknown email takes as long
+        # as a wrong password.
+        password_ok = await verify_password_async(
+            data.password, user.password_hash if user else _DUMMY_PASSWORD_HASH
+        )
+        if not user or not password_ok:
             raise InvalidCredentialsError()
 
         if not user.is_active:
@@ -106,7 +131,7 @@ class AuthService:
         tokens = self._create_tokens(user)
 
         # Audit log
-        await self.audit.log(
+        await self.audit.log_deferred(
             tenant_id=tenant_id,
             user_id=user.id,
             resource_type="auth",
@@ -116,7 +141,6 @@ class AuthService:
         )
 
         await self.db.flush()
-        await self.db.refresh(user)
 
         return user, tokens
 
@@ -133,7 +157,7 @@ class AuthService:
             InvalidTokenError: If refresh token is invalid
             TenantInactiveError: If tenant is suspended
         """
-        payload = decode_token(refresh_token)
+        payload = decode_refresh_token(refresh_token)
 
         if payload.get("type") != "refresh":
             raise InvalidTokenError("Invalid token type")
@@ -144,43 +168,78 @@ class AuthService:
         # Check tenant is active before refreshing
         await self._check_tenant_active(tenant_id)
 
-        # Get user
+        # Only the token claims are needed: a few user columns and the role
+        # name; no ORM objects are built.
         stmt = (
-            select(AdminUser)
+            select(
+                AdminUser.id,
+                AdminUser.tenant_id,
+                AdminUser.email,
+                AdminUser.is_superuser,
+                AdminUser.role_id,
+                Role.name.label("role_name"),
+            )
+            .outerjoin(Role, Role.id == AdminUser.role_id)
             .where(AdminUser.id == user_id)
             .where(AdminUser.tenant_id == tenant_id)
             .where(AdminUser.deleted_at.is_(None))
             .where(AdminUser.is_active.is_(True))
-            .options(
-                selectinload(AdminUser.role)
-                .selectinload(Role.role_permissions)
-                .selectinload(RolePermission.permission)
-            )
         )
         result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not user:
+        if row is None:
             raise InvalidTokenError("User not found")
 
-        return self._create_tokens(user)
+        return self._issue_tokens(
+            user_id=row.id,
+            tenant_id=row.tenant_id,
+            email=row.email,
+            is_superuser=row.is_superuser,
+            role_id=row.role_id,
+            role_name=row.role_name,
+        )
 
     def _create_tokens(self, user: AdminUser) -> TokenPair:
         """Create access and refresh tokens for user."""
+        role = user.role
+        return self._issue_tokens(
+            user_id=user.id,
+            tenant_id=user.tenant_id,
+            email=user.email,
+            is_superuser=user.is_superuser,
+            role_id=role.id if role else None,
+            role_name=role.name if role else None,
+        )
+
+    def _issue_tokens(
+        self,
+        *,
+        user_id: UUID,
+        tenant_id: UUID,
+        email: str,
+        is_superuser: bool,
+        role_id: UUID | None,
+        role_name: str | None,
+    ) -> TokenPair:
+        """Sign an access/refresh token pair for the given claims.
+
+        Permission codes are not embedded: they are read server-side from
+        the user's role loaded by ``get_current_user``, which keeps the
+        token small and picks up role edits immediately.
+        """
         # Build token payload
         token_data = {
-            "sub": str(user.id),
-            "tenant_id": str(user.tenant_id),
-            "email": user.email,
-            "is_superuser": user.is_superuser,
+            "sub": str(user_id),
+            "tenant_id": str(tenant_id),
+            "email": email,
+            "is_superuser": is_superuser,
         }
 
-        # Add role and permissions
-        if user.role:
-            token_data["role"] = user.role.name
-            token_data["permissions"] = [
-                rp.permission.code for rp in user.role.role_permissions
-            ]
+        # Add role
+        if role_name is not None:
+            token_data["role"] = role_name
+            token_data["role_id"] = str(role_id)
 
         access_token = create_access_token(token_data)
         refresh_token = create_refresh_token(token_data)
@@ -236,20 +295,22 @@ class AuthService:
                 AdminUser.deleted_at.is_(None),
             )
             .options(
-                selectinload(AdminUser.role)
-                .selectinload(Role.role_permissions)
-                .selectinload(RolePermission.permission),
+                selectinload(AdminUser.role).options(
+                    selectinload(Role.permissions),
+                    lazyload(Role.users),
+                ),
                 selectinload(AdminUser.tenant),
             )
         )
         result = await self.db.execute(stmt)
         users = list(result.scalars().all())
 
-        if not users:
-            raise InvalidCredentialsError()
-
-        # Verify password against the first user record (shared across tenants)
-        if not verify_password(data.password, users[0].password_hash):
+        # Verify password against the first user record (shared across
+        # tenants); unknown emails are compared against the dummy hash.
+        password_ok = await verify_password_async(
+            data.password, users[0].password_hash if users else _DUMMY_PASSWORD_HASH
+        )
+        if not users or not password_ok:
             raise InvalidCredentialsError()
 
         # Keep only users whose tenant is active and not deleted
@@ -315,7 +376,7 @@ class AuthService:
             user.last_login_ip = ip_address
             tokens = self._create_tokens(user)
 
-            await self.audit.log(
+            await self.audit.log_deferred(
                 tenant_id=user.tenant_id,
                 user_id=user.id,
                 resource_type="auth",
@@ -324,7 +385,6 @@ class AuthService:
                 ip_address=ip_address,
             )
             await self.db.flush()
-            await self.db.refresh(user)
             return user, tokens
 
         # --- Multiple tenants: return selection payload ---
@@ -393,14 +453,10 @@ class AuthService:
                 AdminUser.is_active.is_(True),
                 AdminUser.deleted_at.is_(None),
             )
-            .options(
-                selectinload(AdminUser.role)
-                .selectinload(Role.role_permissions)
-                .selectinload(RolePermission.permission),
-            )
+            .options(*_login_load_options())
         )
         result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = result.unique().scalar_one_or_none()
 
         if user is None:
             raise InvalidCredentialsError("No access to this organization")
@@ -409,7 +465,7 @@ class AuthService:
         user.last_login_ip = ip_address
         tokens = self._create_tokens(user)
 
-        await self.audit.log(
+        await self.audit.log_deferred(
             tenant_id=tenant_id,
             user_id=user.id,
             resource_type="auth",
@@ -419,7 +475,6 @@ class AuthService:
             changes={"via": "select_tenant"},
         )
         await self.db.flush()
-        await self.db.refresh(user)
 
         return user, tokens
 
@@ -515,8 +570,7 @@ class AuthService:
             )
             .options(
                 selectinload(AdminUser.role)
-                .selectinload(Role.role_permissions)
-                .selectinload(RolePermission.permission)
+                .selectinload(Role.permissions)
             )
         )
         result = await self.db.execute(stmt)
@@ -631,7 +685,7 @@ class AuthService:
         if not user:
             raise InvalidTokenError("User not found")
 
-        new_hash = hash_password(new_password)
+        new_hash = await hash_password_async(new_password)
         user.password_hash = new_hash
         user.force_password_change = False
 
@@ -652,7 +706,7 @@ class AuthService:
     @transactional
     async def log_logout(self, tenant_id: UUID, user_id: UUID) -> None:
         """Record an audit log entry for logout."""
-        await self.audit.log(
+        await self.audit.log_deferred(
             tenant_id=tenant_id,
             user_id=user_id,
             resource_type="auth",
@@ -1,12 +1,13 @@
 """Auth module - role service."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, exists, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, raiseload, selectinload
 
-from app.core.base_service import update_many_to_many
 from app.core.database import transactional
 from app.core.exceptions import (
     DuplicateRoleError,
@@ -38,7 +39,13 @@ class RoleService:
             select(Role)
             .where(Role.id == role_id)
             .where(Role.tenant_id == tenant_id)
-            .options(selectinload(Role.role_permissions).selectinload(RolePermission.permission))
+            .options(
+                selectinload(Role.role_permissions),
+                selectinload(Role.permissions),
+                # Loaded lazily only when the role is deleted (FK nulling).
+                lazyload(Role.users),
+                raiseload("*"),
+            )
         )
         result = await self.db.execute(stmt)
         role = result.scalar_one_or_none()
@@ -48,23 +55,69 @@ class RoleService:
 
         return role
 
+    async def _reload(self, role: Role) -> Role:
+        """Re-select *role* after a flush with its permissions eager-loaded.
+
+        Replaces the ``refresh(role)`` + ``refresh(role, ["role_permissions"])``
+        pair: server-side columns and the permission list come back in one
+        eager-loaded fetch.
+        """
+        stmt = (
+            select(Role)
+            .where(Role.id == role.id)
+            .options(selectinload(Role.permissions), lazyload(Role.users))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
     async def list_roles(self, tenant_id: UUID) -> list[Role]:
         """List all roles in tenant."""
         stmt = (
             select(Role)
             .where(Role.tenant_id == tenant_id)
-            .options(selectinload(Role.role_permissions).selectinload(RolePermission.permission))
+            .options(lazyload(Role.users))
             .order_by(Role.name)
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_permissions_version(self) -> tuple[int, datetime | None]:
+        """Return (count, latest updated_at) of the permission table.
+
+        Cheap fingerprint used to build the ETag of the permission list.
+        """
+        result = await self.db.execute(
+            select(func.count(), func.max(Permission.updated_at)).select_from(Permission)
+        )
+        count, last_updated = result.one()
+        return count, last_updated
+
     async def list_permissions(self) -> list[Permission]:
         """List all available permissions."""
         stmt = select(Permission).order_by(Permission.resource, Permission.action)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def _write_permissions(
+        self, role_id: UUID, permission_ids: list[UUID], *, replace: bool = False
+    ) -> None:
+        """Write a role's permission links with at most two statements.
+
+        One bulk DELETE of the existing links (when *replace*) and one
+        multi-row INSERT, instead of a statement per RolePermission.
+        """
+        if replace:
+            await self.db.execute(
+                delete(RolePermission).where(RolePermission.role_id == role_id)
+            )
+        rows = [
+            {"role_id": role_id, "permission_id": permission_id}
+            for permission_id in dict.fromkeys(permission_ids)
+        ]
+        if rows:
+            await self.db.execute(insert(RolePermission), rows)
+
     @transactional
     async def create_role(
         self,
@@ -74,30 +127,24 @@ class RoleService:
         permission_ids: list[UUID],
     ) -> Role:
         """Create a new role."""
-        # Check if role with same name exists
-        existing = await self.db.execute(
-            select(Role)
-            .where(Role.tenant_id == tenant_id)
-            .where(Role.name == name)
+        # Duplicate names are caught by uq_roles_tenant_name in the same
+        # statement instead of a separate pre-check SELECT.
+        result = await self.db.execute(
+            pg_insert(Role)
+            .values(
+                tenant_id=tenant_id,
+                name=name,
+                description=description,
+                is_system=False,
+            )
+            .on_conflict_do_nothing(constraint="uq_roles_tenant_name")
+            .returning(Role)
         )
-        if existing.scalar_one_or_none():
+        role = result.scalar_one_or_none()
+        if role is None:
             raise DuplicateRoleError(name)
 
-        role = Role(
-            tenant_id=tenant_id,
-            name=name,
-            description=description,
-            is_system=False,
-        )
-        self.db.add(role)
-        await self.db.flush()
-
-        # Add permissions
-        for perm_id in permission_ids:
-            rp = RolePermission(role_id=role.id, permission_id=perm_id)
-            self.db.add(rp)
-
-        await self.db.flush()
+        await self._write_permissions(role.id, permission_ids)
 
         # Audit log: role created
         await self.audit.log(
@@ -109,9 +156,7 @@ class RoleService:
             changes={"name": name, "description": description},
         )
 
-        await self.db.refresh(role)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(role, ["role_permissions"])
-        return role
+        return await self._reload(role)
 
     @transactional
     async def update_role(
@@ -145,15 +190,7 @@ class RoleService:
 
         # Update permissions if provided
         if permission_ids is not None:
-            await update_many_to_many(
-                self.db,
-                role,
-                "role_permissions",
-                permission_ids,
-                RolePermission,
-                "role_id",
-                "permission_id",
-            )
+            await self._write_permissions(role_id, permission_ids, replace=True)
 
         await self.db.flush()
 
@@ -175,9 +212,7 @@ class RoleService:
                 changes=changes,
             )
 
-        await self.db.refresh(role)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(role, ["role_permissions"])
-        return role
+        return await self._reload(role)
 
     @transactional
     async def delete_role(self, role_id: UUID, tenant_id: UUID) -> None:
@@ -187,14 +222,15 @@ class RoleService:
         if role.is_system:
             raise SystemRoleModificationError("delete")
 
-        # Check if role is in use
-        users_with_role = await self.db.execute(
-            select(func.count())
-            .select_from(AdminUser)
-            .where(AdminUser.role_id == role_id)
-            .where(AdminUser.deleted_at.is_(None))
+        # Check if role is in use (EXISTS stops at the first matching user)
+        role_in_use = await self.db.execute(
+            select(
+                exists()
+                .where(AdminUser.role_id == role_id)
+                .where(AdminUser.deleted_at.is_(None))
+            )
         )
-        if users_with_role.scalar() or 0 > 0:
+        if role_in_use.scalar():
             raise RoleInUseError(role.name)
 
         # Audit log: role deleted
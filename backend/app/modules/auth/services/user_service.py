@@ -3,16 +3,16 @@
 from uuid import UUID
 
 from sqlalchemy import select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, raiseload, selectinload
 
 from app.core.base_service import BaseService
 from app.core.database import transactional
 from app.core.exceptions import AlreadyExistsError, InvalidCredentialsError, NotFoundError
 from app.core.pagination import paginate_query
-from app.core.security import hash_password, verify_password
-from app.modules.auth.models import AdminUser
+from app.core.security import hash_password_async, verify_password_async
+from app.modules.auth.models import AdminUser, Role
 from app.modules.auth.schemas import PasswordChange, UserCreate, UserUpdate
 
 
@@ -34,8 +34,34 @@ class UserService(BaseService[AdminUser]):
         return self._audit
 
     def _get_default_options(self) -> list:
-        """Get default eager loading options."""
-        return [selectinload(AdminUser.role)]
+        """Get default eager loading options (role with its permissions).
+
+        Any other relationship (e.g. ``AdminUser.tenant``) raises on access
+        instead of silently lazy-loading.
+        """
+        return [
+            selectinload(AdminUser.role).options(
+                selectinload(Role.permissions),
+                lazyload(Role.users),
+            ),
+            raiseload("*"),
+        ]
+
+    async def _reload(self, user: AdminUser) -> AdminUser:
+        """Re-select *user* after a flush with role and permissions eager-loaded.
+
+        Replaces the ``refresh(user)`` + ``refresh(user, ["role"])`` pair:
+        server-side columns (``updated_at``) and the full role graph come
+        back in a single eager-loaded fetch.
+        """
+        stmt = (
+            select(AdminUser)
+            .where(AdminUser.id == user.id)
+            .options(*self._get_default_options())
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
 
     async def get_by_id(self, user_id: UUID, tenant_id: UUID) -> AdminUser:
         """Get user by ID within tenant."""
@@ -91,6 +117,7 @@ class UserService(BaseService[AdminUser]):
             page_size,
             options=self._get_default_options(),
             order_by=[AdminUser.created_at.desc()],
+            window_count=True,
         )
 
     @transactional
@@ -100,36 +127,33 @@ class UserService(BaseService[AdminUser]):
         Sets force_password_change=True for new users.
         Sends welcome email when send_credentials=True.
         """
-        existing = await self.db.execute(
-            select(AdminUser)
-            .where(AdminUser.tenant_id == tenant_id)
-            .where(AdminUser.email == data.email)
-            .where(AdminUser.deleted_at.is_(None))
+        # Single round trip: the partial unique index on (tenant_id, email)
+        # turns a duplicate into "no row returned" instead of a separate
+        # pre-check SELECT (which could also race with a parallel insert).
+        stmt = (
+            pg_insert(AdminUser)
+            .values(
+                tenant_id=tenant_id,
+                email=data.email,
+                password_hash=await hash_password_async(data.password),
+                first_name=data.first_name,
+                last_name=data.last_name,
+                role_id=data.role_id,
+                is_active=data.is_active,
+                force_password_change=True,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[AdminUser.tenant_id, AdminUser.email],
+                index_where=AdminUser.deleted_at.is_(None),
+            )
+            .returning(AdminUser)
         )
-        if existing.scalar_one_or_none():
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is None:
             raise AlreadyExistsError("User", "email", data.email)
 
-        # Create user with force_password_change=True
-        user = AdminUser(
-            tenant_id=tenant_id,
-            email=data.email,
-            password_hash=hash_password(data.password),
-            first_name=data.first_name,
-            last_name=data.last_name,
-            role_id=data.role_id,
-            is_active=data.is_active,
-            force_password_change=True,
-        )
-        self.db.add(user)
-        try:
-            await self.db.flush()
-        except IntegrityError as exc:
-            await self.db.rollback()
-            if "uq_admin_users_tenant_email" in str(exc):
-                raise AlreadyExistsError("User", "email", data.email) from exc
-            raise
-        await self.db.refresh(user)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(user, ["role"])
+        user = await self._reload(user)
 
         # Audit log: user created
         await self.audit.log(
@@ -199,10 +223,7 @@ class UserService(BaseService[AdminUser]):
                 changes=changes,
             )
 
-        await self.db.refresh(user)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(user, ["role"])
-
-        return user
+        return await self._reload(user)
 
     @transactional
     async def change_password(
@@ -216,10 +237,10 @@ class UserService(BaseService[AdminUser]):
         """
         user = await self.get_by_id(user_id, tenant_id)
 
-        if not verify_password(data.current_password, user.password_hash):
+        if not await verify_password_async(data.current_password, user.password_hash):
             raise InvalidCredentialsError("Current password is incorrect")
 
-        new_hash = hash_password(data.new_password)
+        new_hash = await hash_password_async(data.new_password)
         user.password_hash = new_hash
         user.force_password_change = False
         await self.db.flush()
@@ -251,11 +272,66 @@ class UserService(BaseService[AdminUser]):
     ) -> AdminUser:
         """Update or clear the user avatar URL."""
         user = await self.get_by_id(user_id, tenant_id)
+        return await self._apply_avatar_url(user, url)
+
+    @transactional
+    async def set_avatar_url(self, user: AdminUser, url: str | None) -> AdminUser:
+        """Update or clear the avatar URL of an already-loaded user.
+
+        Use when the caller already holds the user in this session
+        (e.g. the current user, or a user fetched for the old avatar URL)
+        to skip a second ``get_by_id``.
+        """
+        return await self._apply_avatar_url(user, url)
+
+    async def clear_avatar_url(self, user_id: UUID, tenant_id: UUID) -> str | None:
+        """Clear a user's avatar and return the previous URL.
+
+        Only the ``avatar_url`` column is read first; when the user has no
+        avatar nothing is written and no COMMIT is issued.
+
+        Raises:
+            NotFoundError: If the user does not exist in the tenant
+        """
+        result = await self.db.execute(
+            select(AdminUser.avatar_url)
+            .where(AdminUser.id == user_id)
+            .where(AdminUser.tenant_id == tenant_id)
+            .where(AdminUser.deleted_at.is_(None))
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise NotFoundError("AdminUser", user_id)
+
+        old_url: str | None = row.avatar_url
+        if old_url is not None:
+            await self._null_avatar_url(user_id)
+        return old_url
+
+    async def clear_loaded_avatar_url(self, user: AdminUser) -> str | None:
+        """Clear the avatar of an already-loaded user and return the previous URL.
+
+        Like ``clear_avatar_url`` but reads the URL from *user* (e.g. the
+        current user) instead of selecting it again.
+        """
+        old_url = user.avatar_url
+        if old_url is not None:
+            await self._null_avatar_url(user.id)
+        return old_url
+
+    @transactional
+    async def _null_avatar_url(self, user_id: UUID) -> None:
+        await self.db.execute(
+            update(AdminUser)
+            .where(AdminUser.id == user_id)
+            .values(avatar_url=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _apply_avatar_url(self, user: AdminUser, url: str | None) -> AdminUser:
         user.avatar_url = url
         await self.db.flush()
-        await self.db.refresh(user)
-        await self.db.refresh(user, ["role"])
-        return user
+        return await self._reload(user)
 
     @transactional
     async def soft_delete(self, user_id: UUID, tenant_id: UUID) -> None:
@@ -6,7 +6,7 @@ Keeps business logic (data transformation) out of routers.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 from app.core.exceptions import LocaleDataMissingError
 from app.modules.company.models import (
@@ -32,6 +32,29 @@ if TYPE_CHECKING:
     from app.modules.content.models import Case, ContentBlock, Review
 
 
+class _HasLocale(Protocol):
+    """A locale row: anything with a ``locale`` code."""
+
+    @property
+    def locale(self) -> str: ...
+
+
+LocaleT = TypeVar("LocaleT", bound=_HasLocale)
+
+
+def _pick_locale(locales: list[LocaleT], locale: str) -> LocaleT | None:
+    """Return the locale row for *locale*, else the first row, else None.
+
+    A plain early-exit loop: entities carry only a handful of locale rows,
+    so this beats building a per-object dict and avoids a generator frame
+    per lookup.
+    """
+    for loc in locales:
+        if loc.locale == locale:
+            return loc
+    return locales[0] if locales else None
+
+
 # ============================================================================
 # Service Mappers
 # ============================================================================
@@ -56,10 +79,7 @@ def map_service_to_public_response(
     Returns:
         ServicePublicResponse with data for the specified locale
     """
-    locale_data = next(
-        (loc for loc in service.locales if loc.locale == locale),
-        service.locales[0] if service.locales else None
-    )
+    locale_data = _pick_locale(service.locales, locale)
     
     if not locale_data:
         raise LocaleDataMissingError("Service", service.id, locale)
@@ -116,10 +136,7 @@ def _map_cases_for_service(cases: list[Case], locale: str) -> list[CaseMinimalFo
     """
     result = []
     for case in cases:
-        locale_data = next(
-            (loc for loc in case.locales if loc.locale == locale),
-            case.locales[0] if case.locales else None
-        )
+        locale_data = _pick_locale(case.locales, locale)
         if locale_data:
             # Map contacts
             contacts = [
@@ -184,21 +201,6 @@ def _map_reviews_for_service(reviews: list[Review]) -> list[ReviewMinimalForServ
     return result
 
 
-def map_services_to_public_response(
-    services: list[Service], locale: str
-) -> list[ServicePublicResponse]:
-    """Map a list of Service models to ServicePublicResponse list.
-    
-    Args:
-        services: List of Service ORM models
-        locale: Locale code to filter by
-        
-    Returns:
-        List of ServicePublicResponse
-    """
-    return [map_service_to_public_response(svc, locale) for svc in services]
-
-
 # ============================================================================
 # Employee Mappers
 # ============================================================================
@@ -219,10 +221,7 @@ def map_employee_to_public_response(
     Returns:
         EmployeePublicResponse with data for the specified locale
     """
-    locale_data = next(
-        (loc for loc in employee.locales if loc.locale == locale),
-        employee.locales[0] if employee.locales else None
-    )
+    locale_data = _pick_locale(employee.locales, locale)
     
     if not locale_data:
         raise LocaleDataMissingError("Employee", employee.id, locale)
@@ -272,10 +271,7 @@ def map_practice_area_to_public_response(
     Returns:
         PracticeAreaPublicResponse with data for the specified locale
     """
-    locale_data = next(
-        (loc for loc in practice_area.locales if loc.locale == locale),
-        practice_area.locales[0] if practice_area.locales else None
-    )
+    locale_data = _pick_locale(practice_area.locales, locale)
     
     if not locale_data:
         raise LocaleDataMissingError("PracticeArea", practice_area.id, locale)
@@ -313,10 +309,7 @@ def map_advantage_to_public_response(
     Returns:
         AdvantagePublicResponse with data for the specified locale
     """
-    locale_data = next(
-        (loc for loc in advantage.locales if loc.locale == locale),
-        advantage.locales[0] if advantage.locales else None
-    )
+    locale_data = _pick_locale(advantage.locales, locale)
     
     if not locale_data:
         raise LocaleDataMissingError("Advantage", advantage.id, locale)
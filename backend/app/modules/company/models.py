@@ -73,12 +73,16 @@ class Service(
         cascade="all, delete-orphan",
     )
 
+    # Fetch updated_at on UPDATE via RETURNING in the flush itself, so
+    # update() can return the instance without a refresh() round trip.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_services_tenant", "tenant_id"),
         Index(
             "ix_services_published",
             "tenant_id",
-            "is_published",
+            "sort_order",
             postgresql_where="deleted_at IS NULL AND is_published = true",
         ),
         CheckConstraint("price_from IS NULL OR price_from >= 0", name="ck_services_price_positive"),
@@ -137,7 +141,6 @@ class ServicePrice(Base, UUIDMixin, TimestampMixin):
         UniqueConstraint(
             "service_id", "locale", "currency", name="uq_service_prices_locale_currency"
         ),
-        Index("ix_service_prices_service_id", "service_id"),
         Index("ix_service_prices_locale", "service_id", "locale"),
         CheckConstraint("price >= 0", name="ck_service_prices_price_positive"),
         CheckConstraint("currency IN ('RUB', 'USD')", name="ck_service_prices_currency"),
@@ -164,7 +167,6 @@ class ServiceTag(Base, UUIDMixin, TimestampMixin):
         UniqueConstraint(
             "service_id", "locale", "tag", name="uq_service_tags_locale_tag"
         ),
-        Index("ix_service_tags_service_id", "service_id"),
         Index("ix_service_tags_locale", "service_id", "locale"),
         CheckConstraint("char_length(tag) >= 1", name="ck_service_tags_tag_length"),
     )
@@ -199,12 +201,14 @@ class PracticeArea(
         lazy="noload",
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_practice_areas_tenant", "tenant_id"),
         Index(
             "ix_practice_areas_published",
             "tenant_id",
-            "is_published",
+            "sort_order",
             postgresql_where="deleted_at IS NULL AND is_published = true",
         ),
     )
@@ -265,22 +269,26 @@ class Employee(
     locales: Mapped[list["EmployeeLocale"]] = relationship(
         "EmployeeLocale",
         back_populates="employee",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     practice_areas: Mapped[list["EmployeePracticeArea"]] = relationship(
         "EmployeePracticeArea",
         back_populates="employee",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
+    # Fetch updated_at on UPDATE via RETURNING in the flush itself, so
+    # photo updates can return the instance without a refresh() round trip.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_employees_tenant", "tenant_id"),
         Index(
             "ix_employees_published",
             "tenant_id",
-            "is_published",
+            "sort_order",
             postgresql_where="deleted_at IS NULL AND is_published = true",
         ),
     )
@@ -341,7 +349,6 @@ class EmployeePracticeArea(Base, UUIDMixin):
 
     __table_args__ = (
         UniqueConstraint("employee_id", "practice_area_id", name="uq_employee_practice_areas"),
-        Index("ix_employee_practice_areas_employee", "employee_id"),
         Index("ix_employee_practice_areas_practice_area", "practice_area_id"),
     )
 
@@ -366,16 +373,18 @@ class Advantage(
     locales: Mapped[list["AdvantageLocale"]] = relationship(
         "AdvantageLocale",
         back_populates="advantage",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_advantages_tenant", "tenant_id"),
         Index(
             "ix_advantages_published",
             "tenant_id",
-            "is_published",
+            "sort_order",
             postgresql_where="deleted_at IS NULL AND is_published = true",
         ),
     )
@@ -438,12 +447,19 @@ class Address(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin, TenantMixin, Sor
     locales: Mapped[list["AddressLocale"]] = relationship(
         "AddressLocale",
         back_populates="address",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_addresses_tenant", "tenant_id"),
+        Index(
+            "ix_addresses_primary",
+            "tenant_id",
+            postgresql_where="is_primary = true AND deleted_at IS NULL",
+        ),
         CheckConstraint(
             "address_type IN ('office', 'warehouse', 'showroom', 'other')",
             name="ck_addresses_type",
@@ -510,9 +526,16 @@ class Contact(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin, TenantMixin, Sor
     # Is primary for this type
     is_primary: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
-        Index("ix_contacts_tenant", "tenant_id"),
-        Index("ix_contacts_type", "tenant_id", "contact_type"),
+        # Admin and public lists: live contacts of a tenant by sort_order.
+        Index(
+            "ix_contacts_tenant_sort",
+            "tenant_id",
+            "sort_order",
+            postgresql_where="deleted_at IS NULL",
+        ),
         CheckConstraint(
             "contact_type IN ('phone', 'email', 'whatsapp', 'telegram', 'viber', 'facebook', 'instagram', 'linkedin', 'youtube', 'other')",
             name="ck_contacts_type",
@@ -2,18 +2,27 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Header,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import Filtering, Locale, Pagination, PublicTenantId
 from app.modules.media.upload_service import image_upload_service
 from app.core.security import PermissionChecker, get_current_tenant_id
+from app.middleware.cache import public_json_response
 from app.middleware.feature_check import require_team, require_team_public
-from app.modules.company.mappers import (
-    map_employee_to_public_response,
-    map_employees_to_public_response,
-)
+from app.modules.company.mappers import map_employee_to_public_response
 from app.modules.company.schemas import (
     ContentBlockForServiceResponse,
     EmployeeCreate,
@@ -36,6 +45,10 @@ from app.modules.content_blocks.service import ContentBlockService
 
 router = APIRouter()
 
+_EMPLOYEE_LIST_ADAPTER = TypeAdapter(list[EmployeeResponse])
+_CONTENT_BLOCK_LIST_ADAPTER = TypeAdapter(list[ContentBlockResponse])
+_EMBEDDED_BLOCK_LIST_ADAPTER = TypeAdapter(list[ContentBlockForServiceResponse])
+
 
 # ============================================================================
 # Public Routes - Employees
@@ -52,12 +65,13 @@ router = APIRouter()
 async def list_employees_public(
     locale: Locale,
     tenant_id: PublicTenantId,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> list[EmployeePublicResponse]:
+) -> Response:
     """List all published team members."""
     service = EmployeeService(db)
-    employees = await service.list_published(tenant_id, locale.locale)
-    return map_employees_to_public_response(employees, locale.locale)
+    payload = await service.list_published_json(tenant_id, locale.locale)
+    return public_json_response(payload, if_none_match)
 
 
 @router.get(
@@ -97,7 +111,9 @@ async def _employee_response_with_blocks(
     response = EmployeeResponse.model_validate(employee)
     return response.model_copy(
         update={
-            "content_blocks": [ContentBlockForServiceResponse.model_validate(b) for b in blocks]
+            "content_blocks": _EMBEDDED_BLOCK_LIST_ADAPTER.validate_python(
+                blocks, from_attributes=True
+            )
         }
     )
 
@@ -126,8 +142,8 @@ async def list_employees_admin(
         search=search,
     )
 
-    return EmployeeListResponse(
-        items=[EmployeeResponse.model_validate(e) for e in employees],
+    return EmployeeListResponse.model_construct(
+        items=_EMPLOYEE_LIST_ADAPTER.validate_python(employees, from_attributes=True),
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
@@ -216,6 +232,7 @@ async def delete_employee(
 )
 async def upload_employee_photo(
     employee_id: UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
@@ -230,9 +247,10 @@ async def upload_employee_photo(
         folder="employees",
         entity_id=employee_id,
         old_image_url=emp.photo_url,
+        background_tasks=background_tasks,
     )
     
-    emp = await service.update_photo_url(employee_id, tenant_id, new_url)
+    emp = await service.set_photo_url(emp, new_url)
     
     return EmployeeResponse.model_validate(emp)
 
@@ -246,16 +264,21 @@ async def upload_employee_photo(
 )
 async def delete_employee_photo(
     employee_id: UUID,
+    background_tasks: BackgroundTasks,
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    """Delete photo from employee."""
+    """Delete photo from employee.
+
+    The stored object is removed after the response is sent.
+    """
     service = EmployeeService(db)
     emp = await service.get_by_id(employee_id, tenant_id)
     
-    if emp.photo_url:
-        await image_upload_service.delete_image(emp.photo_url)
-        await service.update_photo_url(employee_id, tenant_id, None)
+    old_url = emp.photo_url
+    if old_url:
+        await service.set_photo_url(emp, None)
+        background_tasks.add_task(image_upload_service.delete_image, old_url)
 
 
 # ============================================================================
@@ -282,7 +305,7 @@ async def list_employee_content_blocks(
     await employee_service.get_by_id(employee_id, tenant_id)
     service = ContentBlockService(db)
     blocks = await service.list_blocks("employee", employee_id, tenant_id, locale)
-    return [ContentBlockResponse.model_validate(b) for b in blocks]
+    return _CONTENT_BLOCK_LIST_ADAPTER.validate_python(blocks, from_attributes=True)
 
 
 @router.post(
@@ -365,7 +388,7 @@ async def reorder_employee_content_blocks(
     blocks = await service.reorder_blocks(
         "employee", employee_id, tenant_id, data.locale, data.block_ids
     )
-    return [ContentBlockResponse.model_validate(b) for b in blocks]
+    return _CONTENT_BLOCK_LIST_ADAPTER.validate_python(blocks, from_attributes=True)
 
 
 # ============================================================================
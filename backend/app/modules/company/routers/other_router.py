@@ -2,18 +2,15 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.dependencies import Locale, PublicTenantId
+from app.core.dependencies import Locale, OptionalPagination, PublicTenantId
 from app.core.security import PermissionChecker, get_current_tenant_id
+from app.middleware.cache import public_json_response
 from app.middleware.feature_check import require_company, require_company_public
-from app.modules.company.mappers import (
-    map_advantage_to_public_response,
-    map_advantages_to_public_response,
-    map_practice_areas_to_public_response,
-)
 from app.modules.company.schemas import (
     AddressCreate,
     AddressListResponse,
@@ -52,6 +49,11 @@ from app.modules.company.services import (
 
 router = APIRouter()
 
+_PRACTICE_AREA_LIST_ADAPTER = TypeAdapter(list[PracticeAreaResponse])
+_ADVANTAGE_LIST_ADAPTER = TypeAdapter(list[AdvantageResponse])
+_ADDRESS_LIST_ADAPTER = TypeAdapter(list[AddressResponse])
+_CONTACT_LIST_ADAPTER = TypeAdapter(list[ContactResponse])
+
 
 # ============================================================================
 # Public Routes - Practice Areas, Advantages, Contacts
@@ -68,12 +70,13 @@ router = APIRouter()
 async def list_practice_areas_public(
     locale: Locale,
     tenant_id: PublicTenantId,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> list[PracticeAreaPublicResponse]:
+) -> Response:
     """List all published practice areas."""
     service = PracticeAreaService(db)
-    areas = await service.list_published(tenant_id, locale.locale)
-    return map_practice_areas_to_public_response(areas, locale.locale)
+    payload = await service.list_published_json(tenant_id, locale.locale)
+    return public_json_response(payload, if_none_match)
 
 
 @router.get(
@@ -86,12 +89,13 @@ async def list_practice_areas_public(
 async def list_advantages_public(
     locale: Locale,
     tenant_id: PublicTenantId,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> list[AdvantagePublicResponse]:
+) -> Response:
     """List all published advantages."""
     service = AdvantageService(db)
-    advantages = await service.list_published(tenant_id, locale.locale)
-    return map_advantages_to_public_response(advantages, locale.locale)
+    payload = await service.list_published_json(tenant_id, locale.locale)
+    return public_json_response(payload, if_none_match)
 
 
 @router.get(
@@ -103,16 +107,13 @@ async def list_advantages_public(
 )
 async def get_contacts_public(
     tenant_id: PublicTenantId,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> ContactsPublicResponse:
+) -> Response:
     """Get all contact information."""
     service = ContactService(db)
-    addresses, contacts = await service.get_contacts(tenant_id)
-
-    return ContactsPublicResponse(
-        addresses=[AddressResponse.model_validate(a) for a in addresses],
-        contacts=[ContactResponse.model_validate(c) for c in contacts],
-    )
+    payload = await service.get_contacts_public_json(tenant_id)
+    return public_json_response(payload, if_none_match)
 
 
 # ============================================================================
@@ -128,15 +129,27 @@ async def get_contacts_public(
     dependencies=[require_company, Depends(PermissionChecker("services:read"))],
 )
 async def list_practice_areas_admin(
+    pagination: OptionalPagination,
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> PracticeAreaListResponse:
-    """List all practice areas."""
+    """List all practice areas, or one page when ``page``/``page_size`` is given."""
     service = PracticeAreaService(db)
-    items = await service.list_all(tenant_id)
-    return PracticeAreaListResponse(
-        items=[PracticeAreaResponse.model_validate(i) for i in items],
-        total=len(items),
+    if not pagination.is_set:
+        items = await service.list_all(tenant_id)
+        return PracticeAreaListResponse.model_construct(
+            items=_PRACTICE_AREA_LIST_ADAPTER.validate_python(items, from_attributes=True),
+            total=len(items),
+            page=None,
+            page_size=None,
+        )
+
+    items, total = await service.list_paginated(tenant_id, pagination.page, pagination.page_size)
+    return PracticeAreaListResponse.model_construct(
+        items=_PRACTICE_AREA_LIST_ADAPTER.validate_python(items, from_attributes=True),
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
     )
 
 
@@ -285,15 +298,27 @@ async def delete_practice_area_locale(
     dependencies=[require_company, Depends(PermissionChecker("services:read"))],
 )
 async def list_advantages_admin(
+    pagination: OptionalPagination,
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> AdvantageListResponse:
-    """List all advantages."""
+    """List all advantages, or one page when ``page``/``page_size`` is given."""
     service = AdvantageService(db)
-    items = await service.list_all(tenant_id)
-    return AdvantageListResponse(
-        items=[AdvantageResponse.model_validate(i) for i in items],
-        total=len(items),
+    if not pagination.is_set:
+        items = await service.list_all(tenant_id)
+        return AdvantageListResponse.model_construct(
+            items=_ADVANTAGE_LIST_ADAPTER.validate_python(items, from_attributes=True),
+            total=len(items),
+            page=None,
+            page_size=None,
+        )
+
+    items, total = await service.list_paginated(tenant_id, pagination.page, pagination.page_size)
+    return AdvantageListResponse.model_construct(
+        items=_ADVANTAGE_LIST_ADAPTER.validate_python(items, from_attributes=True),
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
     )
 
 
@@ -442,15 +467,27 @@ async def delete_advantage_locale(
     dependencies=[require_company, Depends(PermissionChecker("settings:read"))],
 )
 async def list_addresses_admin(
+    pagination: OptionalPagination,
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> AddressListResponse:
-    """List all addresses."""
+    """List all addresses, or one page when ``page``/``page_size`` is given."""
     service = ContactService(db)
-    items = await service.list_addresses(tenant_id)
-    return AddressListResponse(
-        items=[AddressResponse.model_validate(i) for i in items],
-        total=len(items),
+    if not pagination.is_set:
+        items = await service.list_addresses(tenant_id)
+        return AddressListResponse.model_construct(
+            items=_ADDRESS_LIST_ADAPTER.validate_python(items, from_attributes=True),
+            total=len(items),
+            page=None,
+            page_size=None,
+        )
+
+    items, total = await service.list_addresses_paginated(tenant_id, pagination.page, pagination.page_size)
+    return AddressListResponse.model_construct(
+        items=_ADDRESS_LIST_ADAPTER.validate_python(items, from_attributes=True),
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
     )
 
 
@@ -599,15 +636,27 @@ async def delete_address_locale(
     dependencies=[require_company, Depends(PermissionChecker("settings:read"))],
 )
 async def list_contacts_admin(
+    pagination: OptionalPagination,
     tenant_id: UUID = Depends(get_current_tenant_id),
     db: AsyncSession = Depends(get_db),
 ) -> ContactListResponse:
-    """List all contacts."""
+    """List all contacts, or one page when ``page``/``page_size`` is given."""
     service = ContactService(db)
-    items = await service.list_contacts(tenant_id)
-    return ContactListResponse(
-        items=[ContactResponse.model_validate(i) for i in items],
-        total=len(items),
+    if not pagination.is_set:
+        items = await service.list_contacts(tenant_id)
+        return ContactListResponse.model_construct(
+            items=_CONTACT_LIST_ADAPTER.validate_python(items, from_attributes=True),
+            total=len(items),
+            page=None,
+            page_size=None,
+        )
+
+    items, total = await service.list_contacts_paginated(tenant_id, pagination.page, pagination.page_size)
+    return ContactListResponse.model_construct(
+        items=_CONTACT_LIST_ADAPTER.validate_python(items, from_attributes=True),
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
     )
 
 
@@ -2,18 +2,17 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, Query, Response, UploadFile, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import Filtering, Locale, Pagination, PublicTenantId
 from app.modules.media.upload_service import image_upload_service
 from app.core.security import PermissionChecker, get_current_tenant_id
+from app.middleware.cache import public_json_response
 from app.middleware.feature_check import require_services, require_services_public
-from app.modules.company.mappers import (
-    map_service_to_public_response,
-    map_services_to_public_response,
-)
+from app.modules.company.mappers import map_service_to_public_response
 from app.modules.company.schemas import (
     ContentBlockForServiceResponse,
     ServiceCreate,
@@ -42,6 +41,10 @@ from app.modules.content_blocks.service import ContentBlockService
 
 router = APIRouter()
 
+_SERVICE_LIST_ADAPTER = TypeAdapter(list[ServiceResponse])
+_CONTENT_BLOCK_LIST_ADAPTER = TypeAdapter(list[ContentBlockResponse])
+_EMBEDDED_BLOCK_LIST_ADAPTER = TypeAdapter(list[ContentBlockForServiceResponse])
+
 
 # ============================================================================
 # Public Routes - Services
@@ -58,12 +61,13 @@ router = APIRouter()
 async def list_services_public(
     locale: Locale,
     tenant_id: PublicTenantId,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     db: AsyncSession = Depends(get_db),
-) -> list[ServicePublicResponse]:
+) -> Response:
     """List all published services for public display."""
     service = ServiceService(db)
-    services = await service.list_published(tenant_id, locale.locale)
-    return map_services_to_public_response(services, locale.locale)
+    payload = await service.list_published_json(tenant_id, locale.locale)
+    return public_json_response(payload, if_none_match)
 
 
 @router.get(
@@ -121,7 +125,9 @@ async def _service_response_with_blocks(
     response = ServiceResponse.model_validate(svc)
     return response.model_copy(
         update={
-            "content_blocks": [ContentBlockForServiceResponse.model_validate(b) for b in blocks]
+            "content_blocks": _EMBEDDED_BLOCK_LIST_ADAPTER.validate_python(
+                blocks, from_attributes=True
+            )
         }
     )
 
@@ -148,8 +154,8 @@ async def list_services_admin(
         is_published=filtering.is_published,
     )
 
-    return ServiceListResponse(
-        items=[ServiceResponse.model_validate(s) for s in services],
+    return ServiceListResponse.model_construct(
+        items=_SERVICE_LIST_ADAPTER.validate_python(services, from_attributes=True),
         total=total,
         page=pagination.page,
         page_size=pagination.page_size,
@@ -208,8 +214,7 @@ async def update_service(
 ) -> ServiceResponse:
     """Update a service."""
     service = ServiceService(db)
-    await service.update(service_id, tenant_id, data)
-    updated = await service.get_by_id(service_id, tenant_id)
+    updated = await service.update(service_id, tenant_id, data)
     return await _service_response_with_blocks(updated, db, tenant_id)
 
 
@@ -255,7 +260,7 @@ async def upload_service_image(
         old_image_url=svc.image_url,
     )
     
-    svc = await service.update_image_url(service_id, tenant_id, new_url)
+    svc = await service.set_image_url(svc, new_url)
     
     return await _service_response_with_blocks(svc, db, tenant_id)
 
@@ -278,7 +283,7 @@ async def delete_service_image(
     
     if svc.image_url:
         await image_upload_service.delete_image(svc.image_url)
-        await service.update_image_url(service_id, tenant_id, None)
+        await service.set_image_url(svc, None)
 
 
 # ============================================================================
@@ -495,7 +500,7 @@ async def list_service_content_blocks(
     
     service = ContentBlockService(db)
     blocks = await service.list_blocks("service", service_id, tenant_id, locale)
-    return [ContentBlockResponse.model_validate(b) for b in blocks]
+    return _CONTENT_BLOCK_LIST_ADAPTER.validate_python(blocks, from_attributes=True)
 
 
 @router.post(
@@ -576,4 +581,4 @@ async def reorder_service_content_blocks(
     """Reorder content blocks for a service in a specific locale."""
     service = ContentBlockService(db)
     blocks = await service.reorder_blocks("service", service_id, tenant_id, data.locale, data.block_ids)
-    return [ContentBlockResponse.model_validate(b) for b in blocks]
+    return _CONTENT_BLOCK_LIST_ADAPTER.validate_python(blocks, from_attributes=True)
@@ -512,6 +512,9 @@ class PracticeAreaListResponse(BaseModel):
 
     items: list[PracticeAreaResponse]
     total: int
+    # Set only when the list was requested page by page.
+    page: int | None = None
+    page_size: int | None = None
 
 
 # ============================================================================
@@ -602,6 +605,9 @@ class AdvantageListResponse(BaseModel):
 
     items: list[AdvantageResponse]
     total: int
+    # Set only when the list was requested page by page.
+    page: int | None = None
+    page_size: int | None = None
 
 
 # ============================================================================
@@ -711,6 +717,9 @@ class AddressListResponse(BaseModel):
 
     items: list[AddressResponse]
     total: int
+    # Set only when the list was requested page by page.
+    page: int | None = None
+    page_size: int | None = None
 
 
 class ContactCreate(ContactBase):
@@ -746,6 +755,9 @@ class ContactListResponse(BaseModel):
 
     items: list[ContactResponse]
     total: int
+    # Set only when the list was requested page by page.
+    page: int | None = None
+    page_size: int | None = None
 
 
 class ContactsPublicResponse(BaseModel):
@@ -2,12 +2,15 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.base_service import BaseService
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
+from app.core.pagination import paginate_query
+from app.core.redis import get_public_list_cache
 from app.modules.localization.helpers import (
     LocaleAlreadyExistsError,
     MinimumLocalesError,
@@ -16,6 +19,7 @@ from app.modules.localization.helpers import (
     get_locale_by_id,
     update_locale_fields,
 )
+from app.modules.company.mappers import map_advantages_to_public_response
 from app.modules.company.models import (
     Advantage,
     AdvantageLocale,
@@ -24,10 +28,14 @@ from app.modules.company.schemas import (
     AdvantageCreate,
     AdvantageLocaleCreate,
     AdvantageLocaleUpdate,
+    AdvantagePublicResponse,
     AdvantageUpdate,
 )
 
 
+_PUBLIC_LIST_ADAPTER = TypeAdapter(list[AdvantagePublicResponse])
+
+
 class AdvantageService(BaseService[Advantage]):
     """Service for managing advantages."""
 
@@ -51,6 +59,20 @@ class AdvantageService(BaseService[Advantage]):
             order_by=[Advantage.sort_order],
         )
 
+    async def list_paginated(
+        self, tenant_id: UUID, page: int = 1, page_size: int = 20
+    ) -> tuple[list[Advantage], int]:
+        """List one page of advantages for admin, with the total count."""
+        return await paginate_query(
+            self.db,
+            self._build_base_query(tenant_id),
+            page,
+            page_size,
+            options=self._get_default_options(),
+            order_by=[Advantage.sort_order, Advantage.created_at.desc(), Advantage.id],
+            window_count=True,
+        )
+
     async def list_published(self, tenant_id: UUID, locale: str) -> list[Advantage]:
         """List published advantages."""
         # Filter by locale at database level to ensure only items with the locale are returned
@@ -61,12 +83,35 @@ class AdvantageService(BaseService[Advantage]):
             .where(Advantage.deleted_at.is_(None))
             .where(Advantage.is_published.is_(True))
             .where(AdvantageLocale.locale == locale)
-            .options(selectinload(Advantage.locales))
+            .options(selectinload(Advantage.locales), raiseload("*"))
             .order_by(Advantage.sort_order)
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def list_published_json(self, tenant_id: UUID, locale: str) -> str:
+        """List published advantages as the public JSON response, cached in Redis."""
+        cache = await get_public_list_cache()
+        if cache:
+            cached = await cache.get(str(tenant_id), "advantages", locale)
+            if cached is not None:
+                return cached
+
+        advantages = await self.list_published(tenant_id, locale)
+        payload = _PUBLIC_LIST_ADAPTER.dump_json(
+            map_advantages_to_public_response(advantages, locale)
+        ).decode()
+
+        if cache:
+            await cache.set(str(tenant_id), "advantages", locale, payload)
+        return payload
+
+    async def _invalidate_public_cache(self, tenant_id: UUID) -> None:
+        """Drop cached public lists so the next read sees this write."""
+        cache = await get_public_list_cache()
+        if cache:
+            await cache.invalidate(str(tenant_id), "advantages")
+
     @transactional
     async def create(self, tenant_id: UUID, data: AdvantageCreate) -> Advantage:
         """Create an advantage."""
@@ -75,21 +120,12 @@ class AdvantageService(BaseService[Advantage]):
             icon=data.icon,
             is_published=data.is_published,
             sort_order=data.sort_order,
+            locales=[AdvantageLocale(**locale_data.model_dump()) for locale_data in data.locales],
         )
         self.db.add(adv)
         await self.db.flush()
 
-        for locale_data in data.locales:
-            locale = AdvantageLocale(
-                advantage_id=adv.id,
-                **locale_data.model_dump(),
-            )
-            self.db.add(locale)
-
-        await self.db.flush()
-        await self.db.refresh(adv)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(adv, ["locales"])
-
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return adv
 
     @transactional
@@ -103,15 +139,15 @@ class AdvantageService(BaseService[Advantage]):
             setattr(adv, field, value)
 
         await self.db.flush()
-        await self.db.refresh(adv)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(adv, ["locales"])
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return adv
 
     @transactional
     async def soft_delete(self, adv_id: UUID, tenant_id: UUID) -> None:
         """Soft delete an advantage."""
         await self._soft_delete(adv_id, tenant_id)
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     # ========== Locale Management ==========
 
@@ -137,6 +173,7 @@ class AdvantageService(BaseService[Advantage]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -158,6 +195,7 @@ class AdvantageService(BaseService[Advantage]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -177,3 +215,4 @@ class AdvantageService(BaseService[Advantage]):
         )
         await self.db.delete(locale)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
@@ -2,12 +2,15 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
 from app.core.exceptions import NotFoundError
+from app.core.pagination import paginate_query
+from app.core.redis import get_public_list_cache
 from app.modules.localization.helpers import (
     LocaleAlreadyExistsError,
     MinimumLocalesError,
@@ -25,12 +28,19 @@ from app.modules.company.schemas import (
     AddressCreate,
     AddressLocaleCreate,
     AddressLocaleUpdate,
+    AddressResponse,
     AddressUpdate,
     ContactCreate,
+    ContactResponse,
+    ContactsPublicResponse,
     ContactUpdate,
 )
 
 
+_ADDRESS_LIST_ADAPTER = TypeAdapter(list[AddressResponse])
+_CONTACT_LIST_ADAPTER = TypeAdapter(list[ContactResponse])
+
+
 class ContactService:
     """Service for managing contacts and addresses."""
 
@@ -38,17 +48,21 @@ class ContactService:
         self.db = db
 
     async def get_contacts(self, tenant_id: UUID) -> tuple[list[Address], list[Contact]]:
-        """Get all contacts and addresses for a tenant."""
-        # Get addresses
+        """Get all contacts and addresses for a tenant.
+
+        Two round trips: addresses with their locales joined in (a tenant
+        has a handful of each, so the joined rows stay small), then contacts.
+        """
+        # Get addresses, primary first (a tenant has a handful, so the sort is cheap)
         addr_stmt = (
             select(Address)
             .where(Address.tenant_id == tenant_id)
             .where(Address.deleted_at.is_(None))
-            .options(selectinload(Address.locales))
-            .order_by(Address.sort_order)
+            .options(joinedload(Address.locales))
+            .order_by(Address.is_primary.desc(), Address.sort_order)
         )
         addr_result = await self.db.execute(addr_stmt)
-        addresses = list(addr_result.scalars().all())
+        addresses = list(addr_result.unique().scalars().all())
 
         # Get contacts
         contact_stmt = (
@@ -62,6 +76,30 @@ class ContactService:
 
         return addresses, contacts
 
+    async def get_contacts_public_json(self, tenant_id: UUID) -> str:
+        """Get contacts and addresses as the public JSON response, cached in Redis."""
+        cache = await get_public_list_cache()
+        if cache:
+            cached = await cache.get(str(tenant_id), "contacts")
+            if cached is not None:
+                return cached
+
+        addresses, contacts = await self.get_contacts(tenant_id)
+        payload = ContactsPublicResponse.model_construct(
+            addresses=_ADDRESS_LIST_ADAPTER.validate_python(addresses, from_attributes=True),
+            contacts=_CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True),
+        ).model_dump_json()
+
+        if cache:
+            await cache.set(str(tenant_id), "contacts", None, payload)
+        return payload
+
+    async def _invalidate_public_cache(self, tenant_id: UUID) -> None:
+        """Drop the cached public contacts so the next read sees this write."""
+        cache = await get_public_list_cache()
+        if cache:
+            await cache.invalidate(str(tenant_id), "contacts")
+
     @transactional
     async def create_address(self, tenant_id: UUID, data: AddressCreate) -> Address:
         """Create an address."""
@@ -75,21 +113,12 @@ class ContactService:
             email=data.email,
             is_primary=data.is_primary,
             sort_order=data.sort_order,
+            locales=[AddressLocale(**locale_data.model_dump()) for locale_data in data.locales],
         )
         self.db.add(address)
         await self.db.flush()
 
-        for locale_data in data.locales:
-            locale = AddressLocale(
-                address_id=address.id,
-                **locale_data.model_dump(),
-            )
-            self.db.add(locale)
-
-        await self.db.flush()
-        await self.db.refresh(address)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(address, ["locales"])
-
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return address
 
     @transactional
@@ -98,8 +127,8 @@ class ContactService:
         contact = Contact(tenant_id=tenant_id, **data.model_dump())
         self.db.add(contact)
         await self.db.flush()
-        await self.db.refresh(contact)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return contact
 
     async def get_address_by_id(self, address_id: UUID, tenant_id: UUID) -> Address:
@@ -147,6 +176,25 @@ class ContactService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_addresses_paginated(
+        self, tenant_id: UUID, page: int = 1, page_size: int = 20
+    ) -> tuple[list[Address], int]:
+        """List one page of addresses, with the total count."""
+        stmt = (
+            select(Address)
+            .where(Address.tenant_id == tenant_id)
+            .where(Address.deleted_at.is_(None))
+        )
+        return await paginate_query(
+            self.db,
+            stmt,
+            page,
+            page_size,
+            options=[selectinload(Address.locales)],
+            order_by=[Address.sort_order, Address.created_at.desc(), Address.id],
+            window_count=True,
+        )
+
     async def list_contacts(self, tenant_id: UUID) -> list[Contact]:
         """List all contacts."""
         stmt = (
@@ -158,6 +206,24 @@ class ContactService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_contacts_paginated(
+        self, tenant_id: UUID, page: int = 1, page_size: int = 20
+    ) -> tuple[list[Contact], int]:
+        """List one page of contacts, with the total count."""
+        stmt = (
+            select(Contact)
+            .where(Contact.tenant_id == tenant_id)
+            .where(Contact.deleted_at.is_(None))
+        )
+        return await paginate_query(
+            self.db,
+            stmt,
+            page,
+            page_size,
+            order_by=[Contact.sort_order, Contact.created_at.desc(), Contact.id],
+            window_count=True,
+        )
+
     @transactional
     async def update_address(
         self, address_id: UUID, tenant_id: UUID, data: AddressUpdate
@@ -170,9 +236,8 @@ class ContactService:
             setattr(address, field, value)
 
         await self.db.flush()
-        await self.db.refresh(address)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(address, ["locales"])
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return address
 
     @transactional
@@ -187,8 +252,8 @@ class ContactService:
             setattr(contact, field, value)
 
         await self.db.flush()
-        await self.db.refresh(contact)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return contact
 
     @transactional
@@ -197,6 +262,7 @@ class ContactService:
         address = await self.get_address_by_id(address_id, tenant_id)
         address.soft_delete()
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     @transactional
     async def soft_delete_contact(self, contact_id: UUID, tenant_id: UUID) -> None:
@@ -204,6 +270,7 @@ class ContactService:
         contact = await self.get_contact_by_id(contact_id, tenant_id)
         contact.soft_delete()
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     # ========== Address Locale Management ==========
 
@@ -229,6 +296,7 @@ class ContactService:
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -252,6 +320,7 @@ class ContactService:
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -271,3 +340,4 @@ class ContactService:
         )
         await self.db.delete(locale)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
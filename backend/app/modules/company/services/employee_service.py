@@ -3,14 +3,16 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.base_service import BaseService, update_many_to_many
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
 from app.core.exceptions import NotFoundError
 from app.core.pagination import paginate_query
+from app.core.redis import get_public_list_cache
 from app.modules.localization.helpers import (
     LocaleAlreadyExistsError,
     MinimumLocalesError,
@@ -20,6 +22,7 @@ from app.modules.localization.helpers import (
     get_locale_by_id,
     update_locale_fields,
 )
+from app.modules.company.mappers import map_employees_to_public_response
 from app.modules.company.models import (
     Employee,
     EmployeeLocale,
@@ -29,10 +32,14 @@ from app.modules.company.schemas import (
     EmployeeCreate,
     EmployeeLocaleCreate,
     EmployeeLocaleUpdate,
+    EmployeePublicResponse,
     EmployeeUpdate,
 )
 
 
+_PUBLIC_LIST_ADAPTER = TypeAdapter(list[EmployeePublicResponse])
+
+
 class EmployeeService(BaseService[Employee]):
     """Service for managing employees."""
 
@@ -90,13 +97,21 @@ class EmployeeService(BaseService[Employee]):
         base_query = self._build_base_query(tenant_id, filters=filters)
 
         if search:
+            # EXISTS instead of a join + DISTINCT: one row per employee, so
+            # the total can come from COUNT(*) OVER () on the page query.
             search_pattern = f"%{search}%"
-            base_query = base_query.outerjoin(EmployeeLocale).where(
-                (EmployeeLocale.first_name.ilike(search_pattern)) |
-                (EmployeeLocale.last_name.ilike(search_pattern)) |
-                (EmployeeLocale.position.ilike(search_pattern)) |
-                (Employee.email.ilike(search_pattern))
-            ).distinct()
+            locale_match = (
+                select(EmployeeLocale.id)
+                .where(EmployeeLocale.employee_id == Employee.id)
+                .where(
+                    (EmployeeLocale.first_name.ilike(search_pattern)) |
+                    (EmployeeLocale.last_name.ilike(search_pattern)) |
+                    (EmployeeLocale.position.ilike(search_pattern))
+                )
+            )
+            base_query = base_query.where(
+                locale_match.exists() | Employee.email.ilike(search_pattern)
+            )
 
         return await paginate_query(
             self.db,
@@ -105,7 +120,7 @@ class EmployeeService(BaseService[Employee]):
             page_size,
             options=[selectinload(Employee.locales)],
             order_by=[Employee.sort_order, Employee.created_at.desc()],
-            unique=True,
+            window_count=True,
         )
 
     async def list_published(self, tenant_id: UUID, locale: str) -> list[Employee]:
@@ -118,16 +133,44 @@ class EmployeeService(BaseService[Employee]):
             .where(Employee.deleted_at.is_(None))
             .where(Employee.is_published.is_(True))
             .where(EmployeeLocale.locale == locale)
-            .options(selectinload(Employee.locales))
+            # practice_areas is not part of the public response; raiseload
+            # keeps it unloaded and flags any stray lazy load.
+            .options(selectinload(Employee.locales), raiseload("*"))
             .order_by(Employee.sort_order)
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def list_published_json(self, tenant_id: UUID, locale: str) -> str:
+        """List published employees as the public JSON response, cached in Redis."""
+        cache = await get_public_list_cache()
+        if cache:
+            cached = await cache.get(str(tenant_id), "employees", locale)
+            if cached is not None:
+                return cached
+
+        employees = await self.list_published(tenant_id, locale)
+        payload = _PUBLIC_LIST_ADAPTER.dump_json(
+            map_employees_to_public_response(employees, locale)
+        ).decode()
+
+        if cache:
+            await cache.set(str(tenant_id), "employees", locale, payload)
+        return payload
+
+    async def _invalidate_public_cache(self, tenant_id: UUID) -> None:
+        """Drop cached public lists so the next read sees this write."""
+        cache = await get_public_list_cache()
+        if cache:
+            await cache.invalidate(str(tenant_id), "employees")
+
     @transactional
     async def create(self, tenant_id: UUID, data: EmployeeCreate) -> Employee:
         """Create a new employee."""
-        # Create employee (photo_url is set via separate endpoint)
+        # Create employee (photo_url is set via separate endpoint) with its
+        # locales and practice area links as populated collections: one
+        # flush inserts everything, server defaults come back via RETURNING
+        # and the collections stay loaded, so no refresh is needed.
         employee = Employee(
             tenant_id=tenant_id,
             email=data.email,
@@ -136,27 +179,18 @@ class EmployeeService(BaseService[Employee]):
             telegram_url=data.telegram_url,
             is_published=data.is_published,
             sort_order=data.sort_order,
+            locales=[
+                EmployeeLocale(**locale_data.model_dump()) for locale_data in data.locales
+            ],
+            practice_areas=[
+                EmployeePracticeArea(practice_area_id=pa_id)
+                for pa_id in dict.fromkeys(data.practice_area_ids)
+            ],
         )
         self.db.add(employee)
         await self.db.flush()
 
-        # Create locales
-        for locale_data in data.locales:
-            locale = EmployeeLocale(
-                employee_id=employee.id,
-                **locale_data.model_dump(),
-            )
-            self.db.add(locale)
-
-        # Add practice areas
-        for pa_id in data.practice_area_ids:
-            epa = EmployeePracticeArea(employee_id=employee.id, practice_area_id=pa_id)
-            self.db.add(epa)
-
-        await self.db.flush()
-        await self.db.refresh(employee)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(employee, ["locales", "practice_areas"])
-
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return employee
 
     @transactional
@@ -186,10 +220,12 @@ class EmployeeService(BaseService[Employee]):
                 "practice_area_id",
             )
 
+        # Only the practice area links replaced above need reloading.
         await self.db.flush()
-        await self.db.refresh(employee)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(employee, ["locales", "practice_areas"])
+        if data.practice_area_ids is not None:
+            await self.db.refresh(employee, ["practice_areas"])
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return employee
 
     @transactional
@@ -198,16 +234,28 @@ class EmployeeService(BaseService[Employee]):
     ) -> "Employee":
         """Update or clear the employee photo URL."""
         employee = await self.get_by_id(employee_id, tenant_id)
+        return await self._apply_photo_url(employee, url)
+
+    @transactional
+    async def set_photo_url(self, employee: Employee, url: str | None) -> Employee:
+        """Update or clear the photo URL of an already-loaded employee.
+
+        Use when the caller already holds the employee in this session
+        (e.g. fetched for the old photo URL) to skip a second ``get_by_id``.
+        """
+        return await self._apply_photo_url(employee, url)
+
+    async def _apply_photo_url(self, employee: Employee, url: str | None) -> Employee:
         employee.photo_url = url
         await self.db.flush()
-        await self.db.refresh(employee)
-        await self.db.refresh(employee, ["locales", "practice_areas"])
+        after_commit(self.db, self._invalidate_public_cache, employee.tenant_id)
         return employee
 
     @transactional
     async def soft_delete(self, employee_id: UUID, tenant_id: UUID) -> None:
         """Soft delete an employee."""
         await self._soft_delete(employee_id, tenant_id)
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     # ========== Locale Management ==========
 
@@ -239,6 +287,7 @@ class EmployeeService(BaseService[Employee]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -270,6 +319,7 @@ class EmployeeService(BaseService[Employee]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -289,3 +339,4 @@ class EmployeeService(BaseService[Employee]):
         )
         await self.db.delete(locale)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
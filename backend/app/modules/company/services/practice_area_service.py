@@ -2,12 +2,15 @@
 
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.base_service import BaseService
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
+from app.core.pagination import paginate_query
+from app.core.redis import get_public_list_cache
 from app.modules.localization.helpers import (
     LocaleAlreadyExistsError,
     MinimumLocalesError,
@@ -17,6 +20,7 @@ from app.modules.localization.helpers import (
     get_locale_by_id,
     update_locale_fields,
 )
+from app.modules.company.mappers import map_practice_areas_to_public_response
 from app.modules.company.models import (
     PracticeArea,
     PracticeAreaLocale,
@@ -25,10 +29,14 @@ from app.modules.company.schemas import (
     PracticeAreaCreate,
     PracticeAreaLocaleCreate,
     PracticeAreaLocaleUpdate,
+    PracticeAreaPublicResponse,
     PracticeAreaUpdate,
 )
 
 
+_PUBLIC_LIST_ADAPTER = TypeAdapter(list[PracticeAreaPublicResponse])
+
+
 class PracticeAreaService(BaseService[PracticeArea]):
     """Service for managing practice areas."""
 
@@ -52,6 +60,20 @@ class PracticeAreaService(BaseService[PracticeArea]):
             order_by=[PracticeArea.sort_order],
         )
 
+    async def list_paginated(
+        self, tenant_id: UUID, page: int = 1, page_size: int = 20
+    ) -> tuple[list[PracticeArea], int]:
+        """List one page of practice areas for admin, with the total count."""
+        return await paginate_query(
+            self.db,
+            self._build_base_query(tenant_id),
+            page,
+            page_size,
+            options=self._get_default_options(),
+            order_by=[PracticeArea.sort_order, PracticeArea.created_at.desc(), PracticeArea.id],
+            window_count=True,
+        )
+
     async def list_published(self, tenant_id: UUID, locale: str) -> list[PracticeArea]:
         """List published practice areas."""
         # Filter by locale at database level to ensure only items with the locale are returned
@@ -62,12 +84,35 @@ class PracticeAreaService(BaseService[PracticeArea]):
             .where(PracticeArea.deleted_at.is_(None))
             .where(PracticeArea.is_published.is_(True))
             .where(PracticeAreaLocale.locale == locale)
-            .options(selectinload(PracticeArea.locales))
+            .options(selectinload(PracticeArea.locales), raiseload("*"))
             .order_by(PracticeArea.sort_order)
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def list_published_json(self, tenant_id: UUID, locale: str) -> str:
+        """List published practice areas as the public JSON response, cached in Redis."""
+        cache = await get_public_list_cache()
+        if cache:
+            cached = await cache.get(str(tenant_id), "practice_areas", locale)
+            if cached is not None:
+                return cached
+
+        areas = await self.list_published(tenant_id, locale)
+        payload = _PUBLIC_LIST_ADAPTER.dump_json(
+            map_practice_areas_to_public_response(areas, locale)
+        ).decode()
+
+        if cache:
+            await cache.set(str(tenant_id), "practice_areas", locale, payload)
+        return payload
+
+    async def _invalidate_public_cache(self, tenant_id: UUID) -> None:
+        """Drop cached public lists so the next read sees this write."""
+        cache = await get_public_list_cache()
+        if cache:
+            await cache.invalidate(str(tenant_id), "practice_areas")
+
     @transactional
     async def create(self, tenant_id: UUID, data: PracticeAreaCreate) -> PracticeArea:
         """Create a practice area."""
@@ -76,21 +121,12 @@ class PracticeAreaService(BaseService[PracticeArea]):
             icon=data.icon,
             is_published=data.is_published,
             sort_order=data.sort_order,
+            locales=[PracticeAreaLocale(**locale_data.model_dump()) for locale_data in data.locales],
         )
         self.db.add(pa)
         await self.db.flush()
 
-        for locale_data in data.locales:
-            locale = PracticeAreaLocale(
-                practice_area_id=pa.id,
-                **locale_data.model_dump(),
-            )
-            self.db.add(locale)
-
-        await self.db.flush()
-        await self.db.refresh(pa)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(pa, ["locales"])
-
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return pa
 
     @transactional
@@ -104,15 +140,15 @@ class PracticeAreaService(BaseService[PracticeArea]):
             setattr(pa, field, value)
 
         await self.db.flush()
-        await self.db.refresh(pa)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(pa, ["locales"])
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return pa
 
     @transactional
     async def soft_delete(self, pa_id: UUID, tenant_id: UUID) -> None:
         """Soft delete a practice area."""
         await self._soft_delete(pa_id, tenant_id)
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     # ========== Locale Management ==========
 
@@ -144,6 +180,7 @@ class PracticeAreaService(BaseService[PracticeArea]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -172,6 +209,7 @@ class PracticeAreaService(BaseService[PracticeArea]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -191,3 +229,4 @@ class PracticeAreaService(BaseService[PracticeArea]):
         )
         await self.db.delete(locale)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
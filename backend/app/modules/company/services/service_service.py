@@ -1,20 +1,33 @@
 """Company module - service service."""
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    SQLColumnExpression,
+    Text,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_loader_criteria
+from sqlalchemy.orm.util import LoaderCriteriaOption
 
 from app.core.base_service import BaseService
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
 from app.core.exceptions import (
     DuplicatePriceError,
     DuplicateTagError,
     NotFoundError,
 )
 from app.core.pagination import paginate_query
+from app.core.redis import get_public_list_cache
 from app.modules.localization.helpers import (
     LocaleAlreadyExistsError,
     MinimumLocalesError,
@@ -36,10 +49,34 @@ from app.modules.company.schemas import (
     ServiceLocaleUpdate,
     ServicePriceCreate,
     ServicePriceUpdate,
+    ServicePublicResponse,
     ServiceTagCreate,
     ServiceUpdate,
 )
 
+_PUBLIC_LIST_ADAPTER = TypeAdapter(list[ServicePublicResponse])
+
+
+def _json_object(**fields: SQLColumnExpression[Any]) -> ColumnElement[Any]:
+    """``jsonb_build_object`` with the keys inlined as SQL literals."""
+    args: list[SQLColumnExpression[Any]] = []
+    for key, value in fields.items():
+        args.extend((literal_column(f"'{key}'"), value))
+    return func.jsonb_build_object(*args)
+
+
+def _locale_criteria(locale: str) -> list[LoaderCriteriaOption]:
+    """Limit locales, prices and tags loaded for a public read to *locale*.
+
+    The public mappers only use rows of the requested locale, so the other
+    locales' rows are filtered out in SQL instead of being loaded.
+    """
+    return [
+        with_loader_criteria(ServiceLocale, ServiceLocale.locale == locale),
+        with_loader_criteria(ServicePrice, ServicePrice.locale == locale),
+        with_loader_criteria(ServiceTag, ServiceTag.locale == locale),
+    ]
+
 
 class ServiceService(BaseService[Service]):
     """Service for managing services."""
@@ -75,6 +112,7 @@ class ServiceService(BaseService[Service]):
                 selectinload(Service.locales),
                 selectinload(Service.prices),
                 selectinload(Service.tags),
+                *_locale_criteria(locale),
             )
         )
         result = await self.db.execute(stmt)
@@ -108,25 +146,105 @@ class ServiceService(BaseService[Service]):
             order_by=[Service.sort_order, Service.created_at.desc()],
         )
 
-    async def list_published(self, tenant_id: UUID, locale: str) -> list[Service]:
-        """List published services for public API."""
-        # Filter by locale at database level to ensure only services with the locale are returned
+    async def list_published_json(self, tenant_id: UUID, locale: str) -> str:
+        """List published services as a JSON array built by Postgres.
+
+        Each element has the ``ServicePublicResponse`` shape for *locale*;
+        prices and tags are filtered to the locale in SQL, so no ORM
+        objects or relationship collections are loaded. On a miss the JSON
+        is validated and re-serialized by pydantic-core once, then cached
+        in Redis until the next write to the tenant's services.
+        """
+        cache = await get_public_list_cache()
+        if cache:
+            cached = await cache.get(str(tenant_id), "services", locale)
+            if cached is not None:
+                return cached
+
+        empty: ColumnElement[Any] = literal_column("'[]'::jsonb")
+
+        prices = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        aggregate_order_by(
+                            _json_object(
+                                price=ServicePrice.price,
+                                currency=ServicePrice.currency,
+                            ),
+                            ServicePrice.created_at,
+                        )
+                    ),
+                    empty,
+                )
+            )
+            .where(ServicePrice.service_id == Service.id)
+            .where(ServicePrice.locale == locale)
+            .scalar_subquery()
+        )
+        tags = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        aggregate_order_by(ServiceTag.tag, ServiceTag.created_at)
+                    ),
+                    empty,
+                )
+            )
+            .where(ServiceTag.service_id == Service.id)
+            .where(ServiceTag.locale == locale)
+            .scalar_subquery()
+        )
+        item = _json_object(
+            id=Service.id,
+            slug=ServiceLocale.slug,
+            title=ServiceLocale.title,
+            short_description=ServiceLocale.short_description,
+            description=ServiceLocale.description,
+            icon=Service.icon,
+            image_url=Service.image_url,
+            price_from=Service.price_from,
+            price_currency=Service.price_currency,
+            prices=prices,
+            tags=tags,
+            meta_title=ServiceLocale.meta_title,
+            meta_description=ServiceLocale.meta_description,
+        )
+
         stmt = (
-            select(Service)
-            .join(ServiceLocale, Service.id == ServiceLocale.service_id)
+            select(
+                cast(
+                    func.coalesce(
+                        func.jsonb_agg(aggregate_order_by(item, Service.sort_order)),
+                        empty,
+                    ),
+                    Text,
+                )
+            )
+            .select_from(Service)
+            .join(
+                ServiceLocale,
+                (ServiceLocale.service_id == Service.id)
+                & (ServiceLocale.locale == locale),
+            )
             .where(Service.tenant_id == tenant_id)
             .where(Service.deleted_at.is_(None))
             .where(Service.is_published.is_(True))
-            .where(ServiceLocale.locale == locale)
-            .options(
-                selectinload(Service.locales),
-                selectinload(Service.prices),
-                selectinload(Service.tags),
-            )
-            .order_by(Service.sort_order)
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().unique().all())
+        payload = _PUBLIC_LIST_ADAPTER.dump_json(
+            _PUBLIC_LIST_ADAPTER.validate_json(result.scalar_one())
+        ).decode()
+
+        if cache:
+            await cache.set(str(tenant_id), "services", locale, payload)
+        return payload
+
+    async def _invalidate_public_cache(self, tenant_id: UUID) -> None:
+        """Drop cached public lists so the next read sees this write."""
+        cache = await get_public_list_cache()
+        if cache:
+            await cache.invalidate(str(tenant_id), "services")
 
     @transactional
     async def create(self, tenant_id: UUID, data: ServiceCreate) -> Service:
@@ -138,7 +256,10 @@ class ServiceService(BaseService[Service]):
                 locale_data.slug, locale_data.locale, tenant_id
             )
 
-        # Create service (image_url is set via separate endpoint)
+        # Create service (image_url is set via separate endpoint) with its
+        # collections populated up front: one flush inserts the service and
+        # its locales, server defaults come back via RETURNING and
+        # locales/prices/tags stay loaded, so no refresh is needed.
         service = Service(
             tenant_id=tenant_id,
             icon=data.icon,
@@ -146,22 +267,16 @@ class ServiceService(BaseService[Service]):
             price_currency=data.price_currency,
             is_published=data.is_published,
             sort_order=data.sort_order,
+            locales=[
+                ServiceLocale(**locale_data.model_dump()) for locale_data in data.locales
+            ],
+            prices=[],
+            tags=[],
         )
         self.db.add(service)
         await self.db.flush()
 
-        # Create locales
-        for locale_data in data.locales:
-            locale = ServiceLocale(
-                service_id=service.id,
-                **locale_data.model_dump(),
-            )
-            self.db.add(locale)
-
-        await self.db.flush()
-        await self.db.refresh(service)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(service, ["locales", "prices", "tags"])
-
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return service
 
     @transactional
@@ -180,9 +295,8 @@ class ServiceService(BaseService[Service]):
             setattr(service, field, value)
 
         await self.db.flush()
-        await self.db.refresh(service)  # Full refresh for scalar fields (updated_at, etc.)
-        await self.db.refresh(service, ["locales", "prices", "tags"])
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return service
 
     @transactional
@@ -191,10 +305,21 @@ class ServiceService(BaseService[Service]):
     ) -> "Service":
         """Update or clear the service image URL."""
         svc = await self.get_by_id(service_id, tenant_id)
+        return await self._apply_image_url(svc, url)
+
+    @transactional
+    async def set_image_url(self, svc: Service, url: str | None) -> Service:
+        """Update or clear the image URL of an already-loaded service.
+
+        Use when the caller already holds the service in this session
+        (e.g. fetched for the old image URL) to skip a second ``get_by_id``.
+        """
+        return await self._apply_image_url(svc, url)
+
+    async def _apply_image_url(self, svc: Service, url: str | None) -> Service:
         svc.image_url = url
         await self.db.flush()
-        await self.db.refresh(svc)
-        await self.db.refresh(svc, ["locales", "prices", "tags"])
+        after_commit(self.db, self._invalidate_public_cache, svc.tenant_id)
         return svc
 
     @transactional
@@ -228,6 +353,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(price)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return price
 
     @transactional
@@ -256,6 +382,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(price)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return price
 
     @transactional
@@ -277,6 +404,7 @@ class ServiceService(BaseService[Service]):
 
         await self.db.delete(price)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     @transactional
     async def create_tag(
@@ -308,6 +436,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(tag)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return tag
 
     @transactional
@@ -348,6 +477,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(tag)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return tag
 
     @transactional
@@ -369,11 +499,13 @@ class ServiceService(BaseService[Service]):
 
         await self.db.delete(tag)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     @transactional
     async def soft_delete(self, service_id: UUID, tenant_id: UUID) -> None:
         """Soft delete a service."""
         await self._soft_delete(service_id, tenant_id)
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
 
     # ========== Locale Management ==========
 
@@ -405,6 +537,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -436,6 +569,7 @@ class ServiceService(BaseService[Service]):
         await self.db.flush()
         await self.db.refresh(locale)
 
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
         return locale
 
     @transactional
@@ -455,3 +589,4 @@ class ServiceService(BaseService[Service]):
         )
         await self.db.delete(locale)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_public_cache, tenant_id)
@@ -1,11 +1,13 @@
 """API routes for assets module."""
 
+import asyncio
 import re
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.config import settings
 from app.core.database import get_db
@@ -198,6 +200,7 @@ async def delete_file(
 
 
 _SAFE_PATH_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._/\-]*$")
+_MEDIA_CHUNK_SIZE = 64 * 1024
 _INLINE_CONTENT_TYPES = frozenset({
     "image/jpeg", "image/png", "image/gif", "image/webp", "image/svg+xml",
     "application/pdf",
@@ -227,31 +230,35 @@ async def serve_media(path: str) -> Response:
 
     try:
         s3 = S3Service()
-        
-        response = s3.client.get_object(
+
+        # boto3 is blocking; fetch the object headers off the event loop.
+        response = await asyncio.to_thread(
+            s3.client.get_object,
             Bucket=settings.s3_bucket_name,
             Key=path,
         )
-        
-        content_type = response.get("ContentType", "application/octet-stream")
-        body = response["Body"].read()
-
-        disposition = "inline" if content_type in _INLINE_CONTENT_TYPES else "attachment"
-        
-        return Response(
-            content=body,
-            media_type=content_type,
-            headers={
-                "Cache-Control": "public, max-age=31536000",
-                "Content-Length": str(len(body)),
-                "X-Content-Type-Options": "nosniff",
-                "Content-Disposition": disposition,
-            },
-        )
-        
     except s3.client.exceptions.NoSuchKey:
         raise FileNotFoundInStorageError(path)
     except Exception as e:
         logger.error("media_serve_error", path=path, error=str(e))
         raise FileNotFoundInStorageError(path)
 
+    content_type = response.get("ContentType", "application/octet-stream")
+    body = response["Body"]
+    disposition = "inline" if content_type in _INLINE_CONTENT_TYPES else "attachment"
+
+    # The body is relayed in fixed-size chunks (read in Starlette's thread
+    # pool) instead of being buffered whole, so memory per request stays
+    # bounded regardless of the file size.
+    return StreamingResponse(
+        body.iter_chunks(_MEDIA_CHUNK_SIZE),
+        media_type=content_type,
+        headers={
+            "Cache-Control": "public, max-age=31536000",
+            "Content-Length": str(response["ContentLength"]),
+            "X-Content-Type-Options": "nosniff",
+            "Content-Disposition": disposition,
+        },
+        background=BackgroundTask(body.close),
+    )
+
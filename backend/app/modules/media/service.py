@@ -5,20 +5,78 @@ from datetime import datetime
 from uuid import UUID
 
 import boto3
+from botocore.client import BaseClient
 from botocore.config import Config
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
 from app.core.exceptions import ExternalServiceError, NotFoundError
 from app.core.logging import get_logger
+from app.core.redis import get_file_asset_count_cache
 from app.modules.media.models import FileAsset
 from app.modules.media.schemas import FileAssetCreate, FileAssetUpdate
 
 logger = get_logger(__name__)
 
 
+# botocore client settings shared by every S3Service instance.
+# Path-style addressing is kept (the default) because the nginx /s3/ proxy
+# and MinIO both expect the bucket in the path, not in the hostname.
+_S3_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=100,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Process-wide boto3 client; boto3 clients are thread-safe, so all
+# services share one HTTP connection pool instead of opening their own.
+# Created at application startup by init_s3_client(), or lazily on first
+# use in processes without the app lifespan (workers, scripts).
+_shared_client: BaseClient | None = None
+
+
+def _create_client() -> BaseClient:
+    """Build the boto3 S3 client from settings."""
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.s3_endpoint_url or None,
+        aws_access_key_id=settings.s3_access_key,
+        aws_secret_access_key=settings.s3_secret_key,
+        region_name=settings.s3_region,
+        config=_S3_CLIENT_CONFIG,
+    )
+
+
+def init_s3_client() -> None:
+    """Create the shared S3 client.
+
+    Call this during application startup so the first upload does not pay
+    for client construction. Does nothing if S3 is not configured.
+    """
+    global _shared_client
+
+    if _shared_client is not None or not S3Service().is_configured:
+        return
+
+    _shared_client = _create_client()
+    logger.info("s3_client_initialized")
+
+
+def close_s3_client() -> None:
+    """Close the shared S3 client's connection pool.
+
+    Call this during application shutdown.
+    """
+    global _shared_client
+
+    if _shared_client is not None:
+        _shared_client.close()
+        _shared_client = None
+
+
 class S3Service:
     """Service for S3 operations."""
 
@@ -31,7 +89,7 @@ class S3Service:
         return bool(settings.s3_access_key and settings.s3_secret_key)
 
     @property
-    def client(self):
+    def client(self) -> BaseClient:
         """Get or create S3 client.
         
         Raises:
@@ -44,14 +102,10 @@ class S3Service:
             )
         
         if self._client is None:
-            self._client = boto3.client(
-                "s3",
-                endpoint_url=settings.s3_endpoint_url or None,
-                aws_access_key_id=settings.s3_access_key,
-                aws_secret_access_key=settings.s3_secret_key,
-                region_name=settings.s3_region,
-                config=Config(signature_version="s3v4"),
-            )
+            global _shared_client
+            if _shared_client is None:
+                _shared_client = _create_client()
+            self._client = _shared_client
         return self._client
 
     def generate_presigned_upload_url(
@@ -143,7 +197,11 @@ class FileAssetService:
         folder: str | None = None,
         mime_type_prefix: str | None = None,
     ) -> tuple[list[FileAsset], int]:
-        """List file assets with pagination."""
+        """List file assets with pagination.
+
+        The total is served from a short-lived Redis cache keyed by the
+        filter tuple; the count query only runs on a cache miss.
+        """
         base_query = (
             select(FileAsset)
             .where(FileAsset.tenant_id == tenant_id)
@@ -158,9 +216,16 @@ class FileAssetService:
                 FileAsset.mime_type.startswith(mime_type_prefix)
             )
 
-        # Count
-        count_stmt = select(func.count()).select_from(base_query.subquery())
-        total = (await self.db.execute(count_stmt)).scalar() or 0
+        # Count (cached per tenant + filters)
+        cache = await get_file_asset_count_cache()
+        total = None
+        if cache:
+            total = await cache.get(str(tenant_id), folder, mime_type_prefix)
+        if total is None:
+            count_stmt = select(func.count()).select_from(base_query.subquery())
+            total = (await self.db.execute(count_stmt)).scalar() or 0
+            if cache:
+                await cache.set(str(tenant_id), folder, mime_type_prefix, total)
 
         # Get results
         stmt = (
@@ -173,6 +238,12 @@ class FileAssetService:
 
         return assets, total
 
+    async def _invalidate_count_cache(self, tenant_id: UUID) -> None:
+        """Drop cached listing totals after the tenant's assets change."""
+        cache = await get_file_asset_count_cache()
+        if cache:
+            await cache.invalidate_tenant(str(tenant_id))
+
     def generate_upload_url(
         self,
         tenant_id: UUID,
@@ -210,6 +281,7 @@ class FileAssetService:
         self.db.add(asset)
         await self.db.flush()
         await self.db.refresh(asset)
+        after_commit(self.db, self._invalidate_count_cache, tenant_id)
 
         logger.info(
             "file_asset_created",
@@ -235,6 +307,9 @@ class FileAssetService:
         await self.db.flush()
         await self.db.refresh(asset)
 
+        if "folder" in update_data:
+            after_commit(self.db, self._invalidate_count_cache, tenant_id)
+
         return asset
 
     @transactional
@@ -247,6 +322,7 @@ class FileAssetService:
         asset = await self.get_by_id(asset_id, tenant_id)
         asset.soft_delete()
         await self.db.flush()
+        after_commit(self.db, self._invalidate_count_cache, tenant_id)
 
         logger.info(
             "file_asset_deleted",
@@ -266,6 +342,7 @@ class FileAssetService:
         # Delete from database
         await self.db.delete(asset)
         await self.db.flush()
+        after_commit(self.db, self._invalidate_count_cache, tenant_id)
 
         logger.info(
             "file_asset_hard_deleted",
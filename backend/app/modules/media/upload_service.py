@@ -1,9 +1,11 @@
 """Image upload service for direct file uploads to S3."""
 
+import asyncio
 import uuid
+from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, UploadFile, status
+from fastapi import BackgroundTasks, HTTPException, UploadFile, status
 
 from app.config import settings
 from app.core.exceptions import ExternalServiceError
@@ -46,6 +48,21 @@ class ImageUploadService:
         "image/gif": "gif",
     }
 
+    # Leading bytes of each allowed type; the declared content type is
+    # client-controlled, so the first chunk must match it as well
+    SIGNATURES: dict[str, tuple[bytes, ...]] = {
+        "image/jpeg": (b"\xff\xd8\xff",),
+        "image/png": (b"\x89PNG\r\n\x1a\n",),
+        "image/gif": (b"GIF87a", b"GIF89a"),
+        "image/webp": (b"RIFF",),
+    }
+
+    # Size of each read from the incoming upload
+    READ_CHUNK_SIZE: int = 64 * 1024
+
+    # Multipart part size (5MB is the S3 minimum for all but the last part)
+    PART_SIZE: int = 5 * 1024 * 1024
+
     def __init__(self) -> None:
         self.s3 = S3Service()
 
@@ -72,6 +89,13 @@ class ImageUploadService:
                 f"File too large: {file.size / (1024 * 1024):.1f}MB. Maximum size: {max_mb:.0f}MB"
             )
 
+    def _has_signature(self, content_type: str, head: bytes) -> bool:
+        """Check that *head* starts like a file of *content_type*."""
+        if not head.startswith(self.SIGNATURES.get(content_type, (b"",))):
+            return False
+        # WebP is a RIFF container: "RIFF" <size> "WEBP"
+        return content_type != "image/webp" or head[8:12] == b"WEBP"
+
     def _generate_s3_key(
         self,
         tenant_id: UUID,
@@ -145,6 +169,111 @@ class ImageUploadService:
             logger.warning("failed_to_extract_s3_key", url=image_url, error=str(e))
             return None
 
+    async def _stream_to_s3(
+        self,
+        file: UploadFile,
+        s3_key: str,
+        content_type: str,
+    ) -> int:
+        """Copy the upload to S3 in bounded chunks.
+
+        The file is read ``READ_CHUNK_SIZE`` bytes at a time, so at most one
+        part is held in memory. Files that fit in a single part are sent with
+        ``put_object``; larger ones use a multipart upload that is aborted on
+        any error. Blocking boto3 calls run in a worker thread.
+
+        Args:
+            file: Uploaded file
+            s3_key: Destination key
+            content_type: MIME type stored on the object
+
+        Returns:
+            Number of bytes uploaded
+
+        Raises:
+            ImageUploadError: If the file exceeds ``MAX_SIZE`` or its first
+                bytes do not match ``content_type``
+        """
+        client = self.s3.client
+        # CacheControl is set so that browsers/CDNs re-validate images
+        # rather than serving stale copies after a replace operation.
+        object_params = {
+            "Bucket": settings.s3_bucket_name,
+            "Key": s3_key,
+            "ContentType": content_type,
+            "CacheControl": "public, max-age=31536000, immutable",
+        }
+
+        size = 0
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
+        async def flush_part() -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                client.upload_part,
+                Bucket=settings.s3_bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            buffer.clear()
+
+        try:
+            while chunk := await file.read(self.READ_CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.MAX_SIZE:
+                    max_mb = self.MAX_SIZE / (1024 * 1024)
+                    raise ImageUploadError(
+                        f"File too large. Maximum size: {max_mb:.0f}MB"
+                    )
+                # Checked on the first chunk, before anything is sent to S3
+                if size == len(chunk) and not self._has_signature(content_type, chunk):
+                    raise ImageUploadError(
+                        f"File content does not match its type: {content_type}"
+                    )
+
+                buffer += chunk
+                if len(buffer) >= self.PART_SIZE:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            client.create_multipart_upload, **object_params
+                        )
+                        upload_id = response["UploadId"]
+                    await flush_part()
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    client.put_object, Body=bytes(buffer), **object_params
+                )
+            else:
+                if buffer:
+                    await flush_part()
+                await asyncio.to_thread(
+                    client.complete_multipart_upload,
+                    Bucket=settings.s3_bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(
+                        client.abort_multipart_upload,
+                        Bucket=settings.s3_bucket_name,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                    )
+                except Exception as e:
+                    logger.warning("s3_multipart_abort_failed", key=s3_key, error=str(e))
+            raise
+
+        return size
+
     async def upload_image(
         self,
         file: UploadFile,
@@ -152,6 +281,7 @@ class ImageUploadService:
         folder: str,
         entity_id: UUID,
         old_image_url: str | None = None,
+        background_tasks: BackgroundTasks | None = None,
     ) -> str:
         """Upload image to S3 and optionally delete old image.
         
@@ -161,6 +291,8 @@ class ImageUploadService:
             folder: Folder name (e.g., 'articles', 'employees')
             entity_id: Entity UUID
             old_image_url: URL of existing image to delete (optional)
+            background_tasks: If given, the old image is deleted after the
+                response is sent instead of inline
             
         Returns:
             URL of the uploaded image
@@ -180,25 +312,10 @@ class ImageUploadService:
         )
 
         try:
-            # Read file content
-            content = await file.read()
-            
-            # Double-check file size after reading
-            if len(content) > self.MAX_SIZE:
-                max_mb = self.MAX_SIZE / (1024 * 1024)
-                raise ImageUploadError(
-                    f"File too large: {len(content) / (1024 * 1024):.1f}MB. Maximum size: {max_mb:.0f}MB"
-                )
-
-            # Upload to S3
-            # CacheControl is set so that browsers/CDNs re-validate images
-            # rather than serving stale copies after a replace operation.
-            self.s3.client.put_object(
-                Bucket=settings.s3_bucket_name,
-                Key=s3_key,
-                Body=content,
-                ContentType=file.content_type or "image/jpeg",
-                CacheControl="public, max-age=31536000, immutable",
+            size = await self._stream_to_s3(
+                file=file,
+                s3_key=s3_key,
+                content_type=file.content_type or "image/jpeg",
             )
 
             # Get the URL
@@ -208,12 +325,20 @@ class ImageUploadService:
             if old_image_url:
                 old_key = self._extract_s3_key_from_url(old_image_url)
                 if old_key and old_key != s3_key:
-                    self.s3.delete_object(old_key)
-                    logger.info(
-                        "old_image_deleted",
-                        old_key=old_key,
-                        tenant_id=str(tenant_id),
-                    )
+                    if background_tasks is not None:
+                        background_tasks.add_task(self.s3.delete_object, old_key)
+                        logger.info(
+                            "old_image_delete_scheduled",
+                            old_key=old_key,
+                            tenant_id=str(tenant_id),
+                        )
+                    else:
+                        self.s3.delete_object(old_key)
+                        logger.info(
+                            "old_image_deleted",
+                            old_key=old_key,
+                            tenant_id=str(tenant_id),
+                        )
 
             logger.info(
                 "image_uploaded",
@@ -221,7 +346,7 @@ class ImageUploadService:
                 tenant_id=str(tenant_id),
                 folder=folder,
                 entity_id=str(entity_id),
-                size=len(content),
+                size=size,
             )
 
             return new_url
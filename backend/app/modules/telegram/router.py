@@ -37,7 +37,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/telegram")
 
 
-def get_telegram_service(db: AsyncSession = Depends(get_db)) -> TelegramIntegrationService:
+async def get_telegram_service(db: AsyncSession = Depends(get_db)) -> TelegramIntegrationService:
     """Dependency for Telegram service."""
     return TelegramIntegrationService(db)
 
@@ -7,7 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import transactional
+from app.core.database import after_commit, transactional
 from app.core.exceptions import AlreadyExistsError, NotFoundError
 from app.modules.tenants.models import (
     AVAILABLE_FEATURES,
@@ -256,7 +256,7 @@ class TenantService:
             cache = await get_tenant_status_cache()
             if cache:
                 await cache.invalidate(str(tenant_id))
-            get_cors_origins_cache().invalidate()
+            after_commit(self.db, get_cors_origins_cache().invalidate_all)
 
         # Invalidate domain_tenant_cache so by-domain resolution picks up
         # changes to name, primary_color, logo_url, is_active immediately.
@@ -294,7 +294,7 @@ class TenantService:
         cache = await get_tenant_status_cache()
         if cache:
             await cache.invalidate(str(tenant_id))
-        get_cors_origins_cache().invalidate()
+        after_commit(self.db, get_cors_origins_cache().invalidate_all)
 
     async def get_settings(self, tenant_id: UUID) -> TenantSettings | None:
         """Get tenant settings by tenant ID.
@@ -357,7 +357,7 @@ class TenantService:
 
         if "site_url" in update_data:
             from app.core.redis import get_cors_origins_cache
-            get_cors_origins_cache().invalidate()
+            after_commit(self.db, get_cors_origins_cache().invalidate_all)
 
         return settings
 
@@ -664,8 +664,8 @@ class TenantDomainService:
         if cache:
             await cache.invalidate(domain)
 
-    @staticmethod
-    def _invalidate_cors_cache() -> None:
+    def _invalidate_cors_cache(self) -> None:
+        """Reload CORS origins on every worker once the transaction commits."""
         from app.core.redis import get_cors_origins_cache
-        get_cors_origins_cache().invalidate()
+        after_commit(self.db, get_cors_origins_cache().invalidate_all)
 
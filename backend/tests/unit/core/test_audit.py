@@ -1,12 +1,13 @@
-"""Unit tests for AuditService."""
+"""Unit tests for AuditService and AuditLogQueue."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.audit import AuditService
+from app.core.audit import AuditLogQueue, AuditService
 
 
 class TestAuditService:
@@ -72,3 +73,93 @@ class TestAuditService:
             changes={"is_active": {"old": "True", "new": "False"}},
         )
         assert isinstance(entry, AuditLog)
+
+
+class TestAuditLogQueue:
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_log_deferred_falls_back_when_queue_stopped(self, monkeypatch):
+        from app.core import audit as audit_module
+
+        monkeypatch.setattr(audit_module, "audit_log_queue", AuditLogQueue())
+        db = AsyncMock(spec=AsyncSession)
+        db.add = Mock()
+
+        await AuditService(db).log_deferred(
+            tenant_id=uuid4(),
+            user_id=uuid4(),
+            resource_type="auth",
+            resource_id=uuid4(),
+            action="login",
+        )
+
+        db.add.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_queued_rows_written_in_one_batch(self, monkeypatch):
+        from app.core import audit as audit_module
+
+        queue = AuditLogQueue(batch_size=3, flush_interval=0.5)
+        monkeypatch.setattr(audit_module, "audit_log_queue", queue)
+        write = AsyncMock()
+        monkeypatch.setattr(queue, "_write", write)
+        db = AsyncMock(spec=AsyncSession)
+        db.add = Mock()
+
+        queue.start()
+        try:
+            for _ in range(3):
+                await AuditService(db).log_deferred(
+                    tenant_id=uuid4(),
+                    user_id=None,
+                    resource_type="auth",
+                    resource_id=uuid4(),
+                    action="logout",
+                )
+            await asyncio.sleep(0.05)
+        finally:
+            await queue.stop()
+
+        db.add.assert_not_called()
+        write.assert_awaited_once()
+        assert len(write.await_args.args[0]) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stop_flushes_partial_batch(self, monkeypatch):
+        queue = AuditLogQueue(batch_size=100, flush_interval=60)
+        write = AsyncMock()
+        monkeypatch.setattr(queue, "_write", write)
+
+        queue.start()
+        assert queue.put({"action": "login"})
+        await asyncio.sleep(0)
+        await queue.stop()
+
+        write.assert_awaited_once_with([{"action": "login"}])
+        assert not queue.put({"action": "login"})
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_stop_during_write_flushes_pending_batch(self, monkeypatch):
+        queue = AuditLogQueue(batch_size=1, flush_interval=60)
+        written = []
+        writing = asyncio.Event()
+
+        async def write(rows):
+            if not writing.is_set():
+                writing.set()
+                await asyncio.sleep(60)
+            written.append(list(rows))
+
+        monkeypatch.setattr(queue, "_write", write)
+
+        queue.start()
+        assert queue.put({"action": "login"})
+        await writing.wait()
+        assert queue.put({"action": "logout"})
+        await queue.stop()
+
+        assert written == [[{"action": "login"}, {"action": "logout"}]]
@@ -0,0 +1,34 @@
+"""Unit tests for public response cache headers (ETag / If-None-Match)."""
+
+import pytest
+
+from app.middleware.cache import generate_etag, public_json_response
+
+
+class TestPublicJsonResponse:
+
+    @pytest.mark.unit
+    def test_returns_payload_with_etag(self) -> None:
+        response = public_json_response('[{"id": 1}]', None)
+
+        assert response.status_code == 200
+        assert response.body == b'[{"id": 1}]'
+        assert response.headers["ETag"] == generate_etag(b'[{"id": 1}]')
+        assert response.headers["Cache-Control"] == "public, max-age=300"
+
+    @pytest.mark.unit
+    def test_matching_if_none_match_returns_304(self) -> None:
+        etag = generate_etag(b"[]")
+
+        response = public_json_response("[]", etag)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.unit
+    def test_stale_if_none_match_returns_payload(self) -> None:
+        response = public_json_response("[]", '"stale"')
+
+        assert response.status_code == 200
+        assert response.body == b"[]"
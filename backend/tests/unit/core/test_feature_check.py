@@ -197,32 +197,37 @@ class TestRequireFeatureAdminDependency:
         dep = require_feature("blog_module")
         dependency_fn = dep.dependency
 
-        mock_token = Mock()
-        mock_token.is_superuser = True
-        mock_token.permissions = []
+        mock_user = Mock()
+        mock_user.is_superuser = True
 
         mock_db = AsyncMock()
-        result = await dependency_fn(token=mock_token, db=mock_db)
+        result = await dependency_fn(token=Mock(), user=mock_user, db=mock_db)
 
         assert result is True
+        mock_db.execute.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_platform_owner_bypasses_check(self) -> None:
-        """Platform owner should bypass feature check."""
+        """Platform owner should bypass feature check using the loaded role."""
         from app.middleware.feature_check import require_feature
 
         dep = require_feature("cases_module")
         dependency_fn = dep.dependency
 
-        mock_token = Mock()
-        mock_token.is_superuser = False
-        mock_token.permissions = ["platform:*"]
+        mock_user = Mock()
+        mock_user.is_superuser = False
+        mock_user.role.permission_codes = frozenset({"platform:*"})
 
-        mock_db = AsyncMock()
-        result = await dependency_fn(token=mock_token, db=mock_db)
+        with patch(
+            "app.middleware.feature_check.FeatureFlagService"
+        ) as MockService:
+            mock_db = AsyncMock()
+            result = await dependency_fn(token=Mock(), user=mock_user, db=mock_db)
 
         assert result is True
+        MockService.assert_not_called()
+        mock_db.execute.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -234,9 +239,10 @@ class TestRequireFeatureAdminDependency:
         dependency_fn = dep.dependency
 
         mock_token = Mock()
-        mock_token.is_superuser = False
-        mock_token.permissions = []
         mock_token.tenant_id = uuid4()
+        mock_user = Mock()
+        mock_user.is_superuser = False
+        mock_user.role = None
 
         with patch(
             "app.middleware.feature_check.FeatureFlagService"
@@ -247,10 +253,11 @@ class TestRequireFeatureAdminDependency:
 
             mock_db = AsyncMock()
             with pytest.raises(FeatureDisabledError) as exc_info:
-                await dependency_fn(token=mock_token, db=mock_db)
+                await dependency_fn(token=mock_token, user=mock_user, db=mock_db)
 
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail["restriction_level"] == "organization"
+        mock_svc.is_enabled.assert_called_once_with(mock_token.tenant_id, "faq_module")
 
 
 class TestServicesModuleInAvailableFeatures:
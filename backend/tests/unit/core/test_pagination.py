@@ -0,0 +1,84 @@
+"""Unit tests for paginate_query."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from app.core.pagination import paginate_query
+from app.modules.auth.models import Permission
+
+
+class _Row(tuple):
+    """Minimal stand-in for a SQLAlchemy Row with a ``_total`` label."""
+
+    def __new__(cls, item, total):
+        return super().__new__(cls, (item, total))
+
+    @property
+    def _total(self):
+        return self[1]
+
+
+def _result(rows=None, scalar=None):
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.scalar.return_value = scalar
+    return result
+
+
+class TestPaginateQueryWindowCount:
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_total_read_from_page_rows(self):
+        items = [object(), object()]
+        db = AsyncMock()
+        db.execute.return_value = _result(
+            rows=[_Row(item, 12) for item in items]
+        )
+
+        result_items, total = await paginate_query(
+            db, select(Permission), page=1, page_size=2, window_count=True
+        )
+
+        assert result_items == items
+        assert total == 12
+        db.execute.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_first_page_skips_count(self):
+        db = AsyncMock()
+        db.execute.return_value = _result(rows=[])
+
+        items, total = await paginate_query(
+            db, select(Permission), page=1, page_size=20, window_count=True
+        )
+
+        assert items == []
+        assert total == 0
+        db.execute.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_page_past_end_falls_back_to_count(self):
+        db = AsyncMock()
+        db.execute.side_effect = [_result(rows=[]), _result(scalar=7)]
+
+        items, total = await paginate_query(
+            db, select(Permission), page=5, page_size=20, window_count=True
+        )
+
+        assert items == []
+        assert total == 7
+        assert db.execute.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rejects_unique(self):
+        with pytest.raises(ValueError):
+            await paginate_query(
+                AsyncMock(), select(Permission), 1, 20, unique=True, window_count=True
+            )
+
@@ -1,10 +1,18 @@
-"""Unit tests for Redis utilities: RateLimiter, TokenBlacklist, TenantStatusCache."""
+"""Unit tests for Redis utilities: RateLimiter, TokenBlacklist and the domain caches."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.core.redis import RateLimiter, TenantStatusCache, TokenBlacklist
+from app.core.redis import (
+    CORSOriginsCache,
+    FileAssetCountCache,
+    PublicListCache,
+    RateLimiter,
+    TenantStatusCache,
+    TokenBlacklist,
+)
 
 
 class TestRateLimiter:
@@ -102,6 +110,34 @@ class TestTokenBlacklist:
         await blacklist.remove("jti-123")
         mock_redis.delete.assert_called_once_with("bl:jti-123")
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_check_with_tenant_status_uses_one_pipeline(self, blacklist, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[0, "0"])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        result = await blacklist.check_with_tenant_status("jti-123", "tid-123")
+
+        assert result == (False, False)
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.exists.assert_called_once_with("bl:jti-123")
+        pipe.get.assert_called_once_with("tenant_status:tid-123")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_check_with_tenant_status_cache_miss(self, blacklist, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, None])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        assert await blacklist.check_with_tenant_status("jti-123", "tid-123") == (True, None)
+
 
 class TestTenantStatusCache:
 
@@ -151,3 +187,136 @@ class TestTenantStatusCache:
     async def test_invalidate_deletes_key(self, cache, mock_redis):
         await cache.invalidate("tid-123")
         mock_redis.delete.assert_called_once_with("tenant_status:tid-123")
+
+
+class TestFileAssetCountCache:
+
+    @pytest.fixture
+    def mock_redis(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        return FileAssetCountCache(mock_redis)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_cached_total(self, cache, mock_redis):
+        mock_redis.get.return_value = "42"
+        assert await cache.get("tid-123", "articles", None) == 42
+        mock_redis.get.assert_called_once_with("file_asset_count:tid-123:articles:")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_cache_miss(self, cache, mock_redis):
+        mock_redis.get.return_value = None
+        assert await cache.get("tid-123", None, "image/") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_set_total_with_ttl(self, cache, mock_redis):
+        await cache.set("tid-123", None, "image/", 7)
+        mock_redis.setex.assert_called_once_with("file_asset_count:tid-123::image/", 30, "7")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant_deletes_matching_keys(self, cache, mock_redis):
+        async def scan_iter(match):
+            assert match == "file_asset_count:tid-123:*"
+            for key in ("file_asset_count:tid-123::", "file_asset_count:tid-123:docs:"):
+                yield key
+
+        mock_redis.scan_iter = scan_iter
+        await cache.invalidate_tenant("tid-123")
+        mock_redis.delete.assert_called_once_with(
+            "file_asset_count:tid-123::", "file_asset_count:tid-123:docs:"
+        )
+
+
+class TestPublicListCache:
+
+    @pytest.fixture
+    def mock_redis(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        return PublicListCache(mock_redis)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_cached_payload(self, cache, mock_redis):
+        mock_redis.get.return_value = '[{"id": "1"}]'
+        assert await cache.get("tid-123", "employees", "ru") == '[{"id": "1"}]'
+        mock_redis.get.assert_called_once_with("public_list:tid-123:employees:ru")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_set_payload_without_locale(self, cache, mock_redis):
+        await cache.set("tid-123", "contacts", None, "{}")
+        mock_redis.setex.assert_called_once_with("public_list:tid-123:contacts:", 300, "{}")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_every_locale_of_section(self, cache, mock_redis):
+        async def scan_iter(match):
+            assert match == "public_list:tid-123:services:*"
+            for key in ("public_list:tid-123:services:ru", "public_list:tid-123:services:en"):
+                yield key
+
+        mock_redis.scan_iter = scan_iter
+        await cache.invalidate("tid-123", "services")
+        mock_redis.delete.assert_called_once_with(
+            "public_list:tid-123:services:ru", "public_list:tid-123:services:en"
+        )
+
+
+class TestCORSOriginsCache:
+
+    @pytest.fixture
+    def cache(self):
+        cache = CORSOriginsCache()
+        cache._origins = {"https://a.example"}
+        cache._loaded_at = 123.0
+        return cache
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_all_publishes(self, cache):
+        client = AsyncMock()
+        with patch("app.core.redis.get_redis_client", return_value=client):
+            await cache.invalidate_all()
+
+        assert cache._loaded_at == 0.0
+        client.publish.assert_called_once_with(CORSOriginsCache.CHANNEL, "1")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_all_without_redis(self, cache):
+        with patch("app.core.redis.get_redis_client", return_value=None):
+            await cache.invalidate_all()
+
+        assert cache._loaded_at == 0.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_listen_invalidates_on_message(self, cache):
+        async def messages():
+            yield {"type": "subscribe"}
+            cache._loaded_at = 123.0
+            yield {"type": "message", "data": "1"}
+            raise asyncio.CancelledError
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen.return_value = messages()
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+
+        with pytest.raises(asyncio.CancelledError):
+            await cache.listen(client)
+
+        pubsub.subscribe.assert_called_once_with(CORSOriginsCache.CHANNEL)
+        pubsub.aclose.assert_called_once()
+        assert cache._loaded_at == 0.0
@@ -1,5 +1,6 @@
 """Unit tests for core security module: auth, tenant checks, RBAC."""
 
+import inspect
 from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
@@ -26,8 +27,10 @@ from app.core.security import (
     create_password_reset_token,
     create_refresh_token,
     decode_password_reset_token,
+    get_current_tenant_id,
     get_current_token,
 )
+from app.modules.auth.models import Permission, Role
 
 # ============================================================================
 # _check_tenant_active
@@ -48,6 +51,16 @@ class TestCheckTenantActive:
         mock_cache.is_tenant_active.assert_called_once_with(str(tid))
         mock_db.execute.assert_not_called()
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_prefetched_status_skips_cache_lookup(self):
+        mock_cache = AsyncMock()
+        mock_db = AsyncMock(spec=AsyncSession)
+        with patch("app.core.redis.get_tenant_status_cache", new_callable=AsyncMock, return_value=mock_cache):
+            await _check_tenant_active(uuid4(), mock_db, cached_status=True, cache_checked=True)
+        mock_cache.is_tenant_active.assert_not_called()
+        mock_db.execute.assert_not_called()
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_cache_hit_inactive_raises(self):
@@ -172,12 +185,30 @@ class TestGetCurrentToken:
             expires_delta=timedelta(hours=1),
         )
         mock_blacklist = AsyncMock()
-        mock_blacklist.is_blacklisted.return_value = True
+        mock_blacklist.check_with_tenant_status.return_value = (True, None)
         creds = self._make_credentials(token)
         with patch("app.core.redis.get_token_blacklist", new_callable=AsyncMock, return_value=mock_blacklist):
             with pytest.raises(InvalidTokenError):
                 await get_current_token(credentials=creds)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_tenant_status_prefetched_with_blacklist_check(self):
+        tenant_id = uuid4()
+        token = create_access_token(
+            {"sub": str(uuid4()), "tenant_id": str(tenant_id), "email": "a@b.com",
+             "permissions": [], "is_superuser": False},
+            expires_delta=timedelta(hours=1),
+        )
+        mock_blacklist = AsyncMock()
+        mock_blacklist.check_with_tenant_status.return_value = (False, True)
+        creds = self._make_credentials(token)
+        with patch("app.core.redis.get_token_blacklist", new_callable=AsyncMock, return_value=mock_blacklist):
+            payload = await get_current_token(credentials=creds)
+        assert payload.tenant_status_prefetched is True
+        assert payload.cached_tenant_active is True
+        assert mock_blacklist.check_with_tenant_status.call_args.args[1] == str(tenant_id)
+
 
 # ============================================================================
 # PermissionChecker
@@ -191,14 +222,8 @@ class TestPermissionChecker:
         user.is_superuser = is_superuser
         user.is_active = True
         if permissions is not None:
-            rp_mocks = []
-            for code in permissions:
-                rp = Mock()
-                rp.permission = Mock()
-                rp.permission.code = code
-                rp_mocks.append(rp)
-            user.role = Mock()
-            user.role.role_permissions = rp_mocks
+            user.role = Role(name="editor")
+            user.role.permissions = [Permission(code=code) for code in permissions]
         else:
             user.role = None
         return user
@@ -254,6 +279,22 @@ class TestPermissionChecker:
         with pytest.raises(PermissionDeniedError):
             await checker(user=user)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_permission_codes_follow_reloaded_permissions(self):
+        user = self._make_user(permissions=["articles:read"])
+        await PermissionChecker("articles:read")(user=user)
+
+        user.role.permissions = []
+        with pytest.raises(PermissionDeniedError):
+            await PermissionChecker("articles:read")(user=user)
+
+    @pytest.mark.unit
+    def test_dependencies_are_async(self):
+        """Sync dependencies would be dispatched to FastAPI's threadpool."""
+        assert inspect.iscoroutinefunction(PermissionChecker.__call__)
+        assert inspect.iscoroutinefunction(get_current_tenant_id)
+
 
 # ============================================================================
 # PlatformOwnerChecker
@@ -1,6 +1,7 @@
 """Unit tests for authentication service."""
 
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
@@ -12,7 +13,7 @@ from app.core.exceptions import (
     NotFoundError,
     TenantInactiveError,
 )
-from app.core.security import create_refresh_token, hash_password
+from app.core.security import create_refresh_token, decode_token, hash_password
 from app.modules.auth.models import AdminUser, Role
 from app.modules.auth.schemas import LoginRequest
 from app.modules.auth.services import AuthService, UserService
@@ -22,6 +23,18 @@ from app.modules.auth.services import AuthService, UserService
 CORRECT_PASSWORD = "correct_password"
 
 
+def _claims_row(user: AdminUser) -> SimpleNamespace:
+    """Row shape returned by the refresh_tokens claims query."""
+    return SimpleNamespace(
+        id=user.id,
+        tenant_id=user.tenant_id,
+        email=user.email,
+        is_superuser=user.is_superuser,
+        role_id=user.role_id,
+        role_name=user.role.name if user.role else None,
+    )
+
+
 class TestAuthService:
     """Tests for AuthService."""
 
@@ -72,6 +85,7 @@ class TestAuthService:
         """Successful authentication should return user and tokens."""
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = sample_user
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         login_data = LoginRequest(email="test@example.com", password=CORRECT_PASSWORD)
@@ -99,6 +113,7 @@ class TestAuthService:
         """Authentication with wrong password should raise InvalidCredentialsError."""
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = sample_user
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         login_data = LoginRequest(email="test@example.com", password="wrong_password")
@@ -122,6 +137,7 @@ class TestAuthService:
 
         user_result = Mock()
         user_result.scalar_one_or_none.return_value = None
+        user_result.unique.return_value = user_result
 
         mock_db.execute.side_effect = [tenant_check_result, user_result]
 
@@ -133,6 +149,35 @@ class TestAuthService:
                 tenant_id=uuid4(),
             )
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_authenticate_user_not_found_still_compares_hash(
+        self,
+        auth_service: AuthService,
+        mock_db: AsyncMock,
+    ) -> None:
+        """Unknown emails must cost one bcrypt compare against the dummy hash."""
+        from app.modules.auth.services import auth_service as auth_service_module
+
+        tenant_check_result = Mock()
+        tenant_check_result.scalar_one_or_none.return_value = True
+        user_result = Mock()
+        user_result.scalar_one_or_none.return_value = None
+        user_result.unique.return_value = user_result
+        mock_db.execute.side_effect = [tenant_check_result, user_result]
+
+        login_data = LoginRequest(email="nonexistent@example.com", password="any_password")
+
+        with patch.object(
+            auth_service_module, "verify_password_async", AsyncMock(return_value=False)
+        ) as verify:
+            with pytest.raises(InvalidCredentialsError):
+                await auth_service.authenticate(data=login_data, tenant_id=uuid4())
+
+        verify.assert_awaited_once_with(
+            "any_password", auth_service_module._DUMMY_PASSWORD_HASH
+        )
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_authenticate_inactive_user(
@@ -146,6 +191,7 @@ class TestAuthService:
 
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = sample_user
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         login_data = LoginRequest(email="test@example.com", password=CORRECT_PASSWORD)
@@ -171,15 +217,23 @@ class TestAuthService:
             "email": sample_user.email,
         })
 
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        tenant_check_result = Mock()
+        tenant_check_result.scalar_one_or_none.return_value = True
+        claims_result = Mock()
+        claims_result.one_or_none.return_value = _claims_row(sample_user)
+        mock_db.execute.side_effect = [tenant_check_result, claims_result]
 
         tokens = await auth_service.refresh_tokens(refresh_token)
 
         assert tokens.access_token is not None
         assert tokens.refresh_token is not None
 
+        claims = decode_token(tokens.access_token)
+        assert claims["sub"] == str(sample_user.id)
+        assert claims["role"] == "admin"
+        assert claims["role_id"] == str(sample_user.role_id)
+        assert "permissions" not in claims
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_refresh_tokens_invalid_type(
@@ -217,7 +271,7 @@ class TestAuthService:
         tenant_check_result.scalar_one_or_none.return_value = True
 
         user_result = Mock()
-        user_result.scalar_one_or_none.return_value = None
+        user_result.one_or_none.return_value = None
 
         mock_db.execute.side_effect = [tenant_check_result, user_result]
 
@@ -235,6 +289,7 @@ class TestAuthService:
         """Successful login must return both access_token and refresh_token."""
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = sample_user
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         login_data = LoginRequest(email="test@example.com", password=CORRECT_PASSWORD)
@@ -264,9 +319,11 @@ class TestAuthService:
             "email": sample_user.email,
         })
 
-        mock_result = Mock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        tenant_check_result = Mock()
+        tenant_check_result.scalar_one_or_none.return_value = True
+        claims_result = Mock()
+        claims_result.one_or_none.return_value = _claims_row(sample_user)
+        mock_db.execute.side_effect = [tenant_check_result, claims_result]
 
         tokens = await auth_service.refresh_tokens(original_refresh)
 
@@ -336,6 +393,7 @@ class TestUserService:
         """Get by ID should return user when found."""
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = sample_user
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         user = await user_service.get_by_id(sample_user.id, sample_user.tenant_id)
@@ -353,6 +411,7 @@ class TestUserService:
         """Get by ID should raise NotFoundError when user doesn't exist."""
         mock_result = Mock()
         mock_result.scalar_one_or_none.return_value = None
+        mock_result.unique.return_value = mock_result
         mock_db.execute.return_value = mock_result
 
         with pytest.raises(NotFoundError):
@@ -367,19 +426,18 @@ class TestUserService:
         sample_user: AdminUser,
     ) -> None:
         """List users should return paginated results."""
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
         list_result = Mock()
-        list_result.scalars.return_value.all.return_value = [sample_user]
+        list_result.all.return_value = [Mock(_total=1, __getitem__=lambda _, i: sample_user)]
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         users, total = await user_service.list_users(sample_user.tenant_id)
 
         assert len(users) == 1
         assert total == 1
         assert users[0].email == sample_user.email
+        # Total comes from COUNT(*) OVER () on the page query
+        mock_db.execute.assert_called_once()
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -390,13 +448,10 @@ class TestUserService:
         sample_user: AdminUser,
     ) -> None:
         """List users should filter by is_active."""
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
         list_result = Mock()
-        list_result.scalars.return_value.all.return_value = [sample_user]
+        list_result.all.return_value = [Mock(_total=1, __getitem__=lambda _, i: sample_user)]
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         users, total = await user_service.list_users(
             sample_user.tenant_id, is_active=True
@@ -412,13 +467,10 @@ class TestUserService:
         mock_db: AsyncMock,
     ) -> None:
         """List users should return empty list when no users."""
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-
         list_result = Mock()
-        list_result.scalars.return_value.all.return_value = []
+        list_result.all.return_value = []
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         users, total = await user_service.list_users(uuid4())
 
@@ -1,7 +1,7 @@
 """Unit tests for company ServiceService."""
 
 from datetime import datetime, UTC
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -18,6 +18,7 @@ class TestServiceService:
     def mock_db(self) -> AsyncMock:
         """Create mock database session."""
         db = AsyncMock()
+        db.info = {}
         db.add = Mock()
         db.delete = AsyncMock()
         db.flush = AsyncMock()
@@ -212,28 +213,27 @@ class TestServiceService:
         assert len(services) == 10
         assert total == 25
 
-    # ========== list_published Tests ==========
+    # ========== list_published_json Tests ==========
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_list_published_services(
+    async def test_list_published_json_cache_hit_skips_db(
         self,
         service_service: ServiceService,
         mock_db: AsyncMock,
-        published_service: Service,
     ) -> None:
-        """List published should only return published services for locale."""
-        mock_result = Mock()
-        # Use unique() for this query
-        mock_result.scalars.return_value.unique.return_value.all.return_value = [published_service]
-        mock_db.execute.return_value = mock_result
-
-        services = await service_service.list_published(
-            published_service.tenant_id, locale="ru"
-        )
-
-        assert len(services) == 1
-        assert services[0].is_published is True
+        """A cached payload is returned as-is without querying."""
+        cache = AsyncMock()
+        cache.get.return_value = "[]"
+
+        with patch(
+            "app.modules.company.services.service_service.get_public_list_cache",
+            AsyncMock(return_value=cache),
+        ):
+            payload = await service_service.list_published_json(uuid4(), "ru")
+
+        assert payload == "[]"
+        mock_db.execute.assert_not_called()
 
     # ========== soft_delete Tests ==========
 
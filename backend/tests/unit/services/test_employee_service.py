@@ -13,9 +13,22 @@ from app.modules.company.models import (
     EmployeePracticeArea,
     PracticeArea,
 )
+from app.modules.company.schemas import EmployeeCreate
 from app.modules.company.services import EmployeeService
 
 
+class _Row(tuple):
+    """Minimal stand-in for a page row carrying the ``_total`` window column."""
+
+    @property
+    def _total(self):
+        return self[1]
+
+
+def _page_rows(items, total):
+    return [_Row((item, total)) for item in items]
+
+
 class TestEmployeeService:
     """Tests for EmployeeService - read and write operations."""
 
@@ -23,6 +36,7 @@ class TestEmployeeService:
     def mock_db(self) -> AsyncMock:
         """Create mock database session."""
         db = AsyncMock()
+        db.info = {}
         db.add = Mock()
         db.delete = AsyncMock()
         db.flush = AsyncMock()
@@ -167,13 +181,10 @@ class TestEmployeeService:
         mock_db: AsyncMock,
     ) -> None:
         """List employees should return empty list when no employees."""
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-
         list_result = Mock()
-        list_result.scalars.return_value.unique.return_value.all.return_value = []
+        list_result.all.return_value = []
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         employees, total = await employee_service.list_employees(uuid4())
 
@@ -189,15 +200,10 @@ class TestEmployeeService:
         published_employee: Employee,
     ) -> None:
         """List employees should filter by is_published."""
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
         list_result = Mock()
-        list_result.scalars.return_value.unique.return_value.all.return_value = [
-            published_employee
-        ]
+        list_result.all.return_value = _page_rows([published_employee], total=1)
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         employees, total = await employee_service.list_employees(
             published_employee.tenant_id,
@@ -216,15 +222,10 @@ class TestEmployeeService:
         sample_employee: Employee,
     ) -> None:
         """List employees should support search by name/position/email."""
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
         list_result = Mock()
-        list_result.scalars.return_value.unique.return_value.all.return_value = [
-            sample_employee
-        ]
+        list_result.all.return_value = _page_rows([sample_employee], total=1)
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         employees, total = await employee_service.list_employees(
             sample_employee.tenant_id,
@@ -233,6 +234,10 @@ class TestEmployeeService:
 
         assert len(employees) == 1
         assert total == 1
+        mock_db.execute.assert_called_once()
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "EXISTS" in sql
+        assert "DISTINCT" not in sql
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -243,15 +248,10 @@ class TestEmployeeService:
         sample_employee: Employee,
     ) -> None:
         """List employees should support pagination."""
-        count_result = Mock()
-        count_result.scalar.return_value = 25
-
         list_result = Mock()
-        list_result.scalars.return_value.unique.return_value.all.return_value = (
-            [sample_employee] * 10
-        )
+        list_result.all.return_value = _page_rows([sample_employee] * 10, total=25)
 
-        mock_db.execute.side_effect = [count_result, list_result]
+        mock_db.execute.return_value = list_result
 
         employees, total = await employee_service.list_employees(
             sample_employee.tenant_id,
@@ -286,6 +286,57 @@ class TestEmployeeService:
         assert len(employees) == 1
         assert employees[0].is_published is True
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_published_raises_on_unloaded_relationships(
+        self,
+        employee_service: EmployeeService,
+        mock_db: AsyncMock,
+    ) -> None:
+        """Only locales are eager-loaded; other relationships use raiseload."""
+        mock_result = Mock()
+        mock_result.scalars.return_value.unique.return_value.all.return_value = []
+        mock_db.execute.return_value = mock_result
+
+        await employee_service.list_published(uuid4(), locale="ru")
+
+        stmt = mock_db.execute.call_args.args[0]
+        strategies = [getattr(opt, "strategy", None) for opt in stmt._with_options]
+        assert (("lazy", "raise"),) in strategies
+
+    # ========== create Tests ==========
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_builds_collections_in_one_flush(
+        self,
+        employee_service: EmployeeService,
+        mock_db: AsyncMock,
+    ) -> None:
+        """Locales and practice area links are attached before the flush."""
+        pa_id = uuid4()
+        data = EmployeeCreate(
+            email="jane@example.com",
+            locales=[
+                {
+                    "locale": "en",
+                    "slug": "jane-doe",
+                    "first_name": "Jane",
+                    "last_name": "Doe",
+                    "position": "Partner",
+                }
+            ],
+            practice_area_ids=[pa_id, pa_id],
+        )
+
+        employee = await employee_service.create(uuid4(), data)
+
+        assert [loc.slug for loc in employee.locales] == ["jane-doe"]
+        assert [link.practice_area_id for link in employee.practice_areas] == [pa_id]
+        mock_db.add.assert_called_once_with(employee)
+        mock_db.flush.assert_awaited_once()
+        mock_db.refresh.assert_not_awaited()
+
     # ========== soft_delete Tests ==========
 
     @pytest.mark.unit
@@ -0,0 +1,120 @@
+"""Unit tests for media FileAssetService."""
+
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.modules.media.models import FileAsset
+from app.modules.media.service import FileAssetService
+
+
+class TestFileAssetServiceCountCache:
+    """Listing totals are served from FileAssetCountCache."""
+
+    @pytest.fixture
+    def mock_db(self) -> AsyncMock:
+        """Create mock database session."""
+        db = AsyncMock()
+        db.info = {}
+        db.add = Mock()
+        db.flush = AsyncMock()
+        db.refresh = AsyncMock()
+        db.commit = AsyncMock()
+        db.rollback = AsyncMock()
+        return db
+
+    @pytest.fixture
+    def file_asset_service(self, mock_db: AsyncMock) -> FileAssetService:
+        """Create FileAssetService with mocked S3."""
+        with patch("app.modules.media.service.S3Service"):
+            return FileAssetService(mock_db)
+
+    @pytest.fixture
+    def cache(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture(autouse=True)
+    def _patch_cache(self, cache: AsyncMock):
+        with patch(
+            "app.modules.media.service.get_file_asset_count_cache",
+            AsyncMock(return_value=cache),
+        ):
+            yield
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_assets_cache_hit_skips_count_query(
+        self, file_asset_service: FileAssetService, mock_db: AsyncMock, cache: AsyncMock
+    ) -> None:
+        tenant_id = uuid4()
+        cache.get.return_value = 7
+        mock_result = Mock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_db.execute.return_value = mock_result
+
+        assets, total = await file_asset_service.list_assets(tenant_id, folder="docs")
+
+        assert (assets, total) == ([], 7)
+        cache.get.assert_awaited_once_with(str(tenant_id), "docs", None)
+        cache.set.assert_not_called()
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_assets_cache_miss_stores_total(
+        self, file_asset_service: FileAssetService, mock_db: AsyncMock, cache: AsyncMock
+    ) -> None:
+        tenant_id = uuid4()
+        cache.get.return_value = None
+        count_result = Mock()
+        count_result.scalar.return_value = 3
+        page_result = Mock()
+        page_result.scalars.return_value.all.return_value = []
+        mock_db.execute.side_effect = [count_result, page_result]
+
+        _, total = await file_asset_service.list_assets(
+            tenant_id, mime_type_prefix="image/"
+        )
+
+        assert total == 3
+        cache.set.assert_awaited_once_with(str(tenant_id), None, "image/", 3)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_soft_delete_invalidates_after_commit(
+        self, file_asset_service: FileAssetService, mock_db: AsyncMock, cache: AsyncMock
+    ) -> None:
+        tenant_id = uuid4()
+        asset = FileAsset(id=uuid4(), tenant_id=tenant_id, s3_key="k")
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = asset
+        mock_db.execute.return_value = mock_result
+
+        async def commit() -> None:
+            cache.invalidate_tenant.assert_not_called()
+
+        mock_db.commit.side_effect = commit
+
+        await file_asset_service.soft_delete(asset.id, tenant_id)
+
+        mock_db.commit.assert_awaited_once()
+        cache.invalidate_tenant.assert_awaited_once_with(str(tenant_id))
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rollback_skips_invalidation(
+        self, file_asset_service: FileAssetService, mock_db: AsyncMock, cache: AsyncMock
+    ) -> None:
+        tenant_id = uuid4()
+        asset = FileAsset(id=uuid4(), tenant_id=tenant_id, s3_key="k")
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = asset
+        mock_db.execute.return_value = mock_result
+        mock_db.commit.side_effect = RuntimeError("commit failed")
+
+        with pytest.raises(RuntimeError):
+            await file_asset_service.soft_delete(asset.id, tenant_id)
+
+        mock_db.rollback.assert_awaited_once()
+        cache.invalidate_tenant.assert_not_called()
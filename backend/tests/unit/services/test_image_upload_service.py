@@ -13,6 +13,9 @@ from fastapi import UploadFile
 
 from app.core.image_upload import ImageUploadError, ImageUploadService
 
+JPEG_HEAD = b"\xff\xd8\xff\xe0"
+PNG_HEAD = b"\x89PNG\r\n\x1a\n"
+
 
 class TestImageUploadServiceValidation:
     """Tests for file validation logic."""
@@ -20,7 +23,7 @@ class TestImageUploadServiceValidation:
     @pytest.fixture
     def service(self) -> ImageUploadService:
         """Create service with mocked S3."""
-        with patch("app.core.image_upload.S3Service") as mock_s3:
+        with patch("app.modules.media.upload_service.S3Service") as mock_s3:
             mock_s3.return_value.is_configured = True
             service = ImageUploadService()
             return service
@@ -128,7 +131,7 @@ class TestImageUploadServiceS3Key:
     @pytest.fixture
     def service(self) -> ImageUploadService:
         """Create service with mocked S3."""
-        with patch("app.core.image_upload.S3Service"):
+        with patch("app.modules.media.upload_service.S3Service"):
             return ImageUploadService()
 
     def test_generate_s3_key_jpeg(self, service: ImageUploadService):
@@ -143,7 +146,8 @@ class TestImageUploadServiceS3Key:
             content_type="image/jpeg",
         )
 
-        assert key == f"{tenant_id}/articles/{entity_id}.jpg"
+        assert key.startswith(f"{tenant_id}/articles/{entity_id}_")
+        assert key.endswith(".jpg")
 
     def test_generate_s3_key_png(self, service: ImageUploadService):
         """Test S3 key generation for PNG."""
@@ -157,7 +161,8 @@ class TestImageUploadServiceS3Key:
             content_type="image/png",
         )
 
-        assert key == f"{tenant_id}/employees/{entity_id}.png"
+        assert key.startswith(f"{tenant_id}/employees/{entity_id}_")
+        assert key.endswith(".png")
 
     def test_generate_s3_key_webp(self, service: ImageUploadService):
         """Test S3 key generation for WebP."""
@@ -171,7 +176,8 @@ class TestImageUploadServiceS3Key:
             content_type="image/webp",
         )
 
-        assert key == f"{tenant_id}/cases/{entity_id}.webp"
+        assert key.startswith(f"{tenant_id}/cases/{entity_id}_")
+        assert key.endswith(".webp")
 
     def test_generate_s3_key_gif(self, service: ImageUploadService):
         """Test S3 key generation for GIF."""
@@ -185,7 +191,8 @@ class TestImageUploadServiceS3Key:
             content_type="image/gif",
         )
 
-        assert key == f"{tenant_id}/reviews/{entity_id}.gif"
+        assert key.startswith(f"{tenant_id}/reviews/{entity_id}_")
+        assert key.endswith(".gif")
 
     def test_generate_s3_key_unknown_type_defaults_to_jpg(self, service: ImageUploadService):
         """Test S3 key defaults to .jpg for unknown type."""
@@ -208,7 +215,7 @@ class TestImageUploadServiceExtractKey:
     @pytest.fixture
     def service(self) -> ImageUploadService:
         """Create service with mocked S3."""
-        with patch("app.core.image_upload.S3Service"):
+        with patch("app.modules.media.upload_service.S3Service"):
             return ImageUploadService()
 
     def test_extract_key_from_empty_url(self, service: ImageUploadService):
@@ -216,7 +223,7 @@ class TestImageUploadServiceExtractKey:
         assert service._extract_s3_key_from_url("") is None
         assert service._extract_s3_key_from_url(None) is None
 
-    @patch("app.core.image_upload.settings")
+    @patch("app.modules.media.upload_service.settings")
     def test_extract_key_from_custom_endpoint_url(
         self, mock_settings, service: ImageUploadService
     ):
@@ -230,7 +237,7 @@ class TestImageUploadServiceExtractKey:
 
         assert key == "tenant-123/articles/image-456.jpg"
 
-    @patch("app.core.image_upload.settings")
+    @patch("app.modules.media.upload_service.settings")
     def test_extract_key_from_aws_url(
         self, mock_settings, service: ImageUploadService
     ):
@@ -258,7 +265,7 @@ class TestImageUploadServiceExtractKey:
 
         assert key == "abc-123/employees/photos/headshot.png"
 
-    @patch("app.core.image_upload.settings")
+    @patch("app.modules.media.upload_service.settings")
     def test_extract_key_from_unrecognized_url(
         self, mock_settings, service: ImageUploadService
     ):
@@ -288,7 +295,7 @@ class TestImageUploadServiceUpload:
     @pytest.fixture
     def service(self, mock_s3_service) -> ImageUploadService:
         """Create service with mocked S3."""
-        with patch("app.core.image_upload.S3Service", return_value=mock_s3_service):
+        with patch("app.modules.media.upload_service.S3Service", return_value=mock_s3_service):
             return ImageUploadService()
 
     @pytest.mark.asyncio
@@ -296,12 +303,12 @@ class TestImageUploadServiceUpload:
         """Test successful image upload."""
         tenant_id = uuid4()
         entity_id = uuid4()
-        file_content = b"fake image content"
+        file_content = JPEG_HEAD + b"fake image content"
 
         mock_file = MagicMock(spec=UploadFile)
         mock_file.content_type = "image/jpeg"
         mock_file.size = len(file_content)
-        mock_file.read = AsyncMock(return_value=file_content)
+        mock_file.read = AsyncMock(side_effect=[file_content, b""])
 
         service.s3 = mock_s3_service
 
@@ -328,13 +335,13 @@ class TestImageUploadServiceUpload:
         """Test that upload deletes old image when provided."""
         tenant_id = uuid4()
         entity_id = uuid4()
-        file_content = b"new image content"
+        file_content = JPEG_HEAD + b"new image content"
         old_url = "https://s3.example.com/bucket/old-image.jpg"
 
         mock_file = MagicMock(spec=UploadFile)
         mock_file.content_type = "image/jpeg"
         mock_file.size = len(file_content)
-        mock_file.read = AsyncMock(return_value=file_content)
+        mock_file.read = AsyncMock(side_effect=[file_content, b""])
 
         service.s3 = mock_s3_service
 
@@ -352,6 +359,38 @@ class TestImageUploadServiceUpload:
         # Verify old image was deleted
         mock_s3_service.delete_object.assert_called_once_with("old-key.jpg")
 
+    @pytest.mark.asyncio
+    async def test_upload_image_defers_old_image_delete(
+        self, service: ImageUploadService, mock_s3_service
+    ):
+        """Test that the old image delete is scheduled when background tasks are given."""
+        file_content = JPEG_HEAD + b"new image content"
+
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.content_type = "image/jpeg"
+        mock_file.size = len(file_content)
+        mock_file.read = AsyncMock(side_effect=[file_content, b""])
+
+        service.s3 = mock_s3_service
+        background_tasks = MagicMock()
+
+        with patch.object(
+            service, "_extract_s3_key_from_url", return_value="old-key.jpg"
+        ):
+            await service.upload_image(
+                file=mock_file,
+                tenant_id=uuid4(),
+                folder="users",
+                entity_id=uuid4(),
+                old_image_url="/media/old-key.jpg",
+                background_tasks=background_tasks,
+            )
+
+        mock_s3_service.delete_object.assert_not_called()
+        background_tasks.add_task.assert_called_once_with(
+            mock_s3_service.delete_object, "old-key.jpg"
+        )
+
     @pytest.mark.asyncio
     async def test_upload_image_rejects_large_file_after_read(
         self, service: ImageUploadService, mock_s3_service
@@ -365,7 +404,7 @@ class TestImageUploadServiceUpload:
         mock_file = MagicMock(spec=UploadFile)
         mock_file.content_type = "image/jpeg"
         mock_file.size = None  # Size unknown initially
-        mock_file.read = AsyncMock(return_value=file_content)
+        mock_file.read = AsyncMock(side_effect=[file_content, b""])
 
         service.s3 = mock_s3_service
 
@@ -379,6 +418,82 @@ class TestImageUploadServiceUpload:
 
         assert "File too large" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_upload_image_rejects_spoofed_content_type(
+        self, service: ImageUploadService, mock_s3_service
+    ):
+        """Test that content not matching the declared type never reaches S3."""
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.content_type = "image/png"
+        mock_file.size = 20
+        mock_file.read = AsyncMock(side_effect=[b"<html>not an image</html>", b""])
+
+        service.s3 = mock_s3_service
+
+        with pytest.raises(ImageUploadError) as exc_info:
+            await service.upload_image(
+                file=mock_file,
+                tenant_id=uuid4(),
+                folder="articles",
+                entity_id=uuid4(),
+            )
+
+        assert "does not match" in str(exc_info.value.detail)
+        mock_s3_service.client.put_object.assert_not_called()
+        mock_s3_service.client.create_multipart_upload.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("content_type", "head"),
+        [
+            ("image/jpeg", JPEG_HEAD),
+            ("image/png", PNG_HEAD),
+            ("image/gif", b"GIF89a"),
+            ("image/webp", b"RIFF\x10\x00\x00\x00WEBPVP8 "),
+        ],
+    )
+    def test_has_signature_accepts_allowed_types(
+        self, service: ImageUploadService, content_type: str, head: bytes
+    ):
+        assert service._has_signature(content_type, head + b"rest")
+
+    def test_has_signature_rejects_riff_that_is_not_webp(
+        self, service: ImageUploadService
+    ):
+        assert not service._has_signature("image/webp", b"RIFF\x10\x00\x00\x00WAVEfmt ")
+
+    @pytest.mark.asyncio
+    async def test_upload_image_uses_multipart_for_large_file(
+        self, service: ImageUploadService, mock_s3_service
+    ):
+        """Test that files larger than one part are streamed as a multipart upload."""
+        part = PNG_HEAD + b"x" * (service.PART_SIZE - len(PNG_HEAD))
+
+        mock_file = MagicMock(spec=UploadFile)
+        mock_file.content_type = "image/png"
+        mock_file.size = None
+        mock_file.read = AsyncMock(side_effect=[part, b"tail", b""])
+
+        client = mock_s3_service.client
+        client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        client.upload_part.side_effect = [{"ETag": "e1"}, {"ETag": "e2"}]
+        service.s3 = mock_s3_service
+
+        await service.upload_image(
+            file=mock_file,
+            tenant_id=uuid4(),
+            folder="articles",
+            entity_id=uuid4(),
+        )
+
+        client.put_object.assert_not_called()
+        assert client.upload_part.call_count == 2
+        client.complete_multipart_upload.assert_called_once()
+        parts = client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert parts == [
+            {"ETag": "e1", "PartNumber": 1},
+            {"ETag": "e2", "PartNumber": 2},
+        ]
+
     @pytest.mark.asyncio
     async def test_upload_image_handles_s3_error(
         self, service: ImageUploadService, mock_s3_service
@@ -386,12 +501,12 @@ class TestImageUploadServiceUpload:
         """Test that upload handles S3 errors gracefully."""
         tenant_id = uuid4()
         entity_id = uuid4()
-        file_content = b"fake image content"
+        file_content = JPEG_HEAD + b"fake image content"
 
         mock_file = MagicMock(spec=UploadFile)
         mock_file.content_type = "image/jpeg"
         mock_file.size = len(file_content)
-        mock_file.read = AsyncMock(return_value=file_content)
+        mock_file.read = AsyncMock(side_effect=[file_content, b""])
 
         # Make S3 fail
         mock_s3_service.client.put_object.side_effect = Exception("S3 error")
@@ -421,7 +536,7 @@ class TestImageUploadServiceDelete:
     @pytest.fixture
     def service(self, mock_s3_service) -> ImageUploadService:
         """Create service with mocked S3."""
-        with patch("app.core.image_upload.S3Service", return_value=mock_s3_service):
+        with patch("app.modules.media.upload_service.S3Service", return_value=mock_s3_service):
             return ImageUploadService()
 
     @pytest.mark.asyncio
@@ -1,7 +1,8 @@
 """Unit tests for company PracticeAreaService."""
 
 from datetime import datetime, UTC
-from unittest.mock import AsyncMock, Mock
+import json
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -18,6 +19,7 @@ class TestPracticeAreaService:
     def mock_db(self) -> AsyncMock:
         """Create mock database session."""
         db = AsyncMock()
+        db.info = {}
         db.add = Mock()
         db.delete = AsyncMock()
         db.flush = AsyncMock()
@@ -134,6 +136,53 @@ class TestPracticeAreaService:
 
         assert len(practice_areas) == 1
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_paginated_reads_total_from_window_count(
+        self,
+        practice_area_service: PracticeAreaService,
+        mock_db: AsyncMock,
+        sample_practice_area: PracticeArea,
+    ) -> None:
+        """A page and its total should come from a single query."""
+        row = Mock()
+        row.__getitem__ = Mock(return_value=sample_practice_area)
+        row._total = 7
+        mock_result = Mock()
+        mock_result.all.return_value = [row]
+        mock_db.execute.return_value = mock_result
+
+        items, total = await practice_area_service.list_paginated(
+            sample_practice_area.tenant_id, page=2, page_size=5
+        )
+
+        assert items == [sample_practice_area]
+        assert total == 7
+        mock_db.execute.assert_awaited_once()
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "count(*) OVER ()" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_paginated_orders_with_unique_tiebreaker(
+        self,
+        practice_area_service: PracticeAreaService,
+        mock_db: AsyncMock,
+    ) -> None:
+        """Pages should be stable when many rows share the same sort_order."""
+        mock_result = Mock()
+        mock_result.all.return_value = []
+        mock_db.execute.return_value = mock_result
+
+        await practice_area_service.list_paginated(uuid4(), page=1, page_size=5)
+
+        sql = str(mock_db.execute.call_args.args[0])
+        assert (
+            "ORDER BY practice_areas.sort_order, "
+            "practice_areas.created_at DESC, practice_areas.id"
+        ) in sql
+
     # ========== list_published Tests ==========
 
     @pytest.mark.unit
@@ -174,6 +223,90 @@ class TestPracticeAreaService:
 
         assert practice_areas == []
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_published_json_cache_hit_skips_db(
+        self,
+        practice_area_service: PracticeAreaService,
+        mock_db: AsyncMock,
+    ) -> None:
+        """A cached payload is returned as-is without querying."""
+        cache = AsyncMock()
+        cache.get.return_value = "[]"
+
+        with patch(
+            "app.modules.company.services.practice_area_service.get_public_list_cache",
+            AsyncMock(return_value=cache),
+        ):
+            payload = await practice_area_service.list_published_json(uuid4(), "ru")
+
+        assert payload == "[]"
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_published_json_cache_miss_stores_payload(
+        self,
+        practice_area_service: PracticeAreaService,
+        mock_db: AsyncMock,
+        sample_practice_area: PracticeArea,
+    ) -> None:
+        """On a miss the serialized response is built and cached."""
+        mock_result = Mock()
+        mock_result.scalars.return_value.unique.return_value.all.return_value = [
+            sample_practice_area
+        ]
+        mock_db.execute.return_value = mock_result
+        cache = AsyncMock()
+        cache.get.return_value = None
+        tenant_id = sample_practice_area.tenant_id
+
+        with patch(
+            "app.modules.company.services.practice_area_service.get_public_list_cache",
+            AsyncMock(return_value=cache),
+        ):
+            payload = await practice_area_service.list_published_json(tenant_id, "ru")
+
+        items = json.loads(payload)
+        assert [item["slug"] for item in items] == ["fintech"]
+        cache.set.assert_awaited_once_with(
+            str(tenant_id), "practice_areas", "ru", payload
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_soft_delete_invalidates_public_cache(
+        self,
+        practice_area_service: PracticeAreaService,
+        mock_db: AsyncMock,
+        sample_practice_area: PracticeArea,
+    ) -> None:
+        """Writes drop the tenant's cached public list after the commit."""
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = sample_practice_area
+        mock_db.execute.return_value = mock_result
+        cache = AsyncMock()
+
+        async def commit() -> None:
+            # A reader re-caching between invalidation and COMMIT would
+            # store the old list
+            cache.invalidate.assert_not_called()
+
+        mock_db.commit.side_effect = commit
+
+        with patch(
+            "app.modules.company.services.practice_area_service.get_public_list_cache",
+            AsyncMock(return_value=cache),
+        ):
+            await practice_area_service.soft_delete(
+                sample_practice_area.id, sample_practice_area.tenant_id
+            )
+
+        mock_db.commit.assert_awaited_once()
+        cache.invalidate.assert_awaited_once_with(
+            str(sample_practice_area.tenant_id), "practice_areas"
+        )
+
     # ========== soft_delete Tests ==========
 
     @pytest.mark.unit
@@ -109,3 +109,38 @@ class TestTenantServiceUpdate:
             except Exception:
                 pass
             # Cache invalidation may or may not be directly called depending on impl
+
+
+class TestTenantDomainServiceRemove:
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock(spec=AsyncSession)
+        db.info = {}
+        db.delete = AsyncMock()
+        db.flush = AsyncMock()
+        db.commit = AsyncMock()
+        return db
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cors_invalidation_published_after_commit(self, mock_db):
+        """Other workers must not reload CORS origins before the delete commits."""
+        from app.modules.tenants.service import TenantDomainService
+
+        result_mock = Mock()
+        result_mock.scalar_one_or_none.return_value = Mock(domain="example.com")
+        mock_db.execute.return_value = result_mock
+        cors_cache = Mock(invalidate_all=AsyncMock())
+
+        async def commit():
+            cors_cache.invalidate_all.assert_not_called()
+
+        mock_db.commit.side_effect = commit
+
+        with patch("app.core.redis.get_domain_tenant_cache", AsyncMock(return_value=None)), \
+                patch("app.core.redis.get_cors_origins_cache", return_value=cors_cache):
+            await TenantDomainService(mock_db).remove_domain(uuid4())
+
+        mock_db.commit.assert_awaited_once()
+        cors_cache.invalidate_all.assert_awaited_once()
@@ -4,8 +4,10 @@ from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import AlreadyExistsError
 from app.core.security import hash_password
 
 
@@ -99,11 +101,32 @@ class TestUserServiceCreate:
             await user_service.create(uuid4(), data)
         except Exception:
             pass
-        # Check that the user added to db has force_password_change=True
-        if mock_db.add.called:
-            user = mock_db.add.call_args[0][0]
-            if hasattr(user, 'force_password_change'):
-                assert user.force_password_change is True
+        # The user is written by the INSERT ... ON CONFLICT statement
+        stmt = mock_db.execute.call_args_list[0][0][0]
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert params["force_password_change"] is True
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_duplicate_email_raises(self, user_service, mock_db):
+        """ON CONFLICT DO NOTHING returning no row means the email is taken."""
+        conflict_result = Mock()
+        conflict_result.scalar_one_or_none.return_value = None
+        mock_db.execute.return_value = conflict_result
+
+        from app.modules.auth.schemas import UserCreate
+        data = UserCreate(
+            email="taken@test.com",
+            password="TestPass123!",
+            first_name="Taken",
+            last_name="Email",
+            send_credentials=False,
+        )
+        with pytest.raises(AlreadyExistsError):
+            await user_service.create(uuid4(), data)
+
+        mock_db.execute.assert_called_once()
+        mock_db.rollback.assert_called_once()
 
 
 class TestUserServiceChangePassword:
@@ -149,3 +172,74 @@ class TestUserServiceChangePassword:
             pass
         # After change, force_password_change should be set to False
         # (depends on actual implementation path succeeding)
+
+
+class TestUserServiceClearAvatar:
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock(spec=AsyncSession)
+        db.commit = AsyncMock()
+        return db
+
+    @pytest.fixture
+    def user_service(self, mock_db):
+        from app.modules.auth.services import UserService
+        return UserService(mock_db)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_no_avatar_skips_write_and_commit(self, user_service, mock_db):
+        select_result = Mock()
+        select_result.one_or_none.return_value = Mock(avatar_url=None)
+        mock_db.execute.return_value = select_result
+
+        assert await user_service.clear_avatar_url(uuid4(), uuid4()) is None
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_existing_avatar_is_cleared(self, user_service, mock_db):
+        select_result = Mock()
+        select_result.one_or_none.return_value = Mock(avatar_url="/media/t/users/a.png")
+        mock_db.execute.side_effect = [select_result, Mock()]
+
+        old_url = await user_service.clear_avatar_url(uuid4(), uuid4())
+
+        assert old_url == "/media/t/users/a.png"
+        assert mock_db.execute.call_count == 2
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_missing_user_raises(self, user_service, mock_db):
+        from app.core.exceptions import NotFoundError
+
+        select_result = Mock()
+        select_result.one_or_none.return_value = None
+        mock_db.execute.return_value = select_result
+
+        with pytest.raises(NotFoundError):
+            await user_service.clear_avatar_url(uuid4(), uuid4())
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_loaded_user_is_cleared_without_select(self, user_service, mock_db):
+        user = Mock(id=uuid4(), avatar_url="/media/t/users/a.png")
+
+        old_url = await user_service.clear_loaded_avatar_url(user)
+
+        assert old_url == "/media/t/users/a.png"
+        mock_db.execute.assert_called_once()
+        assert "UPDATE admin_users" in str(mock_db.execute.call_args.args[0])
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_loaded_user_without_avatar_issues_no_query(self, user_service, mock_db):
+        user = Mock(id=uuid4(), avatar_url=None)
+
+        assert await user_service.clear_loaded_avatar_url(user) is None
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_not_called()
@@ -12,9 +12,12 @@ from app.core.security import (
     TokenPayload,
     create_access_token,
     create_refresh_token,
+    decode_refresh_token,
     decode_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -63,6 +66,16 @@ class TestPasswordHashing:
         hashed = hash_password("test")
         assert verify_password("", hashed) is False
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_helpers_round_trip(self) -> None:
+        """Threaded helpers should produce and verify regular bcrypt hashes."""
+        hashed = await hash_password_async("secure_password_123")
+
+        assert verify_password("secure_password_123", hashed) is True
+        assert await verify_password_async("secure_password_123", hashed) is True
+        assert await verify_password_async("wrong_password", hashed) is False
+
 
 class TestJWTTokens:
     """Tests for JWT token utilities."""
@@ -164,6 +177,43 @@ class TestJWTTokens:
             decode_token(tampered)
 
 
+class TestDecodeRefreshToken:
+    """Tests for the cached refresh-token decoder."""
+
+    @pytest.mark.unit
+    def test_repeat_decode_skips_verification(self, monkeypatch) -> None:
+        """A recently verified refresh token should not be re-verified."""
+        from app.core import security
+
+        token = create_refresh_token({"sub": str(uuid4()), "tenant_id": str(uuid4())})
+        first = decode_refresh_token(token)
+
+        def fail(_token):
+            raise AssertionError("decode_token should not be called")
+
+        monkeypatch.setattr(security, "decode_token", fail)
+        assert decode_refresh_token(token) is first
+
+    @pytest.mark.unit
+    def test_short_lived_token_not_cached(self) -> None:
+        """Tokens expiring within the cache TTL should always be verified."""
+        from app.core import security
+
+        token = create_refresh_token(
+            {"sub": str(uuid4()), "tenant_id": str(uuid4())},
+            expires_delta=timedelta(seconds=5),
+        )
+        decode_refresh_token(token)
+
+        assert token not in security._refresh_token_cache
+
+    @pytest.mark.unit
+    def test_invalid_token_raises(self) -> None:
+        """Invalid tokens should raise exactly like decode_token."""
+        with pytest.raises(InvalidTokenError):
+            decode_refresh_token("not-a-token")
+
+
 class TestTokenPayload:
     """Tests for TokenPayload class."""
 
@@ -172,6 +222,7 @@ class TestTokenPayload:
         """TokenPayload should correctly parse JWT payload."""
         user_id = uuid4()
         tenant_id = uuid4()
+        role_id = uuid4()
         now = datetime.utcnow()
 
         payload_dict = {
@@ -179,6 +230,7 @@ class TestTokenPayload:
             "tenant_id": str(tenant_id),
             "email": "test@example.com",
             "role": "admin",
+            "role_id": str(role_id),
             "permissions": ["articles:read", "articles:write"],
             "is_superuser": True,
             "type": "access",
@@ -191,6 +243,7 @@ class TestTokenPayload:
         assert payload.tenant_id == tenant_id
         assert payload.email == "test@example.com"
         assert payload.role == "admin"
+        assert payload.role_id == role_id
         assert payload.permissions == ["articles:read", "articles:write"]
         assert payload.is_superuser is True
         assert payload.token_type == "access"
@@ -211,6 +264,7 @@ class TestTokenPayload:
         payload = TokenPayload(payload_dict)
 
         assert payload.role is None
+        assert payload.role_id is None
         assert payload.permissions == []
         assert payload.is_superuser is False
         assert payload.token_type == "access"